@@ -1,5 +1,6 @@
 """DSP utilities: envelopes, z-scores, windows, spectral features."""
 
+from functools import lru_cache
 from typing import cast
 
 import numpy as np
@@ -173,6 +174,15 @@ def hanning_window(size: int) -> np.ndarray:
     return np.hanning(size)
 
 
+@lru_cache(maxsize=64)
+def _design_butter_sos(order: int, wn: float | tuple[float, float], btype: str) -> np.ndarray:
+    """Return (cached) Butterworth second-order sections for a normalized cutoff.
+
+    The returned array is shared between callers and must not be modified in place.
+    """
+    return cast(np.ndarray, signal.butter(order, wn, btype=btype, output="sos"))
+
+
 def bandpass_filter(
     audio: np.ndarray,
     sample_rate: int,
@@ -248,7 +258,7 @@ def bandpass_filter(
     working = data.astype(np.float64, copy=False)
     axis = 0
 
-    sos = signal.butter(order, wn, btype=btype, output="sos")
+    sos = _design_butter_sos(order, wn, btype)
     filtered = cast(npt.NDArray[np.float64], signal.sosfiltfilt(sos, working, axis=axis))
 
     if np.issubdtype(data.dtype, np.floating):
@@ -94,6 +94,7 @@ def export_sample(
     bandpass_low_hz: float | None = None,
     bandpass_high_hz: float | None = None,
     metadata: dict[str, Any] | None = None,
+    source_duration: float | None = None,
 ) -> None:
     """Export a single sample segment.
 
@@ -103,12 +104,15 @@ def export_sample(
         segment: Segment to export.
         pre_pad_ms: Padding before segment start (milliseconds).
         post_pad_ms: Padding after segment end (milliseconds).
+        source_duration: Duration of ``input_path`` in seconds, if the caller already
+            knows it. When omitted the source is probed with ffprobe.
 
     Raises:
         ValueError: If calculated times are invalid.
     """
-    info = get_audio_info(input_path)
-    total_dur = float(info.get("duration", 0.0))
+    if source_duration is None:
+        source_duration = get_audio_info(input_path).get("duration", 0.0)
+    total_dur = float(source_duration)
     start_padded = max(0.0, segment.start - (pre_pad_ms / 1000.0))
     end_padded = min(total_dur, segment.end + (post_pad_ms / 1000.0))
     logging.debug(f"Exporting sample: {start_padded:.3f}s-{end_padded:.3f}s -> {output_path}")
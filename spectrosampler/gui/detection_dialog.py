@@ -1,9 +1,11 @@
 """Detection settings dialog for processing parameters."""
 
 import logging
+import os
+from dataclasses import dataclass
 from typing import Any
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QSignalBlocker, Qt, QTimer, Slot
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -27,6 +29,22 @@ from spectrosampler.pipeline_settings import ProcessingSettings
 
 logger = logging.getLogger(__name__)
 
+# Default CPU worker count (available threads minus one), resolved once per process.
+try:
+    _DEFAULT_WORKERS = max(1, (os.cpu_count() or 4) - 1)
+except (AttributeError, OSError, ValueError) as exc:
+    logger.warning("Falling back to default worker count: %s", exc, exc_info=exc)
+    _DEFAULT_WORKERS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class _SliderSpin:
+    """Linked slider/spinbox pair and the widget that lays them out."""
+
+    slider: QSlider
+    spinbox: QSpinBox
+    widget: QWidget
+
 
 class DetectionDialog(QDialog):
     """Detection settings dialog."""
@@ -36,7 +54,10 @@ class DetectionDialog(QDialog):
         "discard_duplicates": "Discard Duplicates",
         "keep_all": "Keep All",
     }
+    _BEHAVIOR_LABELS: tuple[str, ...] = tuple(_BEHAVIOR_TO_LABEL.values())
     _LABEL_TO_BEHAVIOR = {label: key for key, label in _BEHAVIOR_TO_LABEL.items()}
+    # Bound dict.get (a builtin, so it is not rebound through self) for the combo slot.
+    _resolve_behavior = _LABEL_TO_BEHAVIOR.get
 
     def __init__(
         self, parent: QWidget | None = None, initial_settings: ProcessingSettings | None = None
@@ -69,11 +90,14 @@ class DetectionDialog(QDialog):
         self._settings.overlap_default_behavior = (
             behavior_pref if behavior_pref in self._BEHAVIOR_TO_LABEL else "discard_duplicates"
         )
+        # Last max-sample value written to the settings manager; skips redundant writes.
+        self._last_persisted_max_samples: int | None = None
         try:
             # Restore the persisted max-sample cap so the UI starts with the last chosen value.
             self._settings.max_samples = self._settings_manager.get_detection_max_samples(
                 int(self._settings.max_samples)
             )
+            self._last_persisted_max_samples = self._settings.max_samples
         except (TypeError, ValueError) as exc:
             logger.debug("Falling back to default max samples: %s", exc, exc_info=exc)
 
@@ -82,6 +106,14 @@ class DetectionDialog(QDialog):
             snapshot = initial_settings.to_dict()
             self._settings = ProcessingSettings.from_dict(snapshot)
 
+        # Validation is debounced so a slider drag re-validates once it settles instead of
+        # on every tick; the last validated snapshot lets no-op refreshes return early.
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(50)
+        self._validate_timer.timeout.connect(self._refresh_validation_state)
+        self._last_validated_key: tuple[Any, ...] | None = None
+
         # Create main layout
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(12, 12, 12, 12)
@@ -120,6 +152,19 @@ class DetectionDialog(QDialog):
         timing_group = self._create_timing_group()
         right_column.addWidget(timing_group)
 
+        # Route every plain float slider through one slot keyed by the emitting slider.
+        self._slider_field_map: dict[QObject, str] = {
+            self._detection_pre_pad_slider.slider: "detection_pre_pad_ms",
+            self._detection_post_pad_slider.slider: "detection_post_pad_ms",
+            self._merge_gap_slider.slider: "merge_gap_ms",
+            self._min_dur_slider.slider: "min_dur_ms",
+            self._max_dur_slider.slider: "max_dur_ms",
+            self._min_gap_slider.slider: "min_gap_ms",
+            self._hp_slider.slider: "hp",
+            self._lp_slider.slider: "lp",
+            self._nr_slider.slider: "nr",
+        }
+
         right_column.addStretch()
 
         # Add columns to content layout
@@ -136,6 +181,13 @@ class DetectionDialog(QDialog):
 
         main_layout.addWidget(scroll)
 
+        # Validation label (initially hidden), placed directly above the buttons
+        self._validation_label = QLabel()
+        self._validation_label.setWordWrap(True)
+        self._validation_label.setStyleSheet("color: #d64545; font-size: 12px;")
+        self._validation_label.setVisible(False)
+        main_layout.addWidget(self._validation_label)
+
         # Button box at bottom right
         button_box = QDialogButtonBox()
         self._cancel_button = button_box.addButton(QDialogButtonBox.StandardButton.Cancel)
@@ -150,23 +202,11 @@ class DetectionDialog(QDialog):
 
         self.setLayout(main_layout)
 
-        # Validation label (initially hidden)
-        self._validation_label = QLabel()
-        self._validation_label.setWordWrap(True)
-        self._validation_label.setStyleSheet("color: #d64545; font-size: 12px;")
-        self._validation_label.setVisible(False)
-        main_layout.insertWidget(main_layout.count() - 1, self._validation_label)
-
         self._refresh_validation_state()
 
-        # Apply dropdown arrow styling to all QComboBox widgets
-        from spectrosampler.gui.ui_utils import (
-            apply_checkbox_styling_to_all_checkboxes,
-            apply_combo_styling_to_all_combos,
-        )
-
-        apply_combo_styling_to_all_combos(self)
-        apply_checkbox_styling_to_all_checkboxes(self)
+        # Style combos and checkboxes on the next event-loop pass so the tree walk and
+        # stylesheet parsing stay off the construction path.
+        QTimer.singleShot(0, self._apply_deferred_styling)
 
         # Apply settings to UI controls (either from initial_settings or persisted)
         if initial_settings:
@@ -176,6 +216,13 @@ class DetectionDialog(QDialog):
             # Load and apply persisted settings
             self._load_persisted_settings()
 
+    @Slot()
+    def _apply_deferred_styling(self) -> None:
+        """Apply dropdown arrow and checkbox styling to all child widgets."""
+        from spectrosampler.gui.ui_utils import apply_dialog_control_styling
+
+        apply_dialog_control_styling(self)
+
     def _create_detection_group(self) -> QGroupBox:
         """Create detection mode group.
 
@@ -203,22 +250,9 @@ class DetectionDialog(QDialog):
         # CPU workers for background processing
         self._workers_spin = QSpinBox()
         self._workers_spin.setRange(1, 64)
-        try:
-            import os
-
-            default_workers = max(1, (os.cpu_count() or 4) - 1)
-        except (ImportError, AttributeError, OSError, ValueError) as exc:
-            logger.warning("Falling back to default worker count: %s", exc, exc_info=exc)
-            default_workers = 3
         # If settings already has max_workers, honor it
-        existing_workers = getattr(self._settings, "max_workers", None)
-        self._workers_spin.setValue(int(existing_workers or default_workers))
-
-        def _on_workers_changed(v: int) -> None:
-            self._settings.max_workers = int(v)
-            self._on_settings_changed()
-
-        self._workers_spin.valueChanged.connect(_on_workers_changed)
+        self._workers_spin.setValue(int(self._settings.max_workers or _DEFAULT_WORKERS))
+        self._workers_spin.valueChanged.connect(self._on_workers_changed)
         layout.addRow("CPU workers:", self._workers_spin)
 
         group.setLayout(layout)
@@ -231,25 +265,13 @@ class DetectionDialog(QDialog):
 
         # Show overlap dialog checkbox
         self._show_overlap_dialog_checkbox = QCheckBox()
-
-        def _on_show_overlap_changed(state: int) -> None:
-            self.set_overlap_preferences(
-                self._show_overlap_dialog_checkbox.isChecked(),
-                self._settings.overlap_default_behavior,
-            )
-
-        self._show_overlap_dialog_checkbox.stateChanged.connect(_on_show_overlap_changed)
+        self._show_overlap_dialog_checkbox.stateChanged.connect(self._on_show_overlap_changed)
         layout.addRow("Show overlap dialog:", self._show_overlap_dialog_checkbox)
 
         # Default behavior dropdown
         self._overlap_behavior_combo = QComboBox()
-        self._overlap_behavior_combo.addItems(self._BEHAVIOR_TO_LABEL.values())
-
-        def _on_behavior_changed(text: str) -> None:
-            key = self._LABEL_TO_BEHAVIOR.get(text, "discard_duplicates")
-            self.set_overlap_preferences(self._settings.show_overlap_dialog, key)
-
-        self._overlap_behavior_combo.currentTextChanged.connect(_on_behavior_changed)
+        self._overlap_behavior_combo.addItems(self._BEHAVIOR_LABELS)
+        self._overlap_behavior_combo.currentTextChanged.connect(self._on_behavior_changed)
         layout.addRow("Default behavior:", self._overlap_behavior_combo)
 
         # Apply initial preferences without re-emitting signals or persisting redundantly.
@@ -276,60 +298,60 @@ class DetectionDialog(QDialog):
         self._detection_pre_pad_slider = self._create_slider_spin(
             0, 50000, int(self._settings.detection_pre_pad_ms), "ms"
         )
-        self._detection_pre_pad_slider["slider"].valueChanged.connect(
-            self._on_detection_pre_pad_changed
-        )
-        layout.addRow("Detection Pre-padding:", self._detection_pre_pad_slider["widget"])
+        self._detection_pre_pad_slider.slider.valueChanged.connect(self._on_field_slider_changed)
+        layout.addRow("Detection Pre-padding:", self._detection_pre_pad_slider.widget)
 
         # Detection Post-padding
         self._detection_post_pad_slider = self._create_slider_spin(
             0, 50000, int(self._settings.detection_post_pad_ms), "ms"
         )
-        self._detection_post_pad_slider["slider"].valueChanged.connect(
-            self._on_detection_post_pad_changed
-        )
-        layout.addRow("Detection Post-padding:", self._detection_post_pad_slider["widget"])
+        self._detection_post_pad_slider.slider.valueChanged.connect(self._on_field_slider_changed)
+        layout.addRow("Detection Post-padding:", self._detection_post_pad_slider.widget)
 
         # Merge gap
         self._merge_gap_slider = self._create_slider_spin(
             0, 1000, int(self._settings.merge_gap_ms), "ms"
         )
-        self._merge_gap_slider["slider"].valueChanged.connect(self._on_merge_gap_changed)
-        layout.addRow("Merge gap:", self._merge_gap_slider["widget"])
+        self._merge_gap_slider.slider.valueChanged.connect(self._on_field_slider_changed)
+        layout.addRow("Merge gap:", self._merge_gap_slider.widget)
 
         # Min duration
         self._min_dur_slider = self._create_slider_spin(
             0, 5000, int(self._settings.min_dur_ms), "ms"
         )
-        self._min_dur_slider["slider"].valueChanged.connect(self._on_min_dur_changed)
-        layout.addRow("Min duration:", self._min_dur_slider["widget"])
+        self._min_dur_slider.slider.valueChanged.connect(self._on_field_slider_changed)
+        layout.addRow("Min duration:", self._min_dur_slider.widget)
 
         # Max duration
         self._max_dur_slider = self._create_slider_spin(
             0, 120000, int(self._settings.max_dur_ms), "ms"
         )
-        self._max_dur_slider["slider"].valueChanged.connect(self._on_max_dur_changed)
-        layout.addRow("Max duration:", self._max_dur_slider["widget"])
+        self._max_dur_slider.slider.valueChanged.connect(self._on_field_slider_changed)
+        layout.addRow("Max duration:", self._max_dur_slider.widget)
 
         # Min gap
         self._min_gap_slider = self._create_slider_spin(
             0, 60000, int(self._settings.min_gap_ms), "ms"
         )
-        self._min_gap_slider["slider"].valueChanged.connect(self._on_min_gap_changed)
-        layout.addRow("Min gap:", self._min_gap_slider["widget"])
+        self._min_gap_slider.slider.valueChanged.connect(self._on_field_slider_changed)
+        layout.addRow("Min gap:", self._min_gap_slider.widget)
 
         # Max samples
         self._max_samples_slider = self._create_slider_spin(
             1, 10_000, int(self._settings.max_samples), ""
         )
-        self._max_samples_slider["slider"].valueChanged.connect(self._on_max_samples_changed)
+        self._max_samples_slider.slider.valueChanged.connect(self._on_max_samples_changed)
+        # Changes only update memory; the value is persisted once when a drag is released
+        # or a typed spinbox value is finished, not on every intermediate step.
+        self._max_samples_slider.slider.sliderReleased.connect(self._on_max_samples_committed)
+        self._max_samples_slider.spinbox.editingFinished.connect(self._on_max_samples_committed)
         # Ensure the controls reflect the clamped, restored value without emitting changes.
         self._set_max_samples_ui_value(self._settings.max_samples, persist=False)
-        layout.addRow("Max samples:", self._max_samples_slider["widget"])
+        layout.addRow("Max samples:", self._max_samples_slider.widget)
 
         # Sample spread
         self._sample_spread_checkbox = QCheckBox()
-        self._sample_spread_checkbox.setChecked(getattr(self._settings, "sample_spread", True))
+        self._sample_spread_checkbox.setChecked(self._settings.sample_spread)
         self._sample_spread_checkbox.stateChanged.connect(self._on_sample_spread_changed)
         layout.addRow("Sample spread:", self._sample_spread_checkbox)
 
@@ -337,7 +359,7 @@ class DetectionDialog(QDialog):
         self._sample_spread_mode_combo = QComboBox()
         self._sample_spread_mode_combo.addItems(["Strict", "Closest"])
         # Map settings value to combo box: "strict" -> "Strict", "closest" -> "Closest"
-        mode_value = getattr(self._settings, "sample_spread_mode", "strict")
+        mode_value = self._settings.sample_spread_mode
         mode_display = mode_value.capitalize() if mode_value else "Strict"
         self._sample_spread_mode_combo.setCurrentText(mode_display)
         self._sample_spread_mode_combo.currentTextChanged.connect(
@@ -366,23 +388,23 @@ class DetectionDialog(QDialog):
 
         # High-pass filter
         self._hp_slider = self._create_slider_spin(0, 20000, int(self._settings.hp or 20), "Hz")
-        self._hp_slider["slider"].valueChanged.connect(self._on_hp_changed)
-        layout.addRow("High-pass:", self._hp_slider["widget"])
+        self._hp_slider.slider.valueChanged.connect(self._on_field_slider_changed)
+        layout.addRow("High-pass:", self._hp_slider.widget)
 
         # Low-pass filter
         self._lp_slider = self._create_slider_spin(0, 20000, int(self._settings.lp or 20000), "Hz")
-        self._lp_slider["slider"].valueChanged.connect(self._on_lp_changed)
-        layout.addRow("Low-pass:", self._lp_slider["widget"])
+        self._lp_slider.slider.valueChanged.connect(self._on_field_slider_changed)
+        layout.addRow("Low-pass:", self._lp_slider.widget)
 
         # Noise reduction
         self._nr_slider = self._create_slider_spin(0, 24, int(self._settings.nr), "")
-        self._nr_slider["slider"].valueChanged.connect(self._on_nr_changed)
-        layout.addRow("Noise reduction:", self._nr_slider["widget"])
+        self._nr_slider.slider.valueChanged.connect(self._on_field_slider_changed)
+        layout.addRow("Noise reduction:", self._nr_slider.widget)
 
         group.setLayout(layout)
         return group
 
-    def _create_slider_spin(self, min_val: int, max_val: int, value: int, unit: str) -> dict:
+    def _create_slider_spin(self, min_val: int, max_val: int, value: int, unit: str) -> _SliderSpin:
         """Create slider with spinbox.
 
         Args:
@@ -392,7 +414,7 @@ class DetectionDialog(QDialog):
             unit: Unit string.
 
         Returns:
-            Dictionary with 'slider', 'spinbox', and 'widget' keys.
+            _SliderSpin holding the slider, spinbox, and container widget.
         """
         widget = QWidget()
         layout = QVBoxLayout()
@@ -407,8 +429,14 @@ class DetectionDialog(QDialog):
         spinbox.setValue(value)
         spinbox.setSuffix(f" {unit}")
 
-        # Connect slider and spinbox
-        slider.valueChanged.connect(spinbox.setValue)
+        # Connect slider and spinbox. Change handlers listen on the slider, so the slider
+        # mirrors into the spinbox with its signals blocked (no echo back to the slider),
+        # while spinbox edits still flow through the slider's valueChanged.
+        def _sync_spinbox(slider_value: int) -> None:
+            with QSignalBlocker(spinbox):
+                spinbox.setValue(slider_value)
+
+        slider.valueChanged.connect(_sync_spinbox)
         spinbox.valueChanged.connect(slider.setValue)
 
         layout.addWidget(slider)
@@ -416,8 +444,9 @@ class DetectionDialog(QDialog):
 
         widget.setLayout(layout)
 
-        return {"slider": slider, "spinbox": spinbox, "widget": widget}
+        return _SliderSpin(slider=slider, spinbox=spinbox, widget=widget)
 
+    @Slot(str)
     def _on_mode_changed(self, mode: str) -> None:
         """Handle mode change."""
         self._settings.mode = mode
@@ -425,83 +454,74 @@ class DetectionDialog(QDialog):
 
     def _on_settings_changed(self) -> None:
         """Handle settings change."""
-        self._refresh_validation_state()
+        self._validate_timer.start()
 
+    @Slot(float)
     def _on_threshold_changed(self, value: float) -> None:
         """Handle threshold percentile change."""
         self._settings.threshold = float(value)
         self._on_settings_changed()
 
-    def _on_detection_pre_pad_changed(self, value: int) -> None:
-        """Handle detection pre-padding change."""
-        self._settings.detection_pre_pad_ms = float(value)
-        self._on_settings_changed()
-
-    def _on_detection_post_pad_changed(self, value: int) -> None:
-        """Handle detection post-padding change."""
-        self._settings.detection_post_pad_ms = float(value)
+    @Slot(int)
+    def _on_workers_changed(self, value: int) -> None:
+        """Handle CPU worker count change."""
+        self._settings.max_workers = int(value)
         self._on_settings_changed()
 
-    def _on_merge_gap_changed(self, value: int) -> None:
-        """Handle merge gap change."""
-        self._settings.merge_gap_ms = float(value)
-        self._on_settings_changed()
-
-    def _on_min_dur_changed(self, value: int) -> None:
-        """Handle min duration change."""
-        self._settings.min_dur_ms = float(value)
-        self._on_settings_changed()
-
-    def _on_max_dur_changed(self, value: int) -> None:
-        """Handle max duration change."""
-        self._settings.max_dur_ms = float(value)
-        self._on_settings_changed()
+    @Slot(int)
+    def _on_show_overlap_changed(self, state: int) -> None:
+        """Handle show-overlap-dialog toggle change."""
+        self.set_overlap_preferences(
+            self._show_overlap_dialog_checkbox.isChecked(),
+            self._settings.overlap_default_behavior,
+        )
 
-    def _on_min_gap_changed(self, value: int) -> None:
-        """Handle min gap change."""
-        self._settings.min_gap_ms = float(value)
+    @Slot(str)
+    def _on_behavior_changed(self, text: str) -> None:
+        """Handle default overlap behavior change."""
+        key = self._resolve_behavior(text, "discard_duplicates")
+        self.set_overlap_preferences(self._settings.show_overlap_dialog, key)
+
+    @Slot(int)
+    def _on_field_slider_changed(self, value: int) -> None:
+        """Store a slider value on the settings field mapped to the emitting slider."""
+        field = self._slider_field_map.get(self.sender())
+        if field is None:
+            return
+        setattr(self._settings, field, float(value))
         self._on_settings_changed()
 
+    @Slot(int)
     def _on_max_samples_changed(self, value: int) -> None:
         """Handle max samples change."""
         self._settings.max_samples = int(value)
-        try:
-            self._settings_manager.set_detection_max_samples(value)
-        except (TypeError, ValueError, RuntimeError) as exc:
-            logger.debug("Unable to persist max samples %s: %s", value, exc, exc_info=exc)
         self._on_settings_changed()
 
+    @Slot()
+    def _on_max_samples_committed(self) -> None:
+        """Persist the max-sample value once a slider drag or spinbox edit is finished."""
+        self._persist_max_samples(self._max_samples_slider.slider.value())
+
+    @Slot(int)
     def _on_sample_spread_changed(self, state: int) -> None:
         """Handle sample spread toggle change."""
         self._settings.sample_spread = self._sample_spread_checkbox.isChecked()
         self._on_settings_changed()
 
+    @Slot(str)
     def _on_sample_spread_mode_changed(self, mode: str) -> None:
         """Handle sample spread mode change."""
         # Convert display text to lowercase for settings
         self._settings.sample_spread_mode = mode.lower()
         self._on_settings_changed()
 
+    @Slot(str)
     def _on_denoise_changed(self, method: str) -> None:
         """Handle denoise method change."""
         self._settings.denoise = method
         self._on_settings_changed()
 
-    def _on_hp_changed(self, value: int) -> None:
-        """Handle high-pass filter change."""
-        self._settings.hp = float(value)
-        self._on_settings_changed()
-
-    def _on_lp_changed(self, value: int) -> None:
-        """Handle low-pass filter change."""
-        self._settings.lp = float(value)
-        self._on_settings_changed()
-
-    def _on_nr_changed(self, value: int) -> None:
-        """Handle noise reduction change."""
-        self._settings.nr = float(value)
-        self._on_settings_changed()
-
+    @Slot()
     def _on_detect_clicked(self) -> None:
         """Handle detect button click - validate and accept if valid."""
         errors = self.get_validation_errors()
@@ -534,20 +554,38 @@ class DetectionDialog(QDialog):
         snapshot = settings.to_dict()
         self._settings = ProcessingSettings.from_dict(snapshot)
 
-        def _set_slider_pair(pair: dict[str, Any], value: float) -> None:
-            slider = pair["slider"]
-            spinbox = pair["spinbox"]
-            slider.blockSignals(True)
-            spinbox.blockSignals(True)
-            slider.setValue(int(value))
-            spinbox.setValue(int(value))
-            slider.blockSignals(False)
-            spinbox.blockSignals(False)
+        slider_pairs = (
+            self._detection_pre_pad_slider,
+            self._detection_post_pad_slider,
+            self._merge_gap_slider,
+            self._min_dur_slider,
+            self._max_dur_slider,
+            self._min_gap_slider,
+            self._max_samples_slider,
+            self._hp_slider,
+            self._lp_slider,
+            self._nr_slider,
+        )
+        widgets: list[QObject] = [
+            self._mode_combo,
+            self._threshold_spin,
+            self._workers_spin,
+            self._sample_spread_checkbox,
+            self._sample_spread_mode_combo,
+            self._denoise_combo,
+        ]
+        for pair in slider_pairs:
+            widgets.extend((pair.slider, pair.spinbox))
+        # One blocker per widget for the whole sync so no change handler or slider/spinbox
+        # sibling fires while the controls are being populated.
+        blockers = [QSignalBlocker(widget) for widget in widgets]
+
+        def _set_slider_pair(pair: _SliderSpin, value: float) -> None:
+            pair.slider.setValue(int(value))
+            pair.spinbox.setValue(int(value))
 
         # Mode
-        self._mode_combo.blockSignals(True)
         self._mode_combo.setCurrentText(self._settings.mode)
-        self._mode_combo.blockSignals(False)
 
         # Threshold
         threshold_value = self._settings.threshold
@@ -558,18 +596,14 @@ class DetectionDialog(QDialog):
                 threshold_numeric = 50.0
         else:
             threshold_numeric = float(threshold_value if threshold_value is not None else 50.0)
-        self._threshold_spin.blockSignals(True)
         self._threshold_spin.setValue(threshold_numeric)
-        self._threshold_spin.blockSignals(False)
         self._settings.threshold = (
             threshold_value if threshold_value is not None else threshold_numeric
         )
 
         # Worker count
-        self._workers_spin.blockSignals(True)
-        worker_value = max(1, int(getattr(self._settings, "max_workers", 1)))
+        worker_value = max(1, int(self._settings.max_workers or 1))
         self._workers_spin.setValue(worker_value)
-        self._workers_spin.blockSignals(False)
         self._settings.max_workers = worker_value
 
         # Timing sliders
@@ -582,26 +616,23 @@ class DetectionDialog(QDialog):
         self._set_max_samples_ui_value(self._settings.max_samples, persist=False)
 
         # Sample spread controls
-        self._sample_spread_checkbox.blockSignals(True)
         self._sample_spread_checkbox.setChecked(self._settings.sample_spread)
-        self._sample_spread_checkbox.blockSignals(False)
 
         spread_mode_display = (self._settings.sample_spread_mode or "strict").capitalize()
         if spread_mode_display not in {"Strict", "Closest"}:
             spread_mode_display = "Strict"
-        self._sample_spread_mode_combo.blockSignals(True)
         self._sample_spread_mode_combo.setCurrentText(spread_mode_display)
-        self._sample_spread_mode_combo.blockSignals(False)
         self._settings.sample_spread_mode = spread_mode_display.lower()
 
         # Audio processing controls
-        self._denoise_combo.blockSignals(True)
         self._denoise_combo.setCurrentText(self._settings.denoise)
-        self._denoise_combo.blockSignals(False)
         _set_slider_pair(self._hp_slider, self._settings.hp or 0.0)
         _set_slider_pair(self._lp_slider, self._settings.lp or 0.0)
         _set_slider_pair(self._nr_slider, self._settings.nr)
 
+        for blocker in blockers:
+            blocker.unblock()
+
         # Overlap dialog preferences
         self.set_overlap_preferences(
             self._settings.show_overlap_dialog,
@@ -628,25 +659,35 @@ class DetectionDialog(QDialog):
             self._settings_manager.set_detection_settings(self._settings)
         except (TypeError, ValueError, RuntimeError) as exc:
             logger.debug("Failed to persist detection settings: %s", exc, exc_info=exc)
+        # Slider keyboard steps end neither a drag nor a spinbox edit, so catch them here.
+        self._persist_max_samples(int(self._settings.max_samples))
 
     def _set_max_samples_ui_value(self, value: int, persist: bool) -> None:
         """Clamp, persist, and display the max-sample value without triggering signals."""
         clamped = max(1, min(10_000, int(value)))
-        slider = self._max_samples_slider["slider"]
-        spinbox = self._max_samples_slider["spinbox"]
-        # Block signals so we do not re-enter the change handler while syncing UI components.
-        slider.blockSignals(True)
-        spinbox.blockSignals(True)
-        slider.setValue(clamped)
-        spinbox.setValue(clamped)
-        slider.blockSignals(False)
-        spinbox.blockSignals(False)
+        slider = self._max_samples_slider.slider
+        spinbox = self._max_samples_slider.spinbox
+        # Skip the widget sync entirely when the controls already show this value.
+        if slider.value() != clamped or spinbox.value() != clamped:
+            # Block signals so we do not re-enter the change handler while syncing UI components.
+            # QSignalBlocker restores the previous state, so this nests inside apply_settings.
+            with QSignalBlocker(slider), QSignalBlocker(spinbox):
+                slider.setValue(clamped)
+                spinbox.setValue(clamped)
         self._settings.max_samples = clamped
         if persist:
-            try:
-                self._settings_manager.set_detection_max_samples(clamped)
-            except (TypeError, ValueError, RuntimeError) as exc:
-                logger.debug("Unable to persist max samples %s: %s", clamped, exc, exc_info=exc)
+            self._persist_max_samples(clamped)
+
+    def _persist_max_samples(self, value: int) -> None:
+        """Write the max-sample value to the settings manager if it differs from the last write."""
+        if value == self._last_persisted_max_samples:
+            return
+        try:
+            self._settings_manager.set_detection_max_samples(value)
+        except (TypeError, ValueError, RuntimeError) as exc:
+            logger.debug("Unable to persist max samples %s: %s", value, exc, exc_info=exc)
+            return
+        self._last_persisted_max_samples = value
 
     def set_overlap_preferences(
         self,
@@ -657,9 +698,12 @@ class DetectionDialog(QDialog):
         emit_signal: bool = True,
     ) -> None:
         """Update overlap dialog visibility and default behavior preferences."""
-        normalized_key = (
-            behavior_key if behavior_key in self._BEHAVIOR_TO_LABEL else "discard_duplicates"
-        )
+        # One lookup both validates the key and yields the combo label.
+        normalized_key = behavior_key
+        desired_label = self._BEHAVIOR_TO_LABEL.get(normalized_key)
+        if desired_label is None:
+            normalized_key = "discard_duplicates"
+            desired_label = self._BEHAVIOR_TO_LABEL[normalized_key]
         self._settings.show_overlap_dialog = bool(show_dialog)
         self._settings.overlap_default_behavior = normalized_key
 
@@ -668,7 +712,6 @@ class DetectionDialog(QDialog):
             self._show_overlap_dialog_checkbox.setChecked(self._settings.show_overlap_dialog)
             self._show_overlap_dialog_checkbox.blockSignals(False)
         if hasattr(self, "_overlap_behavior_combo"):
-            desired_label = self._BEHAVIOR_TO_LABEL[normalized_key]
             self._overlap_behavior_combo.blockSignals(True)
             self._overlap_behavior_combo.setCurrentText(desired_label)
             self._overlap_behavior_combo.blockSignals(False)
@@ -683,8 +726,20 @@ class DetectionDialog(QDialog):
             except (TypeError, ValueError, RuntimeError) as exc:
                 logger.debug("Unable to persist overlap default behavior: %s", exc, exc_info=exc)
 
+    def _validation_key(self) -> tuple[Any, ...]:
+        """Return a hashable snapshot of the settings that feed validation."""
+        return tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in self._settings.to_dict().items()
+        )
+
     def _refresh_validation_state(self) -> None:
         """Update UI elements based on current validation errors."""
+        self._validate_timer.stop()
+        key = self._validation_key()
+        if key == self._last_validated_key:
+            return
+        self._last_validated_key = key
         errors = self._settings.validate()
         if errors:
             messages = "\n".join(issue.message for issue in errors)
@@ -6,15 +6,40 @@ import logging
 import subprocess
 import tempfile
 import uuid
-from collections.abc import Callable, Sequence
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import replace
 from datetime import datetime
+from enum import IntFlag, auto
+from functools import lru_cache, partial
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
-from PySide6.QtCore import Qt, QTimer, QUrl, Signal
-from PySide6.QtGui import QColor, QDoubleValidator, QImage, QKeyEvent, QPainter, QPixmap
+from numpy.lib.stride_tricks import sliding_window_view
+from PySide6.QtCore import (
+    QEvent,
+    QLine,
+    QObject,
+    QRegularExpression,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Signal,
+)
+from PySide6.QtGui import (
+    QColor,
+    QImage,
+    QKeyEvent,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRegularExpressionValidator,
+)
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -37,17 +62,25 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from scipy import fft as scipy_fft
 
 from spectrosampler.detectors.base import Segment
 from spectrosampler.dsp import bandpass_filter
 from spectrosampler.gui.export_models import (
+    BANDPASS_DISABLED_HZ,
     DEFAULT_FILENAME_TEMPLATE,
+    PADDING_TEMPLATE_TOKENS,
+    BandpassMode,
+    EffectiveSampleSettings,
     ExportBatchSettings,
     ExportSampleOverride,
     compute_sample_id,
     derive_sample_title,
+    normalize_formats,
     parse_overrides,
     render_filename_from_template,
+    resolve_sample_settings,
+    template_fields,
 )
 from spectrosampler.gui.export_sample_player import ExportSamplePlayerWidget
 from spectrosampler.gui.sample_scrubber import SampleScrubber
@@ -60,12 +93,194 @@ SAMPLE_RATE_CHOICES: tuple[int, ...] = (0, 44100, 48000, 88200, 96000, 192000)
 PREVIEW_WAVEFORM_SIZE: tuple[int, int] = (520, 140)
 PREVIEW_SPECTROGRAM_SIZE: tuple[int, int] = (520, 220)
 PREVIEW_REFRESH_DELAY_MS = 120
+SETTINGS_COMMIT_DELAY_MS = 200
+PREVIEW_CACHE_SIZE = 32
+_PREVIEW_FRAME_RGB32 = 0xFF303030
+# Bandpass frequencies: 0-200000 Hz with up to two decimals, always "." as the separator so
+# the handlers' float() parsing never sees a locale-specific comma.
+_FREQUENCY_PATTERN = r"^(?:200000(?:\.0{0,2})?|1?\d{1,5}(?:\.\d{0,2})?)$"
 NORMALIZE_TARGET_DBFS = -0.1
 NORMALIZE_TARGET_AMPLITUDE = float(10.0 ** (NORMALIZE_TARGET_DBFS / 20.0))
+NORMALIZE_GAIN_TOLERANCE = 1e-3
+
+
+def _build_preview_colormap_rgb32() -> np.ndarray:
+    """Build the 256-entry viridis-like colormap, packed as 0xAARRGGBB words.
+
+    Matches the main spectrogram's palette; packing lets a single gather produce
+    RGB32 pixels. The table is read-only so preview jobs can share it safely.
+    """
+    # Key color stops sampled from viridis gradient (approximate)
+    stops = np.array(
+        [
+            [68, 1, 84, 255],
+            [58, 82, 139, 255],
+            [32, 144, 140, 255],
+            [94, 201, 97, 255],
+            [253, 231, 37, 255],
+        ],
+        dtype=np.float32,
+    )
+    positions = np.linspace(0.0, 1.0, len(stops), dtype=np.float32)
+    samples = np.linspace(0.0, 1.0, 256, dtype=np.float32)
+    lut = np.empty((256, 4), dtype=np.uint32)
+    for channel in range(4):
+        channel_values = np.interp(samples, positions, stops[:, channel])
+        lut[:, channel] = np.clip(channel_values, 0, 255).astype(np.uint8)
+    packed = (lut[:, 3] << 24) | (lut[:, 0] << 16) | (lut[:, 1] << 8) | lut[:, 2]
+    packed.setflags(write=False)
+    return packed
+
+
+_PREVIEW_COLORMAP_RGB32 = _build_preview_colormap_rgb32()
+_PREVIEW_STFT_WINDOW = 512
+_PREVIEW_STFT_HOP = 128
+_PREVIEW_HANN = np.hanning(_PREVIEW_STFT_WINDOW).astype(np.float32)
+
+
+def _build_preview_frequency_rows() -> np.ndarray:
+    """Map each spectrogram pixel row, top to bottom, to its STFT bin.
+
+    The bin count and image height are fixed, so the map is built once.
+    """
+    bins = _PREVIEW_STFT_WINDOW // 2 + 1
+    height = PREVIEW_SPECTROGRAM_SIZE[1]
+    rows: np.ndarray = np.clip(np.round(np.linspace(0, bins - 1, height)).astype(int), 0, bins - 1)
+    rows = rows[::-1].copy()
+    rows.setflags(write=False)
+    return rows
+
+
+_PREVIEW_FREQUENCY_ROWS = _build_preview_frequency_rows()
+
+
+@lru_cache(maxsize=64)
+def _preview_frame_columns(frame_count: int) -> np.ndarray:
+    """Map each spectrogram pixel column to an STFT frame for ``frame_count`` frames."""
+    width = PREVIEW_SPECTROGRAM_SIZE[0]
+    columns: np.ndarray = np.clip(
+        np.round(np.linspace(0, frame_count - 1, width)).astype(int), 0, frame_count - 1
+    )
+    columns.setflags(write=False)
+    return columns
+
+
+def _preview_stft_db(audio: np.ndarray) -> np.ndarray:
+    """Return the magnitude STFT of ``audio`` in dB, shaped (frames, bins).
+
+    Frames are strided views over the signal, so windowing and the FFT each run
+    as one vectorized call over the whole frame matrix. SciPy's FFT keeps float32
+    input in single precision and can split the frames across worker threads.
+
+    When there are more frames than preview columns, only the frame each column
+    samples is transformed, so the result has exactly ``PREVIEW_SPECTROGRAM_SIZE[0]``
+    frames.
+    """
+    if audio.size < _PREVIEW_STFT_WINDOW:
+        audio = np.pad(audio, (0, _PREVIEW_STFT_WINDOW - audio.size), mode="constant")
+    frames = sliding_window_view(audio, _PREVIEW_STFT_WINDOW)[::_PREVIEW_STFT_HOP]
+    if frames.shape[0] > PREVIEW_SPECTROGRAM_SIZE[0]:
+        frames = frames[_preview_frame_columns(frames.shape[0])]
+    # The windowed matrix is a temporary, so the transform may reuse it.
+    spectrum: np.ndarray = np.abs(
+        scipy_fft.rfft(frames * _PREVIEW_HANN, axis=1, workers=-1, overwrite_x=True)
+    )
+    np.maximum(spectrum, 1e-8, out=spectrum)
+    np.log10(spectrum, out=spectrum)
+    spectrum *= 20.0
+    return spectrum
+
+
+@contextmanager
+def _updates_suspended(widget: QWidget) -> Iterator[None]:
+    """Suppress repaints of ``widget`` for the block, repainting once on exit.
+
+    Nested uses are no-ops so only the outermost block re-enables updates.
+    """
+    if not widget.updatesEnabled():
+        yield
+        return
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def _parse_frequency(edit: QLineEdit) -> float | None:
+    """Return the Hz value in a bandpass field, or ``None`` when it is blank.
+
+    Programmatic ``setText`` bypasses the frequency validator, so unparsable text is
+    treated as blank rather than raising from a signal handler.
+    """
+    text = edit.text().strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _grown_frames(current: int, needed: int) -> int:
+    """Return the new length for a scratch buffer that must hold ``needed`` frames.
+
+    Growing at least geometrically means a pad spinbox dragged upward reallocates a
+    handful of times instead of on every preview.
+    """
+    return max(needed, 2 * current)
+
+
+class _Dirty(IntFlag):
+    """Views an edit has invalidated, drained together once per event-loop turn."""
+
+    NAVIGATION = auto()
+    FILENAME = auto()
+    PREVIEW = auto()
+
+
+class _PreviewSignals(QObject):
+    """Carries finished preview renders from the pool thread back to the dialog."""
+
+    # generation, cache key, (waveform, spectrogram) QImages or None when unavailable
+    rendered = Signal(int, object, object)
+
+
+class _PreviewJob(QRunnable):
+    """Run one preview render off the GUI thread and report it via ``signals``."""
+
+    def __init__(
+        self,
+        generation: int,
+        cache_key: tuple[object, ...],
+        render: Callable[[], tuple[QImage, QImage] | None],
+        signals: _PreviewSignals,
+    ) -> None:
+        super().__init__()
+        self._generation = generation
+        self._cache_key = cache_key
+        self._render = render
+        self._signals = signals
+
+    def run(self) -> None:
+        """Render the preview images and emit them with the job's generation."""
+        try:
+            images = self._render()
+        except (RuntimeError, ValueError, OSError, MemoryError) as exc:
+            logger.debug("Preview render failed: %s", exc)
+            images = None
+        self._signals.rendered.emit(self._generation, self._cache_key, images)
 
 
 class PlaybackIndicatorLabel(QLabel):
-    """QLabel with playback position indicator overlay."""
+    """QLabel with playback position indicator overlay.
+
+    The background and border are painted from a small cached tile rather than a
+    stylesheet, so placeholder repaints skip stylesheet rendering entirely.
+    """
+
+    _BG_TILE_SIZE = 16
+    _background_tiles: dict[str, QPixmap] = {}
 
     def __init__(self, parent: QWidget | None = None):
         """Initialize playback indicator label.
@@ -75,6 +290,32 @@ class PlaybackIndicatorLabel(QLabel):
         """
         super().__init__(parent)
         self._playback_position: float | None = None
+        self._background_color = "#1A1A1A"
+        self._border_color = QColor("#333333")
+        # Reserve the 1px border so pixmaps are laid out as with the old stylesheet frame.
+        self.setContentsMargins(1, 1, 1, 1)
+
+    @classmethod
+    def _background_tile(cls, color: str) -> QPixmap:
+        tile = cls._background_tiles.get(color)
+        if tile is None:
+            tile = QPixmap(cls._BG_TILE_SIZE, cls._BG_TILE_SIZE)
+            tile.fill(QColor(color))
+            cls._background_tiles[color] = tile
+        return tile
+
+    def set_preview_colors(self, background: str, text: str = "#AAAAAA") -> None:
+        """Set the placeholder background and text colours.
+
+        Args:
+            background: Background fill colour (hex string).
+            text: Placeholder text colour (hex string).
+        """
+        self._background_color = background
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(text))
+        self.setPalette(palette)
+        self.update()
 
     def set_playback_position(self, position: float | None) -> None:
         """Set playback position for indicator (0.0 to 1.0).
@@ -87,7 +328,12 @@ class PlaybackIndicatorLabel(QLabel):
             self.update()
 
     def paintEvent(self, event) -> None:
-        """Override paint event to draw playback indicator."""
+        """Override paint event to draw background, border and playback indicator."""
+        painter = QPainter(self)
+        painter.drawTiledPixmap(self.rect(), self._background_tile(self._background_color))
+        painter.setPen(self._border_color)
+        painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
+        painter.end()
         super().paintEvent(event)
         if self._playback_position is not None and 0.0 <= self._playback_position <= 1.0:
             painter = QPainter(self)
@@ -121,6 +367,10 @@ class ExportDialog(QDialog):
         # Size will be fixed after layout is built
 
         self._segments: list[Segment] = list(segments or [])
+        # Segments are fixed for the dialog's lifetime, so resolve their ids once up front.
+        self._sample_ids: list[str] = [
+            compute_sample_id(index, segment) for index, segment in enumerate(self._segments)
+        ]
         self._current_index: int = 0
 
         self._batch_settings = replace(batch_settings) if batch_settings else ExportBatchSettings()
@@ -145,6 +395,11 @@ class ExportDialog(QDialog):
         self._audio_sample_rate: int | None = None
         self._audio_total_frames: int | None = None
         self._audio_duration: float | None = None
+        # Source file handle kept open while the dialog is up so previews only seek + read.
+        self._audio_handle: sf.SoundFile | None = None
+        # Scratch buffers reused across preview reads; grown to the longest window seen.
+        self._read_buffer: np.ndarray | None = None
+        self._mono_buffer: np.ndarray | None = None
         self._ensure_audio_metadata()
 
         # Export player state
@@ -163,6 +418,9 @@ class ExportDialog(QDialog):
         self._samples_page = QWidget()
         self._tabs.addTab(self._global_page, "Global")
         self._tabs.addTab(self._samples_page, "Samples")
+        self._tabs.currentChanged.connect(self._on_tab_changed)
+        # Set when a preview refresh was requested while the Samples tab was hidden.
+        self._preview_refresh_pending = False
 
         self._button_box = QDialogButtonBox()
         self._cancel_button = self._button_box.addButton(QDialogButtonBox.StandardButton.Cancel)
@@ -178,26 +436,63 @@ class ExportDialog(QDialog):
         dialog_layout.addWidget(self._button_box)
         self.setLayout(dialog_layout)
 
+        # Leading+trailing throttle: the first edit renders at once, further edits inside the
+        # window coalesce into one trailing render per PREVIEW_REFRESH_DELAY_MS.
         self._preview_timer = QTimer(self)
         self._preview_timer.setSingleShot(True)
-        self._preview_timer.timeout.connect(self._refresh_sample_preview)
+        self._preview_timer.timeout.connect(self._on_preview_throttle_elapsed)
+        self._preview_refresh_trailing = False
+        # Handlers only mark what they invalidated; one zero-delay timer refreshes it all, so
+        # cascading signals from a single edit cost one filename render and one preview request.
+        self._dirty = _Dirty(0)
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.timeout.connect(self._drain_dirty)
+        # Previews render on a single pool thread: one worker serializes use of the shared
+        # audio handle and scratch buffers, and the generation counter drops stale results.
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(1)
+        self._preview_generation = 0
+        self._preview_signals = _PreviewSignals(self)
+        self._preview_signals.rendered.connect(self._on_preview_rendered)
+        self._settings_commit_timer = QTimer(self)
+        self._settings_commit_timer.setSingleShot(True)
+        self._settings_commit_timer.setInterval(SETTINGS_COMMIT_DELAY_MS)
+        self._settings_commit_timer.timeout.connect(self._flush_settings_commits)
+        self._pending_settings_commits: dict[Callable[[], None], None] = {}
+        # Padded (start, end) seconds keyed by segment bounds + padding; cleared when the
+        # global padding changes so spinbox sweeps do not grow it without bound.
+        self._padded_bounds_cache: dict[tuple[float, float, float, float], tuple[float, float]] = {}
+        # Batch formats normalised once per format change, so resolving a sample without a
+        # format override does not de-duplicate the batch list again.
+        self._normalized_batch_formats = normalize_formats(self._batch_settings.formats)
+        # Resolved per-sample settings; cleared by every batch mutator, and per sample by
+        # _set_override_field, so playback ticks and previews reuse one object.
+        self._effective_cache: dict[str, EffectiveSampleSettings] = {}
+        # Last rendered filename list, keyed by every input that feeds the template.
+        self._filename_preview_cache: tuple[tuple[object, ...], tuple[str, ...]] | None = None
+        # Rendered (waveform, spectrogram) pixmaps keyed by every input that shapes them, so
+        # revisiting a sample with unchanged settings swaps pixmaps instead of re-rendering.
+        self._preview_cache: OrderedDict[tuple[object, ...], tuple[QPixmap, QPixmap]] = (
+            OrderedDict()
+        )
         self._updating_controls = False
+        # Shared by every bandpass field; see _FREQUENCY_PATTERN.
+        self._frequency_validator = QRegularExpressionValidator(
+            QRegularExpression(_FREQUENCY_PATTERN), self
+        )
 
         self._build_global_page()
         self._build_samples_page()
 
-        # Apply dropdown arrow styling to all QComboBox widgets (after pages are built)
-        from spectrosampler.gui.ui_utils import (
-            apply_checkbox_styling_to_all_checkboxes,
-            apply_combo_styling_to_all_combos,
-        )
+        # Style every QComboBox/QCheckBox through one dialog-level stylesheet
+        from spectrosampler.gui.ui_utils import apply_dialog_control_styling
 
-        apply_combo_styling_to_all_combos(self)
-        apply_checkbox_styling_to_all_checkboxes(self)
+        apply_dialog_control_styling(self)
 
         self._apply_batch_settings_to_ui()
         self._update_navigation_state()
-        self._schedule_preview_refresh()
+        self._mark_dirty(_Dirty.PREVIEW)
 
         # Size will be locked after dialog is shown to ensure layout is fully calculated
 
@@ -269,22 +564,21 @@ class ExportDialog(QDialog):
         self._bandpass_enable_checkbox.stateChanged.connect(self._on_bandpass_toggled)
         bandpass_layout.addWidget(self._bandpass_enable_checkbox, 0, 0, 1, 2)
 
-        validator = QDoubleValidator(0.0, 200000.0, 2, self)
-        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
-
         self._bandpass_low_edit = QLineEdit()
         self._bandpass_low_edit.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self._bandpass_low_edit.setValidator(validator)
+        self._bandpass_low_edit.setValidator(self._frequency_validator)
         self._bandpass_low_edit.setPlaceholderText("Low cut (Hz)")
         self._bandpass_low_edit.setText("20")
-        self._bandpass_low_edit.textChanged.connect(self._on_bandpass_values_changed)
+        self._bandpass_low_edit.editingFinished.connect(self._on_bandpass_values_changed)
+        self._bandpass_low_edit.textChanged.connect(self._on_bandpass_text_changed)
 
         self._bandpass_high_edit = QLineEdit()
         self._bandpass_high_edit.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self._bandpass_high_edit.setValidator(validator)
+        self._bandpass_high_edit.setValidator(self._frequency_validator)
         self._bandpass_high_edit.setPlaceholderText("High cut (Hz)")
         self._bandpass_high_edit.setText("20000")
-        self._bandpass_high_edit.textChanged.connect(self._on_bandpass_values_changed)
+        self._bandpass_high_edit.editingFinished.connect(self._on_bandpass_values_changed)
+        self._bandpass_high_edit.textChanged.connect(self._on_bandpass_text_changed)
 
         bandpass_layout.addWidget(QLabel("Low Cut"), 1, 0)
         bandpass_layout.addWidget(self._bandpass_low_edit, 1, 1)
@@ -300,16 +594,16 @@ class ExportDialog(QDialog):
         metadata_group = QGroupBox("Metadata")
         metadata_form = QFormLayout()
         self._artist_edit = QLineEdit()
-        self._artist_edit.textChanged.connect(self._on_artist_changed)
+        self._artist_edit.textChanged.connect(self._on_deferred_text_changed)
         self._album_edit = QLineEdit()
-        self._album_edit.textChanged.connect(self._on_album_changed)
+        self._album_edit.textChanged.connect(self._on_deferred_text_changed)
         self._year_spin = QSpinBox()
         self._year_spin.setRange(1900, 9999)
         self._year_spin.valueChanged.connect(self._on_year_changed)
         self._notes_edit = QPlainTextEdit()
         self._notes_edit.setPlaceholderText("Add notes here...")
         self._notes_edit.setFixedHeight(70)
-        self._notes_edit.textChanged.connect(self._on_notes_changed)
+        self._notes_edit.textChanged.connect(self._on_deferred_text_changed)
         metadata_form.addRow("Artist", self._artist_edit)
         metadata_form.addRow("Album", self._album_edit)
         metadata_form.addRow("Year", self._year_spin)
@@ -328,10 +622,18 @@ class ExportDialog(QDialog):
         destination_layout.addWidget(browse_button, 0, 2)
 
         self._filename_template_edit = QLineEdit()
-        self._filename_template_edit.textChanged.connect(self._on_filename_template_changed)
+        self._filename_template_edit.textChanged.connect(self._on_deferred_text_changed)
         destination_layout.addWidget(QLabel("Filename Template"), 1, 0)
         destination_layout.addWidget(self._filename_template_edit, 1, 1, 1, 2)
 
+        # Free-text fields commit after typing pauses rather than on every keystroke.
+        self._deferred_text_commits: dict[QObject, Callable[[], None]] = {
+            self._artist_edit: self._commit_artist,
+            self._album_edit: self._commit_album,
+            self._notes_edit: self._commit_notes,
+            self._filename_template_edit: self._commit_filename_template,
+        }
+
         self._persist_defaults_checkbox = QCheckBox("Save as default export settings")
         destination_layout.addWidget(self._persist_defaults_checkbox, 2, 0, 1, 3)
 
@@ -373,12 +675,8 @@ class ExportDialog(QDialog):
             index = self._sample_rate_combo.findData(target)
         if index == -1:
             index = self._sample_rate_combo.findData(0)
-        self._sample_rate_combo.blockSignals(True)
-        if index != -1:
-            self._sample_rate_combo.setCurrentIndex(index)
-        else:
-            self._sample_rate_combo.setCurrentIndex(0)
-        self._sample_rate_combo.blockSignals(False)
+        with QSignalBlocker(self._sample_rate_combo):
+            self._sample_rate_combo.setCurrentIndex(index if index != -1 else 0)
 
     # ------------------------------------------------------------------ #
     # Samples tab construction and override wiring
@@ -427,17 +725,13 @@ class ExportDialog(QDialog):
         self._spectrogram_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         # Set fixed size for spectrogram preview
         self._spectrogram_label.setFixedSize(*PREVIEW_SPECTROGRAM_SIZE)
-        self._spectrogram_label.setStyleSheet(
-            "background-color: #1A1A1A; border: 1px solid #333333; color: #AAAAAA;"
-        )
+        self._spectrogram_label.set_preview_colors("#1A1A1A")
 
         self._waveform_label = PlaybackIndicatorLabel("Waveform preview unavailable")
         self._waveform_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         # Set fixed size for waveform preview
         self._waveform_label.setFixedSize(*PREVIEW_WAVEFORM_SIZE)
-        self._waveform_label.setStyleSheet(
-            "background-color: #111111; border: 1px solid #333333; color: #AAAAAA;"
-        )
+        self._waveform_label.set_preview_colors("#111111")
 
         preview_column.addWidget(self._spectrogram_label)
         preview_column.addWidget(self._waveform_label)
@@ -495,9 +789,6 @@ class ExportDialog(QDialog):
         )
         overrides_form.addRow("Normalization", self._override_normalize_combo)
 
-        validator = QDoubleValidator(0.0, 200000.0, 2, self)
-        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
-
         self._override_bandpass_combo = QComboBox()
         self._override_bandpass_combo.addItems(["Use Global Setting", "Enabled", "Disabled"])
         self._override_bandpass_combo.currentIndexChanged.connect(
@@ -509,15 +800,17 @@ class ExportDialog(QDialog):
         self._override_bandpass_low = QLineEdit()
         self._override_bandpass_low.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self._override_bandpass_low.setPlaceholderText("Low (Hz)")
-        self._override_bandpass_low.setValidator(validator)
+        self._override_bandpass_low.setValidator(self._frequency_validator)
         self._override_bandpass_low.setText("20")
-        self._override_bandpass_low.textChanged.connect(self._on_override_bandpass_changed)
+        self._override_bandpass_low.editingFinished.connect(self._on_override_bandpass_changed)
+        self._override_bandpass_low.textChanged.connect(self._on_override_bandpass_text_changed)
         self._override_bandpass_high = QLineEdit()
         self._override_bandpass_high.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self._override_bandpass_high.setPlaceholderText("High (Hz)")
-        self._override_bandpass_high.setValidator(validator)
+        self._override_bandpass_high.setValidator(self._frequency_validator)
         self._override_bandpass_high.setText("20000")
-        self._override_bandpass_high.textChanged.connect(self._on_override_bandpass_changed)
+        self._override_bandpass_high.editingFinished.connect(self._on_override_bandpass_changed)
+        self._override_bandpass_high.textChanged.connect(self._on_override_bandpass_text_changed)
         bandpass_fields_layout.addWidget(self._override_bandpass_low)
         bandpass_fields_layout.addWidget(self._override_bandpass_high)
         overrides_form.addRow("Bandpass (Hz)", self._override_bandpass_combo)
@@ -577,87 +870,87 @@ class ExportDialog(QDialog):
 
     def _apply_batch_settings_to_ui(self) -> None:
         """Synchronise the UI with the current batch settings."""
+        with _updates_suspended(self._global_page):
+            widgets: list[QObject] = [
+                *self._format_checkboxes.values(),
+                self._bit_depth_combo,
+                self._channels_combo,
+                self._pre_pad_spin,
+                self._post_pad_spin,
+                self._normalize_checkbox,
+                self._bandpass_enable_checkbox,
+                self._bandpass_low_edit,
+                self._bandpass_high_edit,
+                self._artist_edit,
+                self._album_edit,
+                self._year_spin,
+                self._notes_edit,
+                self._output_dir_edit,
+                self._filename_template_edit,
+            ]
+            # One blocker per widget for the whole sync so no change handler fires while the
+            # controls are being populated.
+            blockers = [QSignalBlocker(widget) for widget in widgets]
 
-        for fmt, checkbox in self._format_checkboxes.items():
-            checkbox.blockSignals(True)
-            checkbox.setChecked(fmt in self._batch_settings.formats)
-            checkbox.blockSignals(False)
+            for fmt, checkbox in self._format_checkboxes.items():
+                checkbox.setChecked(fmt in self._batch_settings.formats)
+            self._normalized_batch_formats = normalize_formats(self._batch_settings.formats)
+            self._effective_cache.clear()
 
-        self._set_sample_rate_combo_value(self._batch_settings.sample_rate_hz)
+            self._set_sample_rate_combo_value(self._batch_settings.sample_rate_hz)
 
-        bit_depth_value = self._batch_settings.bit_depth
-        index = self._bit_depth_combo.findData(bit_depth_value)
-        if index == -1:
-            index = 0
-        self._bit_depth_combo.blockSignals(True)
-        self._bit_depth_combo.setCurrentIndex(index)
-        self._bit_depth_combo.blockSignals(False)
+            bit_depth_value = self._batch_settings.bit_depth
+            index = self._bit_depth_combo.findData(bit_depth_value)
+            if index == -1:
+                index = 0
+            self._bit_depth_combo.setCurrentIndex(index)
 
-        channels_value = self._batch_settings.channels
-        index = self._channels_combo.findData(channels_value)
-        if index == -1:
-            index = 0
-        self._channels_combo.blockSignals(True)
-        self._channels_combo.setCurrentIndex(index)
-        self._channels_combo.blockSignals(False)
-
-        self._pre_pad_spin.blockSignals(True)
-        self._pre_pad_spin.setValue(self._batch_settings.pre_pad_ms)
-        self._pre_pad_spin.blockSignals(False)
-        self._post_pad_spin.blockSignals(True)
-        self._post_pad_spin.setValue(self._batch_settings.post_pad_ms)
-        self._post_pad_spin.blockSignals(False)
-
-        self._normalize_checkbox.blockSignals(True)
-        self._normalize_checkbox.setChecked(self._batch_settings.normalize)
-        self._normalize_checkbox.blockSignals(False)
-
-        bandpass_enabled = (
-            self._batch_settings.bandpass_low_hz is not None
-            or self._batch_settings.bandpass_high_hz is not None
-        )
-        self._bandpass_enable_checkbox.blockSignals(True)
-        self._bandpass_enable_checkbox.setChecked(bandpass_enabled)
-        self._bandpass_enable_checkbox.blockSignals(False)
-        self._bandpass_low_edit.setText(
-            ""
-            if self._batch_settings.bandpass_low_hz is None
-            else str(self._batch_settings.bandpass_low_hz)
-        )
-        self._bandpass_high_edit.setText(
-            ""
-            if self._batch_settings.bandpass_high_hz is None
-            else str(self._batch_settings.bandpass_high_hz)
-        )
-        self._toggle_bandpass_fields(bandpass_enabled)
-
-        self._artist_edit.blockSignals(True)
-        self._artist_edit.setText(self._batch_settings.artist or "SpectroSampler")
-        self._artist_edit.blockSignals(False)
-        self._album_edit.blockSignals(True)
-        default_album = self._batch_settings.album
-        if not default_album and self._audio_path:
-            default_album = self._audio_path.stem
-        self._batch_settings.album = default_album or None
-        self._album_edit.setText(default_album or "")
-        self._album_edit.blockSignals(False)
-        self._year_spin.blockSignals(True)
-        year_value = self._batch_settings.year or datetime.now().year
-        self._batch_settings.year = year_value
-        self._year_spin.setValue(year_value)
-        self._year_spin.blockSignals(False)
-        self._notes_edit.blockSignals(True)
-        self._notes_edit.setPlainText(self._batch_settings.notes or "")
-        self._notes_edit.blockSignals(False)
-
-        self._output_dir_edit.blockSignals(True)
-        self._output_dir_edit.setText(self._batch_settings.output_directory or "")
-        self._output_dir_edit.blockSignals(False)
-        self._filename_template_edit.blockSignals(True)
-        template_text = self._batch_settings.filename_template or DEFAULT_FILENAME_TEMPLATE
-        self._batch_settings.filename_template = template_text
-        self._filename_template_edit.setText(template_text)
-        self._filename_template_edit.blockSignals(False)
+            channels_value = self._batch_settings.channels
+            index = self._channels_combo.findData(channels_value)
+            if index == -1:
+                index = 0
+            self._channels_combo.setCurrentIndex(index)
+
+            self._pre_pad_spin.setValue(self._batch_settings.pre_pad_ms)
+            self._post_pad_spin.setValue(self._batch_settings.post_pad_ms)
+
+            self._normalize_checkbox.setChecked(self._batch_settings.normalize)
+
+            bandpass_enabled = (
+                self._batch_settings.bandpass_low_hz is not None
+                or self._batch_settings.bandpass_high_hz is not None
+            )
+            self._bandpass_enable_checkbox.setChecked(bandpass_enabled)
+            self._bandpass_low_edit.setText(
+                ""
+                if self._batch_settings.bandpass_low_hz is None
+                else str(self._batch_settings.bandpass_low_hz)
+            )
+            self._bandpass_high_edit.setText(
+                ""
+                if self._batch_settings.bandpass_high_hz is None
+                else str(self._batch_settings.bandpass_high_hz)
+            )
+            self._toggle_bandpass_fields(bandpass_enabled)
+
+            self._artist_edit.setText(self._batch_settings.artist or "SpectroSampler")
+            default_album = self._batch_settings.album
+            if not default_album and self._audio_path:
+                default_album = self._audio_path.stem
+            self._batch_settings.album = default_album or None
+            self._album_edit.setText(default_album or "")
+            year_value = self._batch_settings.year or datetime.now().year
+            self._batch_settings.year = year_value
+            self._year_spin.setValue(year_value)
+            self._notes_edit.setPlainText(self._batch_settings.notes or "")
+
+            self._output_dir_edit.setText(self._batch_settings.output_directory or "")
+            template_text = self._batch_settings.filename_template or DEFAULT_FILENAME_TEMPLATE
+            self._batch_settings.filename_template = template_text
+            self._filename_template_edit.setText(template_text)
+
+            for blocker in blockers:
+                blocker.unblock()
 
     def _toggle_bandpass_fields(self, enabled: bool) -> None:
         """Enable or disable bandpass fields."""
@@ -668,58 +961,58 @@ class ExportDialog(QDialog):
 
     def _update_navigation_state(self) -> None:
         """Refresh navigation controls for the Samples tab."""
+        self._dirty &= ~_Dirty.NAVIGATION
+        with _updates_suspended(self._samples_page):
+            total = len(self._segments)
+            if total == 0:
+                self._sample_position_label.setText("No samples available")
+                self._sample_title_label.setText("")
+                self._prev_button.setEnabled(False)
+                self._next_button.setEnabled(False)
+                if hasattr(self, "_sample_scrubber"):
+                    self._sample_scrubber.setEnabled(False)
+                    self._sample_scrubber.set_segments([])
+                self._sample_summary_label.setText(
+                    "No samples selected for export. Run detection or select clips to enable preview."
+                )
+                self._spectrogram_label.setText("Spectrogram preview unavailable")
+                self._spectrogram_label.setPixmap(QPixmap())
+                self._waveform_label.setText("Waveform preview unavailable")
+                self._waveform_label.setPixmap(QPixmap())
+                return
 
-        total = len(self._segments)
-        if total == 0:
-            self._sample_position_label.setText("No samples available")
-            self._sample_title_label.setText("")
-            self._prev_button.setEnabled(False)
-            self._next_button.setEnabled(False)
+            self._current_index = max(0, min(self._current_index, total - 1))
+            self._sample_position_label.setText(f"Sample {self._current_index + 1} of {total}")
+            self._prev_button.setEnabled(self._current_index > 0)
+            self._next_button.setEnabled(self._current_index < total - 1)
+            # Update scrubber
             if hasattr(self, "_sample_scrubber"):
-                self._sample_scrubber.setEnabled(False)
-                self._sample_scrubber.set_segments([])
-            self._sample_summary_label.setText(
-                "No samples selected for export. Run detection or select clips to enable preview."
-            )
-            self._spectrogram_label.setText("Spectrogram preview unavailable")
-            self._spectrogram_label.setPixmap(QPixmap())
-            self._waveform_label.setText("Waveform preview unavailable")
-            self._waveform_label.setPixmap(QPixmap())
-            return
+                self._sample_scrubber.set_segments(self._segments)
+                self._sample_scrubber.set_current_index(self._current_index)
+                self._sample_scrubber.setEnabled(True)
 
-        self._current_index = max(0, min(self._current_index, total - 1))
-        self._sample_position_label.setText(f"Sample {self._current_index + 1} of {total}")
-        self._prev_button.setEnabled(self._current_index > 0)
-        self._next_button.setEnabled(self._current_index < total - 1)
-        # Update scrubber
-        if hasattr(self, "_sample_scrubber"):
-            self._sample_scrubber.set_segments(self._segments)
-            self._sample_scrubber.set_current_index(self._current_index)
-            self._sample_scrubber.setEnabled(True)
-
-        segment = self._segments[self._current_index]
-        sample_id = compute_sample_id(self._current_index, segment)
-        self._update_override_controls(sample_id)
+            segment = self._segments[self._current_index]
+            sample_id = self._sample_ids[self._current_index]
+            self._update_override_controls(sample_id)
 
-        effective = self._effective_settings(sample_id)
-        core_duration = max(0.0, segment.end - segment.start)
-        pre_pad_ms = float(effective.get("pre_pad_ms", 0.0) or 0.0)
-        post_pad_ms = float(effective.get("post_pad_ms", 0.0) or 0.0)
-        padded_start = max(0.0, segment.start - (pre_pad_ms / 1000.0))
-        padded_end = segment.end + (post_pad_ms / 1000.0)
-        if self._audio_duration is not None:
-            padded_end = min(self._audio_duration, padded_end)
-        padded_duration = max(0.0, padded_end - padded_start)
-        summary_parts = [
-            f"{segment.detector} {segment.start:.3f}s → {segment.end:.3f}s",
-            f"core {core_duration:.3f}s",
-            f"padded {padded_duration:.3f}s",
-        ]
-        formats = self._batch_settings.formats or ["wav"]
-        if formats:
-            summary_parts.append("formats: " + ", ".join(fmt.upper() for fmt in formats))
-        self._sample_summary_label.setText("; ".join(summary_parts))
-        self._schedule_preview_refresh()
+            effective = self._effective_settings(sample_id)
+            core_duration = max(0.0, segment.end - segment.start)
+            padded_start, padded_end = self._padded_bounds(
+                segment,
+                effective.pre_pad_ms,
+                effective.post_pad_ms,
+            )
+            padded_duration = max(0.0, padded_end - padded_start)
+            summary_parts = [
+                f"{segment.detector} {segment.start:.3f}s → {segment.end:.3f}s",
+                f"core {core_duration:.3f}s",
+                f"padded {padded_duration:.3f}s",
+            ]
+            formats = self._batch_settings.formats or ["wav"]
+            if formats:
+                summary_parts.append("formats: " + ", ".join(fmt.upper() for fmt in formats))
+            self._sample_summary_label.setText("; ".join(summary_parts))
+            self._mark_dirty(_Dirty.PREVIEW)
 
     # ------------------------------------------------------------------ #
     # Signal handlers: global controls
@@ -735,101 +1028,135 @@ class ExportDialog(QDialog):
             self._format_checkboxes[first_key].setChecked(True)
             return
         self._batch_settings.formats = formats
+        self._normalized_batch_formats = normalize_formats(formats)
+        self._effective_cache.clear()
         self._update_navigation_state()
 
     def _on_sample_rate_changed(self) -> None:
         value = self._sample_rate_combo.currentData()
         if isinstance(value, int):
             self._batch_settings.sample_rate_hz = value or None
-            self._refresh_current_filename_preview()
+            self._effective_cache.clear()
+            self._mark_filename_dirty_if_uses("sample_rate_hz")
 
     def _on_sample_rate_edited(self, text: str) -> None:
         text = text.strip()
         if not text:
             self._batch_settings.sample_rate_hz = None
-            self._refresh_current_filename_preview()
+            self._effective_cache.clear()
+            self._mark_filename_dirty_if_uses("sample_rate_hz")
             return
         try:
             value = int(text)
         except ValueError:
             return
         self._batch_settings.sample_rate_hz = value if value > 0 else None
-        self._refresh_current_filename_preview()
+        self._effective_cache.clear()
+        self._mark_filename_dirty_if_uses("sample_rate_hz")
 
     def _on_bit_depth_changed(self, index: int) -> None:
         mapping = {0: None, 1: "16", 2: "24", 3: "32f"}
         self._batch_settings.bit_depth = mapping.get(index)
-        self._refresh_current_filename_preview()
+        self._effective_cache.clear()
+        self._mark_filename_dirty_if_uses("bit_depth")
 
     def _on_channels_changed(self, index: int) -> None:
         mapping = {0: None, 1: "mono", 2: "stereo"}
         self._batch_settings.channels = mapping.get(index)
-        self._refresh_current_filename_preview()
+        self._effective_cache.clear()
+        self._mark_filename_dirty_if_uses("channels")
 
     def _on_padding_changed(self) -> None:
         self._batch_settings.pre_pad_ms = float(self._pre_pad_spin.value())
         self._batch_settings.post_pad_ms = float(self._post_pad_spin.value())
+        self._padded_bounds_cache.clear()
+        self._effective_cache.clear()
         # Stop playback when settings change
         self._stop_export_playback()
-        self._schedule_preview_refresh()
-        self._refresh_current_filename_preview()
+        self._mark_dirty(_Dirty.PREVIEW)
+        self._mark_filename_dirty_if_uses(*PADDING_TEMPLATE_TOKENS)
 
     def _on_normalize_toggled(self, state: int) -> None:
         self._batch_settings.normalize = state == Qt.CheckState.Checked
+        self._effective_cache.clear()
         # Stop playback when settings change
         self._stop_export_playback()
-        self._schedule_preview_refresh()
-        self._refresh_current_filename_preview()
+        self._mark_dirty(_Dirty.PREVIEW | _Dirty.FILENAME)
 
     def _on_bandpass_toggled(self, state: int) -> None:
         enabled = state == Qt.CheckState.Checked
         if not enabled:
             self._batch_settings.bandpass_low_hz = None
             self._batch_settings.bandpass_high_hz = None
+            self._effective_cache.clear()
         self._toggle_bandpass_fields(enabled)
         if enabled:
             self._on_bandpass_values_changed()
         # Stop playback when settings change
         self._stop_export_playback()
-        self._schedule_preview_refresh()
+        self._mark_dirty(_Dirty.PREVIEW)
 
     def _on_bandpass_values_changed(self) -> None:
         if not self._bandpass_enable_checkbox.isChecked():
             return
-        low_text = self._bandpass_low_edit.text().strip()
-        high_text = self._bandpass_high_edit.text().strip()
-        self._batch_settings.bandpass_low_hz = float(low_text) if low_text else None
-        self._batch_settings.bandpass_high_hz = float(high_text) if high_text else None
+        self._batch_settings.bandpass_low_hz = _parse_frequency(self._bandpass_low_edit)
+        self._batch_settings.bandpass_high_hz = _parse_frequency(self._bandpass_high_edit)
+        self._effective_cache.clear()
         # Stop playback when settings change
         self._stop_export_playback()
-        self._schedule_preview_refresh()
-        self._refresh_current_filename_preview()
+        self._mark_dirty(_Dirty.PREVIEW)
 
-    def _on_artist_changed(self, text: str) -> None:
-        self._batch_settings.artist = text or "SpectroSampler"
-        self._refresh_current_filename_preview()
+    def _on_bandpass_text_changed(self, text: str) -> None:
+        # Empty text is Intermediate for the frequency validator, and Qt does not emit
+        # editingFinished for Intermediate input, so a cleared field commits here instead.
+        if not text:
+            self._on_bandpass_values_changed()
 
-    def _on_album_changed(self, text: str) -> None:
-        self._batch_settings.album = text or None
-        self._refresh_current_filename_preview()
+    def _on_deferred_text_changed(self) -> None:
+        commit = self._deferred_text_commits.get(self.sender())
+        if commit is None:
+            return
+        # Keyed by commit so a burst of edits to one field runs its commit once.
+        self._pending_settings_commits[commit] = None
+        self._settings_commit_timer.start()
+
+    def _flush_settings_commits(self) -> None:
+        """Apply any text edits still waiting on the commit timer."""
+        self._settings_commit_timer.stop()
+        pending = list(self._pending_settings_commits)
+        self._pending_settings_commits.clear()
+        for commit in pending:
+            commit()
+
+    def _commit_artist(self) -> None:
+        self._batch_settings.artist = self._artist_edit.text() or "SpectroSampler"
+        self._effective_cache.clear()
+        self._mark_filename_dirty_if_uses("artist")
+
+    def _commit_album(self) -> None:
+        self._batch_settings.album = self._album_edit.text() or None
+        self._effective_cache.clear()
+        self._mark_filename_dirty_if_uses("album")
 
     def _on_year_changed(self, value: int) -> None:
         self._batch_settings.year = value or None
-        self._refresh_current_filename_preview()
+        self._effective_cache.clear()
+        self._mark_filename_dirty_if_uses("year")
 
-    def _on_notes_changed(self) -> None:
+    def _commit_notes(self) -> None:
         text = self._notes_edit.toPlainText().strip()
         self._batch_settings.notes = text or None
+        self._effective_cache.clear()
 
     def _on_output_directory_changed(self, text: str) -> None:
         self._batch_settings.output_directory = text or None
 
-    def _on_filename_template_changed(self, text: str) -> None:
+    def _commit_filename_template(self) -> None:
+        text = self._filename_template_edit.text()
         self._batch_settings.filename_template = text or DEFAULT_FILENAME_TEMPLATE
         sample_id = self._current_sample_id()
         if sample_id:
             self._update_override_controls(sample_id)
-        self._schedule_preview_refresh()
 
     def _choose_output_directory(self) -> None:
         """Prompt the user to select an export destination."""
@@ -854,8 +1181,8 @@ class ExportDialog(QDialog):
             )
         else:
             self._set_override_field(sample_id, "pre_pad_ms", None, prune=True)
-        self._schedule_preview_refresh()
-        self._refresh_current_filename_preview()
+        self._mark_dirty(_Dirty.PREVIEW)
+        self._mark_filename_dirty_if_uses(*PADDING_TEMPLATE_TOKENS)
 
     def _on_override_pre_pad_changed(self, value: float) -> None:
         if self._updating_controls:
@@ -865,11 +1192,12 @@ class ExportDialog(QDialog):
         sample_id = self._current_sample_id()
         if not sample_id:
             return
-        self._set_override_field(sample_id, "pre_pad_ms", float(value), prune=False)
+        if not self._set_override_field(sample_id, "pre_pad_ms", float(value), prune=False):
+            return
         # Stop playback when settings change
         self._stop_export_playback()
-        self._schedule_preview_refresh()
-        self._refresh_current_filename_preview()
+        self._mark_dirty(_Dirty.PREVIEW)
+        self._mark_filename_dirty_if_uses(*PADDING_TEMPLATE_TOKENS)
 
     def _on_override_post_pad_toggled(self, state: int) -> None:
         enabled = state == Qt.CheckState.Checked
@@ -884,8 +1212,8 @@ class ExportDialog(QDialog):
             self._set_override_field(sample_id, "post_pad_ms", None, prune=True)
         # Stop playback when settings change
         self._stop_export_playback()
-        self._schedule_preview_refresh()
-        self._refresh_current_filename_preview()
+        self._mark_dirty(_Dirty.PREVIEW)
+        self._mark_filename_dirty_if_uses(*PADDING_TEMPLATE_TOKENS)
 
     def _on_override_post_pad_changed(self, value: float) -> None:
         if self._updating_controls:
@@ -895,11 +1223,12 @@ class ExportDialog(QDialog):
         sample_id = self._current_sample_id()
         if not sample_id:
             return
-        self._set_override_field(sample_id, "post_pad_ms", float(value), prune=False)
+        if not self._set_override_field(sample_id, "post_pad_ms", float(value), prune=False):
+            return
         # Stop playback when settings change
         self._stop_export_playback()
-        self._schedule_preview_refresh()
-        self._refresh_current_filename_preview()
+        self._mark_dirty(_Dirty.PREVIEW)
+        self._mark_filename_dirty_if_uses(*PADDING_TEMPLATE_TOKENS)
 
     def _on_override_normalize_changed(self, index: int) -> None:
         if self._updating_controls:
@@ -908,15 +1237,14 @@ class ExportDialog(QDialog):
         if not sample_id:
             return
         if index == 0:  # Use Global Setting
-            self._set_override_field(sample_id, "normalize", None, prune=True)
-        elif index == 1:  # Enabled
-            self._set_override_field(sample_id, "normalize", True, prune=False)
-        else:  # Disabled
-            self._set_override_field(sample_id, "normalize", False, prune=False)
+            value = None
+        else:  # 1 = Enabled, 2 = Disabled
+            value = index == 1
+        if not self._set_override_field(sample_id, "normalize", value, prune=value is None):
+            return
         # Stop playback when settings change
         self._stop_export_playback()
-        self._schedule_preview_refresh()
-        self._refresh_current_filename_preview()
+        self._mark_dirty(_Dirty.PREVIEW | _Dirty.FILENAME)
 
     def _on_override_bandpass_combo_changed(self, index: int) -> None:
         if self._updating_controls:
@@ -924,39 +1252,50 @@ class ExportDialog(QDialog):
         sample_id = self._current_sample_id()
         if not sample_id:
             return
-        if index == 0:  # Use Global Setting
+        if index == BandpassMode.GLOBAL:
             self._override_bandpass_low.setEnabled(False)
             self._override_bandpass_high.setEnabled(False)
             self._set_override_field(sample_id, "bandpass_low_hz", None, prune=False)
             self._set_override_field(sample_id, "bandpass_high_hz", None, prune=True)
-        elif index == 1:  # Enabled
+        elif index == BandpassMode.ENABLED:
             self._override_bandpass_low.setEnabled(True)
             self._override_bandpass_high.setEnabled(True)
             self._on_override_bandpass_changed()
-        else:  # Disabled - use sentinel value -1.0 to indicate disabled
+        else:
             self._override_bandpass_low.setEnabled(False)
             self._override_bandpass_high.setEnabled(False)
-            self._set_override_field(sample_id, "bandpass_low_hz", -1.0, prune=False)
-            self._set_override_field(sample_id, "bandpass_high_hz", -1.0, prune=False)
-        self._schedule_preview_refresh()
+            self._set_override_field(
+                sample_id, "bandpass_low_hz", BANDPASS_DISABLED_HZ, prune=False
+            )
+            self._set_override_field(
+                sample_id, "bandpass_high_hz", BANDPASS_DISABLED_HZ, prune=False
+            )
+        self._mark_dirty(_Dirty.PREVIEW)
+
+    def _on_override_bandpass_text_changed(self, text: str) -> None:
+        # See _on_bandpass_text_changed: clearing a cutoff never emits editingFinished.
+        if not text:
+            self._on_override_bandpass_changed()
 
     def _on_override_bandpass_changed(self) -> None:
         if self._updating_controls:
             return
-        if self._override_bandpass_combo.currentIndex() != 1:  # Only apply if "Enabled"
+        if self._override_bandpass_combo.currentIndex() != BandpassMode.ENABLED:
             return
         sample_id = self._current_sample_id()
         if not sample_id:
             return
-        low_text = self._override_bandpass_low.text().strip()
-        high_text = self._override_bandpass_high.text().strip()
-        low_val = float(low_text) if low_text else None
-        high_val = float(high_text) if high_text else None
-        self._set_override_field(sample_id, "bandpass_low_hz", low_val, prune=False)
-        self._set_override_field(sample_id, "bandpass_high_hz", high_val, prune=False)
+        low_val = _parse_frequency(self._override_bandpass_low)
+        high_val = _parse_frequency(self._override_bandpass_high)
+        low_changed = self._set_override_field(sample_id, "bandpass_low_hz", low_val, prune=False)
+        high_changed = self._set_override_field(
+            sample_id, "bandpass_high_hz", high_val, prune=False
+        )
+        if not (low_changed or high_changed):
+            return
         # Stop playback when settings change
         self._stop_export_playback()
-        self._schedule_preview_refresh()
+        self._mark_dirty(_Dirty.PREVIEW)
 
     def _on_override_title_toggled(self, state: int) -> None:
         if self._updating_controls:
@@ -965,23 +1304,21 @@ class ExportDialog(QDialog):
         if not sample_id:
             return
         is_custom = state == Qt.CheckState.Checked
-        self._override_title_edit.blockSignals(True)
-        if not is_custom:
-            self._set_override_field(sample_id, "title", None, prune=True)
-            self._set_override_field(sample_id, "filename", None, prune=True)
-            segment = self._current_segment()
-            default_title = self._default_title(self._current_index, segment) if segment else ""
-            self._override_title_edit.setText(default_title)
-            self._override_title_edit.clearFocus()
-        else:
-            sanitized = sanitize_filename(self._override_title_edit.text().strip())
-            self._override_title_edit.setText(sanitized)
-            # Only set title, not filename - filename uses template with {title} token
-            self._set_override_field(sample_id, "title", sanitized, prune=False)
-            self._override_title_edit.setFocus()
-        self._override_title_edit.blockSignals(False)
+        with QSignalBlocker(self._override_title_edit):
+            if not is_custom:
+                self._set_override_field(sample_id, "title", None, prune=True)
+                self._set_override_field(sample_id, "filename", None, prune=True)
+                segment = self._current_segment()
+                default_title = self._default_title(self._current_index, segment) if segment else ""
+                self._override_title_edit.setText(default_title)
+                self._override_title_edit.clearFocus()
+            else:
+                sanitized = sanitize_filename(self._override_title_edit.text().strip())
+                self._override_title_edit.setText(sanitized)
+                # Only set title, not filename - filename uses template with {title} token
+                self._set_override_field(sample_id, "title", sanitized, prune=False)
+                self._override_title_edit.setFocus()
         self._update_filename_preview(sample_id, self._current_segment(), self._current_index)
-        self._schedule_preview_refresh()
 
     def _on_override_title_changed(self, text: str) -> None:
         if self._updating_controls or not self._override_title_checkbox.isChecked():
@@ -989,23 +1326,23 @@ class ExportDialog(QDialog):
         sample_id = self._current_sample_id()
         if not sample_id:
             return
-        sanitized = sanitize_filename(text.strip())
-        if sanitized != text.strip():
-            self._override_title_edit.blockSignals(True)
-            self._override_title_edit.setText(sanitized)
-            self._override_title_edit.blockSignals(False)
+        stripped = text.strip()
+        sanitized = sanitize_filename(stripped)
+        if sanitized != stripped:
+            with QSignalBlocker(self._override_title_edit):
+                self._override_title_edit.setText(sanitized)
         # Only set title, not filename - filename uses template with {title} token
         self._set_override_field(sample_id, "title", sanitized, prune=False)
         self._update_filename_preview(sample_id, self._current_segment(), self._current_index)
-        self._schedule_preview_refresh()
 
     def _on_clear_overrides_clicked(self) -> None:
         sample_id = self._current_sample_id()
         if not sample_id:
             return
         self._overrides_by_id.pop(sample_id, None)
+        self._effective_cache.pop(sample_id, None)
         self._update_override_controls(sample_id)
-        self._schedule_preview_refresh()
+        self._mark_dirty(_Dirty.PREVIEW)
 
     # ------------------------------------------------------------------ #
     # Samples tab navigation
@@ -1013,6 +1350,10 @@ class ExportDialog(QDialog):
 
     def _save_current_sample_state(self) -> None:
         """Save the current sample's override state before navigating away."""
+        if self._dirty & _Dirty.NAVIGATION:
+            # The controls still show the state from before load_overrides(); saving them
+            # would overwrite the overrides that were just loaded.
+            return
         sample_id = self._current_sample_id()
         if not sample_id:
             return
@@ -1033,19 +1374,21 @@ class ExportDialog(QDialog):
             )
         # Save bandpass if override is enabled
         bandpass_index = self._override_bandpass_combo.currentIndex()
-        if bandpass_index == 0:  # Use Global Setting
+        if bandpass_index == BandpassMode.GLOBAL:
             self._set_override_field(sample_id, "bandpass_low_hz", None, prune=False)
             self._set_override_field(sample_id, "bandpass_high_hz", None, prune=True)
-        elif bandpass_index == 1:  # Enabled
-            low_text = self._override_bandpass_low.text().strip()
-            high_text = self._override_bandpass_high.text().strip()
-            low_val = float(low_text) if low_text else None
-            high_val = float(high_text) if high_text else None
+        elif bandpass_index == BandpassMode.ENABLED:
+            low_val = _parse_frequency(self._override_bandpass_low)
+            high_val = _parse_frequency(self._override_bandpass_high)
             self._set_override_field(sample_id, "bandpass_low_hz", low_val, prune=False)
             self._set_override_field(sample_id, "bandpass_high_hz", high_val, prune=False)
-        else:  # Disabled - use sentinel value -1.0
-            self._set_override_field(sample_id, "bandpass_low_hz", -1.0, prune=False)
-            self._set_override_field(sample_id, "bandpass_high_hz", -1.0, prune=False)
+        else:
+            self._set_override_field(
+                sample_id, "bandpass_low_hz", BANDPASS_DISABLED_HZ, prune=False
+            )
+            self._set_override_field(
+                sample_id, "bandpass_high_hz", BANDPASS_DISABLED_HZ, prune=False
+            )
         # Notes are saved automatically via textChanged signal
 
     def _on_previous_sample(self) -> None:
@@ -1142,6 +1485,7 @@ class ExportDialog(QDialog):
     # ------------------------------------------------------------------ #
 
     def _on_export_clicked(self) -> None:
+        self._flush_settings_commits()
         if not self._batch_settings.formats:
             QMessageBox.warning(self, "No Format Selected", "Select at least one export format.")
             return
@@ -1166,6 +1510,12 @@ class ExportDialog(QDialog):
         self._stop_export_playback()
         super().reject()
 
+    def done(self, result: int) -> None:
+        """Release the preview audio handle whenever the dialog finishes."""
+        self._stop_preview_jobs()
+        self._close_audio_reader()
+        super().done(result)
+
     def showEvent(self, event) -> None:
         """Override showEvent to lock dialog size after layout is calculated."""
         super().showEvent(event)
@@ -1173,6 +1523,13 @@ class ExportDialog(QDialog):
         # Use single-shot timer to lock size after first paint (avoids flicker)
         if not self._size_locked:
             QTimer.singleShot(0, self._lock_dialog_size)
+        self._flush_pending_preview()
+
+    def changeEvent(self, event) -> None:
+        """Render a preview deferred while minimized once the dialog is restored."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._flush_pending_preview()
 
     def _lock_dialog_size(self) -> None:
         """Lock the dialog to its calculated size to prevent resizing."""
@@ -1186,6 +1543,8 @@ class ExportDialog(QDialog):
     def closeEvent(self, event) -> None:
         """Override closeEvent to clean up playback resources."""
         self._stop_export_playback()
+        self._stop_preview_jobs()
+        self._close_audio_reader()
         super().closeEvent(event)
 
     def should_persist_defaults(self) -> bool:
@@ -1196,8 +1555,10 @@ class ExportDialog(QDialog):
     def batch_settings(self) -> ExportBatchSettings:
         """Return the updated batch settings after dialog execution."""
 
+        self._flush_settings_commits()
         notes_value = self._notes_edit.toPlainText().strip()
         self._batch_settings.notes = notes_value if notes_value else None
+        self._effective_cache.clear()
         return replace(self._batch_settings)
 
     def overrides(self) -> list[ExportSampleOverride]:
@@ -1218,7 +1579,10 @@ class ExportDialog(QDialog):
         except ValueError:
             overrides = []
         self._overrides_by_id = {item.sample_id: item for item in overrides}
-        self._update_navigation_state()
+        self._effective_cache.clear()
+        # Re-sync the sample page once the event loop is idle, so back-to-back restores
+        # populate the override controls only once.
+        self._mark_dirty(_Dirty.NAVIGATION)
 
     # ------------------------------------------------------------------ #
     # Internal helpers
@@ -1227,19 +1591,41 @@ class ExportDialog(QDialog):
     def _ensure_audio_metadata(self) -> None:
         if self._audio_path is None or self._audio_sample_rate is not None:
             return
-        try:
-            with sf.SoundFile(self._audio_path) as handle:
-                self._audio_sample_rate = int(handle.samplerate)
-                self._audio_total_frames = int(handle.frames)
-                self._audio_duration = (
-                    float(self._audio_total_frames) / self._audio_sample_rate
-                    if self._audio_sample_rate
-                    else 0.0
-                )
-        except (RuntimeError, OSError, ValueError):
+        handle = self._audio_reader()
+        if handle is None:
             self._audio_sample_rate = None
             self._audio_total_frames = None
             self._audio_duration = None
+            return
+        self._audio_sample_rate = int(handle.samplerate)
+        self._audio_total_frames = int(handle.frames)
+        self._audio_duration = (
+            float(self._audio_total_frames) / self._audio_sample_rate
+            if self._audio_sample_rate
+            else 0.0
+        )
+
+    def _audio_reader(self) -> sf.SoundFile | None:
+        """Return the persistent source-audio handle, opening it on first use."""
+        if self._audio_handle is not None and not self._audio_handle.closed:
+            return self._audio_handle
+        if self._audio_path is None:
+            return None
+        try:
+            self._audio_handle = sf.SoundFile(self._audio_path)
+        except (RuntimeError, OSError, ValueError) as exc:
+            logger.debug("Unable to open %s for preview: %s", self._audio_path, exc)
+            self._audio_handle = None
+        return self._audio_handle
+
+    def _close_audio_reader(self) -> None:
+        """Release the persistent source-audio handle."""
+        if self._audio_handle is not None:
+            try:
+                self._audio_handle.close()
+            except (RuntimeError, OSError) as exc:
+                logger.debug("Failed to close preview audio handle: %s", exc)
+            self._audio_handle = None
 
     def _current_segment(self) -> Segment | None:
         if 0 <= self._current_index < len(self._segments):
@@ -1247,170 +1633,125 @@ class ExportDialog(QDialog):
         return None
 
     def _current_sample_id(self) -> str | None:
-        segment = self._current_segment()
-        if segment is None:
-            return None
-        return compute_sample_id(self._current_index, segment)
-
-    def _effective_settings(self, sample_id: str) -> dict[str, object]:
-        override = self._overrides_by_id.get(sample_id)
-        return {
-            "pre_pad_ms": (
-                override.pre_pad_ms
-                if override and override.pre_pad_ms is not None
-                else self._batch_settings.pre_pad_ms
-            ),
-            "post_pad_ms": (
-                override.post_pad_ms
-                if override and override.post_pad_ms is not None
-                else self._batch_settings.post_pad_ms
-            ),
-            "normalize": (
-                override.normalize
-                if override and override.normalize is not None
-                else self._batch_settings.normalize
-            ),
-            "bandpass_low_hz": (
-                override.bandpass_low_hz
-                if override and override.bandpass_low_hz is not None
-                else self._batch_settings.bandpass_low_hz
-            ),
-            "bandpass_high_hz": (
-                override.bandpass_high_hz
-                if override and override.bandpass_high_hz is not None
-                else self._batch_settings.bandpass_high_hz
-            ),
-            "notes": (
-                override.notes
-                if override and override.notes is not None
-                else self._batch_settings.notes
-            ),
-        }
+        if 0 <= self._current_index < len(self._sample_ids):
+            return self._sample_ids[self._current_index]
+        return None
 
-    def _effective_formats(self, sample_id: str) -> list[str]:
-        override = self._overrides_by_id.get(sample_id)
-        if override and override.formats:
-            normalized = [
-                fmt.strip().lower()
-                for fmt in override.formats
-                if isinstance(fmt, str) and fmt.strip()
-            ]
-            ordered = list(dict.fromkeys(normalized))
-            if ordered:
-                return ordered
-        global_formats = [
-            fmt.strip().lower()
-            for fmt in self._batch_settings.formats or []
-            if isinstance(fmt, str) and fmt.strip()
-        ]
-        ordered = list(dict.fromkeys(global_formats))
-        return ordered or ["wav"]
+    def _effective_settings(self, sample_id: str) -> EffectiveSampleSettings:
+        effective = self._effective_cache.get(sample_id)
+        if effective is None:
+            effective = resolve_sample_settings(
+                self._batch_settings,
+                self._overrides_by_id.get(sample_id),
+                self._normalized_batch_formats,
+            )
+            self._effective_cache[sample_id] = effective
+        return effective
 
     def _update_override_controls(self, sample_id: str) -> None:
-        self._updating_controls = True
-        override = self._overrides_by_id.get(sample_id)
-        segment = self._current_segment()
-        default_pre = self._batch_settings.pre_pad_ms
-        default_post = self._batch_settings.post_pad_ms
-        pre_pad_override = override.pre_pad_ms if override else None
-        post_pad_override = override.post_pad_ms if override else None
-        self._override_pre_pad_checkbox.setChecked(pre_pad_override is not None)
-        self._override_pre_pad_spin.setValue(
-            pre_pad_override if pre_pad_override is not None else default_pre
-        )
+        with _updates_suspended(self._samples_page):
+            self._updating_controls = True
+            # Block every override editor while it is populated. Besides skipping redundant
+            # handler calls, this keeps the pad "Override Global" toggles from rewriting the
+            # override being displayed.
+            blockers = [
+                QSignalBlocker(widget)
+                for widget in (
+                    self._override_pre_pad_checkbox,
+                    self._override_pre_pad_spin,
+                    self._override_post_pad_checkbox,
+                    self._override_post_pad_spin,
+                    self._override_normalize_combo,
+                    self._override_bandpass_combo,
+                    self._override_bandpass_low,
+                    self._override_bandpass_high,
+                    self._override_title_checkbox,
+                    self._override_title_edit,
+                    self._sample_notes_edit,
+                )
+            ]
+            # A blank override displays exactly like "no override", so the reads below need
+            # no None checks.
+            override = self._overrides_by_id.get(sample_id) or ExportSampleOverride(
+                sample_id=sample_id
+            )
+            segment = self._current_segment()
+            pre_pad_override = override.pre_pad_ms
+            post_pad_override = override.post_pad_ms
+            self._override_pre_pad_checkbox.setChecked(pre_pad_override is not None)
+            self._override_pre_pad_spin.setValue(
+                pre_pad_override
+                if pre_pad_override is not None
+                else self._batch_settings.pre_pad_ms
+            )
 
-        self._override_post_pad_checkbox.setChecked(post_pad_override is not None)
-        self._override_post_pad_spin.setValue(
-            post_pad_override if post_pad_override is not None else default_post
-        )
+            self._override_post_pad_checkbox.setChecked(post_pad_override is not None)
+            self._override_post_pad_spin.setValue(
+                post_pad_override
+                if post_pad_override is not None
+                else self._batch_settings.post_pad_ms
+            )
 
-        normalize_index = 0
-        if override and override.normalize is not None:
-            normalize_index = 1 if override.normalize else 2
-        self._override_normalize_combo.setCurrentIndex(normalize_index)
-
-        bandpass_index = 0
-        if override:
-            # Check for disabled sentinel (-1.0)
-            if override.bandpass_low_hz == -1.0 and override.bandpass_high_hz == -1.0:
-                bandpass_index = 2  # Disabled
-            elif override.bandpass_low_hz is not None and override.bandpass_high_hz is not None:
-                # Only treat as enabled if both values are set and not sentinel
-                if override.bandpass_low_hz != -1.0 and override.bandpass_high_hz != -1.0:
-                    bandpass_index = 1  # Enabled
-        self._override_bandpass_combo.setCurrentIndex(bandpass_index)
-        if bandpass_index == 1:  # Enabled
-            self._override_bandpass_low.setEnabled(True)
-            self._override_bandpass_high.setEnabled(True)
-            # Show override values if they exist, otherwise global values, otherwise defaults
-            low_val = None
-            high_val = None
-            if (
-                override
-                and override.bandpass_low_hz is not None
-                and override.bandpass_low_hz != -1.0
-            ):
-                low_val = override.bandpass_low_hz
-            elif self._batch_settings.bandpass_low_hz is not None:
-                low_val = self._batch_settings.bandpass_low_hz
+            normalize_index = 0
+            if override.normalize is not None:
+                normalize_index = 1 if override.normalize else 2
+            self._override_normalize_combo.setCurrentIndex(normalize_index)
+
+            bandpass_mode = override.bandpass_mode
+            self._override_bandpass_combo.setCurrentIndex(bandpass_mode)
+            if bandpass_mode is BandpassMode.ENABLED:
+                # Enabled implies both override cutoffs hold real frequencies.
+                self._override_bandpass_low.setEnabled(True)
+                self._override_bandpass_high.setEnabled(True)
+                self._override_bandpass_low.setText(str(override.bandpass_low_hz))
+                self._override_bandpass_high.setText(str(override.bandpass_high_hz))
             else:
-                low_val = 20.0
-            if (
-                override
-                and override.bandpass_high_hz is not None
-                and override.bandpass_high_hz != -1.0
-            ):
-                high_val = override.bandpass_high_hz
-            elif self._batch_settings.bandpass_high_hz is not None:
-                high_val = self._batch_settings.bandpass_high_hz
-            else:
-                high_val = 20000.0
-            self._override_bandpass_low.setText(str(low_val))
-            self._override_bandpass_high.setText(str(high_val))
-        else:
-            self._override_bandpass_low.setEnabled(False)
-            self._override_bandpass_high.setEnabled(False)
-            # Show global values or defaults
-            global_low = self._batch_settings.bandpass_low_hz
-            global_high = self._batch_settings.bandpass_high_hz
-            self._override_bandpass_low.setText(str(global_low) if global_low is not None else "20")
-            self._override_bandpass_high.setText(
-                str(global_high) if global_high is not None else "20000"
-            )
+                self._override_bandpass_low.setEnabled(False)
+                self._override_bandpass_high.setEnabled(False)
+                # Show global values or defaults
+                global_low = self._batch_settings.bandpass_low_hz
+                global_high = self._batch_settings.bandpass_high_hz
+                self._override_bandpass_low.setText(
+                    str(global_low) if global_low is not None else "20"
+                )
+                self._override_bandpass_high.setText(
+                    str(global_high) if global_high is not None else "20000"
+                )
 
-        default_title = self._default_title(self._current_index, segment) if segment else ""
-        is_custom_title = bool(override and override.title is not None)
-        self._override_title_checkbox.blockSignals(True)
-        self._override_title_checkbox.setChecked(is_custom_title)
-        self._override_title_checkbox.blockSignals(False)
-        self._override_title_edit.blockSignals(True)
-        if is_custom_title:
-            custom_name = override.title if override and override.title else ""
-            self._override_title_edit.setText(custom_name)
-        else:
-            self._override_title_edit.setText(default_title)
-        self._override_title_edit.blockSignals(False)
+            default_title = self._default_title(self._current_index, segment) if segment else ""
+            is_custom_title = override.title is not None
+            self._override_title_checkbox.setChecked(is_custom_title)
+            self._override_title_edit.setText(
+                (override.title or "") if is_custom_title else default_title
+            )
 
-        self._sample_notes_edit.blockSignals(True)
-        self._sample_notes_edit.setPlainText(override.notes if override and override.notes else "")
-        self._sample_notes_edit.blockSignals(False)
+            self._sample_notes_edit.setPlainText(override.notes or "")
 
-        self._updating_controls = False
-        if segment is not None:
-            self._update_filename_preview(sample_id, segment, self._current_index)
+            for blocker in blockers:
+                blocker.unblock()
+            self._updating_controls = False
+            if segment is not None:
+                self._update_filename_preview(sample_id, segment, self._current_index)
 
     def _set_override_field(
         self, sample_id: str, field: str, value: object, *, prune: bool = False
-    ) -> None:
+    ) -> bool:
+        """Store ``value`` on the sample's override, returning whether it changed anything."""
         override = self._overrides_by_id.get(sample_id)
         if override is None:
             if value in (None, [], "") and prune:
-                return
+                return False
             override = ExportSampleOverride(sample_id=sample_id)
             self._overrides_by_id[sample_id] = override
+        elif getattr(override, field) == value:
+            if prune and override.is_empty():
+                self._overrides_by_id.pop(sample_id, None)
+            return False
         setattr(override, field, value)
+        self._effective_cache.pop(sample_id, None)
         if prune and override.is_empty():
             self._overrides_by_id.pop(sample_id, None)
+        return True
 
     def _on_sample_notes_changed(self) -> None:
         if self._updating_controls:
@@ -1420,7 +1761,6 @@ class ExportDialog(QDialog):
             return
         text = self._sample_notes_edit.toPlainText().strip()
         self._set_override_field(sample_id, "notes", text or None, prune=True)
-        self._schedule_preview_refresh()
 
     def _default_title(self, index: int, segment: Segment | None) -> str:
         if segment is None:
@@ -1433,34 +1773,42 @@ class ExportDialog(QDialog):
         if segment is None:
             return []
         effective = self._effective_settings(sample_id)
-        formats = self._effective_formats(sample_id)
-        normalize = bool(effective["normalize"])
-        pre_pad = float(effective["pre_pad_ms"])
-        post_pad = float(effective["post_pad_ms"])
+        formats = effective.formats
+        normalize = effective.normalize
+        pre_pad = effective.pre_pad_ms
+        post_pad = effective.post_pad_ms
         title_value = self._title_value(sample_id, segment, index)
-
-        override = self._overrides_by_id.get(sample_id)
-        artist = self._batch_settings.artist
-        if override and override.artist:
-            artist = override.artist
-        album = self._batch_settings.album
-        if override and override.album:
-            album = override.album
-        year = self._batch_settings.year
-        if override and override.year is not None:
-            year = override.year
-
-        sample_rate = self._batch_settings.sample_rate_hz
-        if override and override.sample_rate_hz is not None:
-            sample_rate = override.sample_rate_hz
-        bit_depth = self._batch_settings.bit_depth
-        if override and override.bit_depth:
-            bit_depth = override.bit_depth
-        channels = self._batch_settings.channels
-        if override and override.channels:
-            channels = override.channels
+        artist = effective.artist
+        album = effective.album
+        year = effective.year
+        sample_rate = effective.sample_rate_hz
+        bit_depth = effective.bit_depth
+        channels = effective.channels
 
         template = self._batch_settings.filename_template or DEFAULT_FILENAME_TEMPLATE
+        total = len(self._segments) if self._segments else 1
+        cache_key = (
+            template,
+            sample_id,
+            index,
+            total,
+            formats,
+            normalize,
+            pre_pad,
+            post_pad,
+            title_value,
+            artist,
+            album,
+            year,
+            sample_rate,
+            bit_depth,
+            channels,
+        )
+        if (
+            self._filename_preview_cache is not None
+            and self._filename_preview_cache[0] == cache_key
+        ):
+            return list(self._filename_preview_cache[1])
         filenames: list[str] = []
         for fmt in formats:
             base = render_filename_from_template(
@@ -1468,7 +1816,7 @@ class ExportDialog(QDialog):
                 base_name=self._base_name,
                 sample_id=sample_id,
                 index=index,
-                total=len(self._segments) if self._segments else 1,
+                total=total,
                 segment=segment,
                 fmt=fmt,
                 normalized=normalize,
@@ -1483,6 +1831,7 @@ class ExportDialog(QDialog):
                 channels=channels,
             )
             filenames.append(f"{base}.{fmt}")
+        self._filename_preview_cache = (cache_key, tuple(filenames))
         return filenames
 
     def _update_filename_preview(self, sample_id: str, segment: Segment | None, index: int) -> None:
@@ -1500,8 +1849,33 @@ class ExportDialog(QDialog):
         else:
             self._sample_title_label.setText("")
 
+    def _mark_filename_dirty_if_uses(self, *tokens: str) -> None:
+        """Mark the filename preview dirty only if the template references one of ``tokens``.
+
+        Edits to values the template never reads cannot change the rendered names.
+        """
+        template = self._batch_settings.filename_template or DEFAULT_FILENAME_TEMPLATE
+        if not template_fields(template).isdisjoint(tokens):
+            self._mark_dirty(_Dirty.FILENAME)
+
+    def _mark_dirty(self, flags: _Dirty) -> None:
+        self._dirty |= flags
+        if not self._dirty_timer.isActive():
+            self._dirty_timer.start(0)
+
+    def _drain_dirty(self) -> None:
+        if self._dirty & _Dirty.NAVIGATION:
+            # Runs first: syncing the sample page marks the filename and preview again.
+            self._update_navigation_state()
+        self._dirty_timer.stop()
+        dirty, self._dirty = self._dirty, _Dirty(0)
+        if dirty & _Dirty.FILENAME:
+            self._refresh_current_filename_preview()
+        if dirty & _Dirty.PREVIEW:
+            self._schedule_preview_refresh()
+
     def _title_value(self, sample_id: str, segment: Segment | None, index: int) -> str:
-        """Resolve the title value for a sample, matching ExportManager._resolve_title_value logic."""
+        """Resolve the title value for a sample, as the exporter does for filenames."""
         override = self._overrides_by_id.get(sample_id)
         if override and override.title:
             return override.title
@@ -1509,49 +1883,192 @@ class ExportDialog(QDialog):
             return "sample"
         return derive_sample_title(index, segment, fallback="sample")
 
+    def _preview_visible(self) -> bool:
+        """Return whether the preview labels can currently be seen."""
+        return (
+            self.isVisible()
+            and not self.isMinimized()
+            and self._tabs.currentWidget() is self._samples_page
+        )
+
     def _schedule_preview_refresh(self) -> None:
-        if self._preview_timer.isActive():
+        if not self._preview_visible():
+            # Nothing shows the preview; render once it can be seen again.
             self._preview_timer.stop()
+            self._preview_refresh_trailing = False
+            self._preview_refresh_pending = True
+            return
+        if self._preview_timer.isActive():
+            self._preview_refresh_trailing = True
+            return
+        self._refresh_sample_preview()
         self._preview_timer.start(PREVIEW_REFRESH_DELAY_MS)
 
+    def _on_preview_throttle_elapsed(self) -> None:
+        if not self._preview_refresh_trailing:
+            return
+        self._preview_refresh_trailing = False
+        if not self._preview_visible():
+            self._preview_refresh_pending = True
+            return
+        self._refresh_sample_preview()
+        # Keep the window open so a continuing drag stays at one render per interval.
+        self._preview_timer.start(PREVIEW_REFRESH_DELAY_MS)
+
+    def _on_tab_changed(self, index: int) -> None:
+        self._flush_pending_preview()
+
+    def _flush_pending_preview(self) -> None:
+        """Render a preview that was deferred while hidden, if it is now visible."""
+        if self._preview_refresh_pending and self._preview_visible():
+            self._preview_refresh_pending = False
+            self._refresh_sample_preview()
+
     def _refresh_sample_preview(self) -> None:
+        # This render reflects every edit so far, including ones still waiting to be drained.
+        self._dirty &= ~_Dirty.PREVIEW
+        # Any render still in flight is for older inputs from here on.
+        self._preview_generation += 1
         segment = self._current_segment()
         sample_id = self._current_sample_id()
         if segment is None or sample_id is None or self._audio_path is None:
-            self._spectrogram_label.setPixmap(QPixmap())
-            self._spectrogram_label.setText("Spectrogram preview unavailable")
-            self._waveform_label.setPixmap(QPixmap())
-            self._waveform_label.setText("Waveform preview unavailable")
+            self._show_preview_placeholders()
             return
 
         effective = self._effective_settings(sample_id)
-        audio_data = self._read_audio_window(segment, effective)
-        if audio_data is None or audio_data.size == 0 or self._audio_sample_rate is None:
-            self._spectrogram_label.setPixmap(QPixmap())
-            self._spectrogram_label.setText("Spectrogram preview unavailable")
-            self._waveform_label.setPixmap(QPixmap())
-            self._waveform_label.setText("Waveform preview unavailable")
+        cache_key = (
+            sample_id,
+            segment.start,
+            segment.end,
+            effective.pre_pad_ms,
+            effective.post_pad_ms,
+            effective.bandpass_low_hz,
+            effective.bandpass_high_hz,
+            effective.normalize,
+        )
+        cached = self._preview_cache.get(cache_key)
+        if cached is not None:
+            self._preview_cache.move_to_end(cache_key)
+            self._show_preview_pixmaps(*cached)
             return
 
-        waveform_pixmap = self._render_waveform_pixmap(audio_data)
+        generation = self._preview_generation
+        render = partial(self._render_preview_images, generation, segment, effective)
+        self._preview_pool.start(_PreviewJob(generation, cache_key, render, self._preview_signals))
+
+    def _render_preview_images(
+        self, generation: int, segment: Segment, effective: EffectiveSampleSettings
+    ) -> tuple[QImage, QImage] | None:
+        """Read and rasterize a preview window. Runs on the preview pool thread."""
+        if generation != self._preview_generation:
+            return None  # Superseded while queued; skip the read and render.
+        audio_data = self._read_audio_window(segment, effective)
+        sample_rate = self._audio_sample_rate
+        if audio_data is None or audio_data.size == 0 or sample_rate is None:
+            return None
+        # Re-check between stages so a superseded job frees the single worker before the
+        # STFT rather than after it.
+        if generation != self._preview_generation:
+            return None
+        waveform = self._render_waveform_image(audio_data)
+        if generation != self._preview_generation:
+            return None
+        return waveform, self._render_spectrogram_image(audio_data, sample_rate)
+
+    def _on_preview_rendered(
+        self,
+        generation: int,
+        cache_key: tuple[object, ...],
+        images: tuple[QImage, QImage] | None,
+    ) -> None:
+        current = generation == self._preview_generation
+        if images is None:
+            if current:
+                self._show_preview_placeholders()
+            return
+        # QPixmap must be created on the GUI thread; cache even superseded results since
+        # they are still valid for their own inputs.
+        pixmaps = (QPixmap.fromImage(images[0]), QPixmap.fromImage(images[1]))
+        self._preview_cache[cache_key] = pixmaps
+        if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        if current:
+            self._show_preview_pixmaps(*pixmaps)
+
+    def _show_preview_pixmaps(self, waveform_pixmap: QPixmap, spectrogram_pixmap: QPixmap) -> None:
         self._waveform_label.setPixmap(waveform_pixmap)
         self._waveform_label.setText("")
-
-        spectrogram_pixmap = self._render_spectrogram_pixmap(audio_data, self._audio_sample_rate)
         self._spectrogram_label.setPixmap(spectrogram_pixmap)
         self._spectrogram_label.setText("")
 
+    def _show_preview_placeholders(self) -> None:
+        self._spectrogram_label.setPixmap(QPixmap())
+        self._spectrogram_label.setText("Spectrogram preview unavailable")
+        self._waveform_label.setPixmap(QPixmap())
+        self._waveform_label.setText("Waveform preview unavailable")
+
+    def _stop_preview_jobs(self) -> None:
+        """Drop queued preview renders and wait for the running one to finish."""
+        self._dirty_timer.stop()
+        self._dirty = _Dirty(0)
+        self._preview_timer.stop()
+        self._preview_refresh_trailing = False
+        self._preview_generation += 1
+        self._preview_pool.clear()
+        self._preview_pool.waitForDone()
+
+    def _padded_bounds(
+        self, segment: Segment, pre_pad_ms: float, post_pad_ms: float
+    ) -> tuple[float, float]:
+        """Return the padded (start, end) seconds for a segment, clamped to the source."""
+        key = (segment.start, segment.end, pre_pad_ms, post_pad_ms)
+        bounds = self._padded_bounds_cache.get(key)
+        if bounds is None:
+            start = max(0.0, segment.start - pre_pad_ms / 1000.0)
+            end = segment.end + post_pad_ms / 1000.0
+            if self._audio_duration is not None:
+                end = min(self._audio_duration, end)
+            bounds = (start, end)
+            self._padded_bounds_cache[key] = bounds
+        return bounds
+
+    def _read_frames(self, start_frame: int, frame_count: int) -> np.ndarray | None:
+        """Read ``frame_count`` frames into the scratch buffer via the persistent handle."""
+        handle = self._audio_reader()
+        if handle is None:
+            return None
+        channels = handle.channels
+        buffer = self._read_buffer
+        if buffer is None or buffer.shape[1] != channels:
+            buffer = np.empty((frame_count, channels), dtype=np.float32)
+            self._read_buffer = buffer
+        elif buffer.shape[0] < frame_count:
+            buffer = np.empty((_grown_frames(buffer.shape[0], frame_count), channels), np.float32)
+            self._read_buffer = buffer
+        try:
+            handle.seek(start_frame)
+            # read() returns the filled prefix of ``out``, which is shorter at end of file.
+            frames: np.ndarray = handle.read(
+                frame_count, dtype="float32", always_2d=True, out=buffer[:frame_count]
+            )
+            return frames
+        except (RuntimeError, OSError, ValueError) as exc:
+            logger.debug("Preview read from %s failed: %s", self._audio_path, exc)
+            return None
+
     def _read_audio_window(
-        self, segment: Segment, effective: dict[str, object]
+        self, segment: Segment, effective: EffectiveSampleSettings
     ) -> np.ndarray | None:
+        """Read, mix down and process the padded preview window for ``segment``.
+
+        The result may be a view onto scratch buffers owned by the dialog, so it is
+        only valid until the next call.
+        """
         if self._audio_path is None or self._audio_sample_rate is None:
             return None
-        pre_pad_ms = float(effective["pre_pad_ms"])
-        post_pad_ms = float(effective["post_pad_ms"])
-        start_sec = max(0.0, segment.start - pre_pad_ms / 1000.0)
-        end_sec = segment.end + post_pad_ms / 1000.0
-        if self._audio_duration is not None:
-            end_sec = min(self._audio_duration, end_sec)
+        start_sec, end_sec = self._padded_bounds(
+            segment, effective.pre_pad_ms, effective.post_pad_ms
+        )
         if end_sec <= start_sec:
             return None
         start_frame = int(round(start_sec * self._audio_sample_rate))
@@ -1559,24 +2076,36 @@ class ExportDialog(QDialog):
         frame_count = max(0, end_frame - start_frame)
         if frame_count == 0:
             return None
-        try:
-            with sf.SoundFile(self._audio_path) as handle:
-                handle.seek(start_frame)
-                data = handle.read(frame_count, dtype="float32", always_2d=False)
-        except (RuntimeError, OSError, ValueError):
-            return None
+        data = self._read_frames(start_frame, frame_count)
+        if data is None:
+            # The cached handle may have gone stale (file replaced, network share
+            # remounted); retry once against a freshly opened handle.
+            self._close_audio_reader()
+            data = self._read_frames(start_frame, frame_count)
+            if data is None:
+                self._close_audio_reader()
+                return None
+        channels = data.shape[1]
+
+        if channels > 1:
+            mono = self._mono_buffer
+            if mono is None or mono.shape[0] < data.shape[0]:
+                current = 0 if mono is None else mono.shape[0]
+                mono = np.empty(_grown_frames(current, data.shape[0]), dtype=np.float32)
+                self._mono_buffer = mono
+            audio = mono[: data.shape[0]]
+            if channels == 2:
+                # Stereo is the common case: a strided add plus an in-place scale beats the
+                # generic axis reduction and gives bit-identical results.
+                np.add(data[:, 0], data[:, 1], out=audio)
+                audio *= 0.5
+            else:
+                np.mean(data, axis=1, dtype=np.float32, out=audio)
+        else:
+            audio = data[:, 0]
 
-        if data.ndim > 1:
-            data = np.mean(data, axis=1, dtype=np.float32)
-        audio = np.asarray(data, dtype=np.float32)
-
-        low_hz = effective["bandpass_low_hz"]
-        high_hz = effective["bandpass_high_hz"]
-        # Convert sentinel value -1.0 (disabled) to None
-        if low_hz == -1.0:
-            low_hz = None
-        if high_hz == -1.0:
-            high_hz = None
+        low_hz = effective.bandpass_low_hz
+        high_hz = effective.bandpass_high_hz
         if (low_hz is not None or high_hz is not None) and audio.size > 0:
             try:
                 low_val = float(low_hz) if low_hz is not None else 0.0
@@ -1585,19 +2114,23 @@ class ExportDialog(QDialog):
             except (ValueError, RuntimeError):
                 pass
 
-        if effective["normalize"] and audio.size > 0:
-            peak = float(np.max(np.abs(audio)))
+        if effective.normalize and audio.size > 0:
+            # max/-min instead of abs().max() avoids a full-size temporary.
+            peak = max(float(audio.max()), -float(audio.min()))
             if peak > 1e-6:
-                scale = NORMALIZE_TARGET_AMPLITUDE / peak
-                audio = (audio * scale).astype(np.float32, copy=False)
+                gain = NORMALIZE_TARGET_AMPLITUDE / peak
+                # Already at the target level: skip a pass over the whole window.
+                if abs(gain - 1.0) >= NORMALIZE_GAIN_TOLERANCE:
+                    audio *= gain
 
         return audio
 
-    def _render_waveform_pixmap(self, audio: np.ndarray) -> QPixmap:
+    def _render_waveform_image(self, audio: np.ndarray) -> QImage:
         width, height = PREVIEW_WAVEFORM_SIZE
-        pixmap = QPixmap(width, height)
-        pixmap.fill(QColor("#111111"))
-        painter = QPainter(pixmap)
+        # QImage rather than QPixmap so this can run on the preview pool thread.
+        image = QImage(width, height, QImage.Format.Format_RGB32)
+        image.fill(QColor("#111111"))
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
         mid_y = height / 2.0
@@ -1606,118 +2139,87 @@ class ExportDialog(QDialog):
 
         if audio.size == 0:
             painter.end()
-            return pixmap
+            return image
 
+        # Min/max decimation in one NumPy pass: fold whole buckets into rows and reduce each
+        # row, then reduce the trailing partial bucket (if any) separately.
         step = max(1, audio.size // width)
-        peaks_pos = []
-        peaks_neg = []
-        for start in range(0, audio.size, step):
-            chunk = audio[start : start + step]
-            peaks_pos.append(float(np.max(chunk)))
-            peaks_neg.append(float(np.min(chunk)))
-
-        max_abs = max(1e-6, max(abs(max(peaks_pos, default=0.0)), abs(min(peaks_neg, default=0.0))))
+        full_buckets = audio.size // step
+        buckets = audio[: full_buckets * step].reshape(full_buckets, step)
+        peaks_pos = buckets.max(axis=1).astype(np.float64)
+        peaks_neg = buckets.min(axis=1).astype(np.float64)
+        tail = audio[full_buckets * step :]
+        if tail.size:
+            peaks_pos = np.append(peaks_pos, tail.max())
+            peaks_neg = np.append(peaks_neg, tail.min())
+
+        max_abs = max(1e-6, abs(float(peaks_pos.max())), abs(float(peaks_neg.min())))
         scale = (height / 2.0 - 4.0) / max_abs
+        # Only the first `width` buckets land on the pixmap (plus one whose antialiased edge
+        # bleeds into the last column); map them to pixel rows at once.
+        visible = width + 1
+        y_high = (mid_y - peaks_pos[:visible] * scale).astype(np.int32)
+        y_low = (mid_y - peaks_neg[:visible] * scale).astype(np.int32)
         painter.setPen(QColor("#EF7F22"))
-        for idx, (pos, neg) in enumerate(zip(peaks_pos, peaks_neg, strict=True)):
-            x = idx
-            y_high = mid_y - pos * scale
-            y_low = mid_y - neg * scale
-            painter.drawLine(x, int(y_high), x, int(y_low))
+        # One drawLines call for every column instead of one drawLine call per column.
+        painter.drawLines(
+            [
+                QLine(x, top, x, bottom)
+                for x, (top, bottom) in enumerate(zip(y_high.tolist(), y_low.tolist(), strict=True))
+            ]
+        )
 
         painter.end()
-        return pixmap
+        return image
 
-    def _build_colormap_lut(self) -> np.ndarray:
-        """Build a 256-entry viridis-like RGBA lookup table matching main spectrogram."""
-        # Key color stops sampled from viridis gradient (approximate)
-        stops = np.array(
-            [
-                [68, 1, 84, 255],
-                [58, 82, 139, 255],
-                [32, 144, 140, 255],
-                [94, 201, 97, 255],
-                [253, 231, 37, 255],
-            ],
-            dtype=np.float32,
-        )
-        positions = np.linspace(0.0, 1.0, len(stops), dtype=np.float32)
-        samples = np.linspace(0.0, 1.0, 256, dtype=np.float32)
-        lut = np.empty((256, 4), dtype=np.uint8)
-        for channel in range(4):
-            channel_values = np.interp(samples, positions, stops[:, channel])
-            lut[:, channel] = np.clip(channel_values, 0, 255).astype(np.uint8)
-        return lut
-
-    def _render_spectrogram_pixmap(self, audio: np.ndarray, sample_rate: int) -> QPixmap:
+    def _render_spectrogram_image(self, audio: np.ndarray, sample_rate: int) -> QImage:
         width, height = PREVIEW_SPECTROGRAM_SIZE
         if audio.size == 0:
-            placeholder = QPixmap(width, height)
+            placeholder = QImage(width, height, QImage.Format.Format_RGB32)
             placeholder.fill(QColor("#1A1A1A"))
             return placeholder
 
-        window_size = 512
-        hop_size = 128
-        if audio.size < window_size:
-            pad_width = window_size - audio.size
-            audio = np.pad(audio, (0, pad_width), mode="constant")
-
-        window = np.hanning(window_size).astype(np.float32, copy=False)
-        frames = []
-        for start in range(0, audio.size - window_size + 1, hop_size):
-            frame = audio[start : start + window_size]
-            frames.append(frame * window)
-        if not frames:
-            frames.append(audio[:window_size] * window)
-        matrix = np.stack(frames, axis=0)
-        spectrum = np.abs(np.fft.rfft(matrix, axis=1))
-        spectrum = np.maximum(spectrum, 1e-8)
-        db = 20.0 * np.log10(spectrum)
+        db = _preview_stft_db(audio)
+
+        # Gather straight into (height, width) order, low frequencies at the bottom. The
+        # scaling below is per pixel, so only the gathered grid is normalized, in place.
+        image_array = db[
+            _preview_frame_columns(db.shape[0])[np.newaxis, :],
+            _PREVIEW_FREQUENCY_ROWS[:, np.newaxis],
+        ]
 
         # Normalize using percentile-based scaling like main spectrogram
         try:
-            lo = float(np.nanpercentile(db, 5))
-            hi = float(np.nanpercentile(db, 95))
+            # One call for both bounds, taken over the full STFT rather than the grid.
+            lo, hi = (float(value) for value in np.nanpercentile(db, (5, 95)))
             if hi <= lo:
                 lo = float(np.nanmin(db))
                 hi = float(np.nanmax(db) + 1e-6)
-            norm = (db - lo) / (hi - lo)
-            norm = np.clip(np.nan_to_num(norm, nan=0.0, posinf=1.0, neginf=0.0), 0.0, 1.0)
         except (FloatingPointError, OverflowError, ValueError, ZeroDivisionError, TypeError):
             # Fallback to simple normalization
-            db -= db.max()
-            norm = np.clip(db / 80.0 + 1.0, 0.0, 1.0)
-
-        frame_indices = np.clip(
-            np.round(np.linspace(0, norm.shape[0] - 1, width)).astype(int), 0, norm.shape[0] - 1
-        )
-        freq_indices = np.clip(
-            np.round(np.linspace(0, norm.shape[1] - 1, height)).astype(int), 0, norm.shape[1] - 1
-        )
-        sampled = norm[frame_indices][:, freq_indices]
-        image_array = np.flipud(sampled.T)  # Shape: (height, width)
+            image_array -= db.max()
+            image_array /= 80.0
+            image_array += 1.0
+        else:
+            image_array -= lo
+            image_array /= hi - lo
+            np.nan_to_num(image_array, copy=False, nan=0.0, posinf=1.0, neginf=0.0)
+        np.clip(image_array, 0.0, 1.0, out=image_array)
 
         # Apply colormap
-        indices = np.rint(image_array * 255.0).astype(np.int16)
-        indices = np.clip(indices, 0, 255).astype(np.uint8)
-        colormap = self._build_colormap_lut()  # Shape: (256, 4)
-        # Index into colormap: indices is (height, width), result is (height, width, 4)
-        rgba = colormap[indices]
-
-        image_data = np.ascontiguousarray(rgba, dtype=np.uint8)
-        image = QImage(
-            image_data.data,
-            width,
-            height,
-            image_data.strides[0],
-            QImage.Format.Format_RGBA8888,
-        )
-        pixmap = QPixmap.fromImage(image.copy())
-        painter = QPainter(pixmap)
-        painter.setPen(QColor("#303030"))
-        painter.drawRect(0, 0, width - 1, height - 1)
-        painter.end()
-        return pixmap
+        image_array *= 255.0
+        np.rint(image_array, out=image_array)
+        indices = np.clip(image_array, 0, 255).astype(np.uint8)
+
+        # Write pixels straight into the QImage buffer instead of painting onto a pixmap.
+        image = QImage(width, height, QImage.Format.Format_RGB32)
+        pixels = np.frombuffer(image.bits(), dtype=np.uint32).reshape(
+            height, image.bytesPerLine() // 4
+        )[:, :width]
+        np.take(_PREVIEW_COLORMAP_RGB32, indices, out=pixels)
+        # 1px frame, matching the preview border colour.
+        pixels[0, :] = pixels[-1, :] = pixels[:, 0] = pixels[:, -1] = _PREVIEW_FRAME_RGB32
+        return image
 
     # ------------------------------------------------------------------ #
     # Export player playback logic
@@ -1735,8 +2237,8 @@ class ExportDialog(QDialog):
 
         # Get effective settings (global + overrides)
         effective = self._effective_settings(sample_id)
-        pre_pad_ms = float(effective.get("pre_pad_ms", 0.0) or 0.0)
-        post_pad_ms = float(effective.get("post_pad_ms", 0.0) or 0.0)
+        pre_pad_ms = effective.pre_pad_ms
+        post_pad_ms = effective.post_pad_ms
 
         # Calculate padded time window
         start_sec = max(0.0, segment.start - (pre_pad_ms / 1000.0))
@@ -1751,15 +2253,10 @@ class ExportDialog(QDialog):
         sample_rate = self._batch_settings.sample_rate_hz or 0
         bit_depth = self._batch_settings.bit_depth
         channels = self._batch_settings.channels
-        normalize = bool(effective.get("normalize", False))
+        normalize = effective.normalize
 
-        # Handle bandpass (convert sentinel -1.0 to None)
-        bandpass_low_hz = effective.get("bandpass_low_hz")
-        bandpass_high_hz = effective.get("bandpass_high_hz")
-        if bandpass_low_hz == -1.0:
-            bandpass_low_hz = None
-        if bandpass_high_hz == -1.0:
-            bandpass_high_hz = None
+        bandpass_low_hz = effective.bandpass_low_hz
+        bandpass_high_hz = effective.bandpass_high_hz
 
         try:
             # Create temporary file
@@ -2024,8 +2521,8 @@ class ExportDialog(QDialog):
 
         # Calculate relative position within padded sample window
         effective = self._effective_settings(sample_id)
-        pre_pad_ms = float(effective.get("pre_pad_ms", 0.0) or 0.0)
-        post_pad_ms = float(effective.get("post_pad_ms", 0.0) or 0.0)
+        pre_pad_ms = effective.pre_pad_ms
+        post_pad_ms = effective.post_pad_ms
 
         start_sec = max(0.0, segment.start - (pre_pad_ms / 1000.0))
         end_sec = segment.end + (post_pad_ms / 1000.0)
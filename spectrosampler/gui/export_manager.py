@@ -2,29 +2,44 @@
 
 from __future__ import annotations
 
+import logging
+import os
 import threading
 import time
+from collections import deque
 from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 from PySide6.QtCore import QObject, QThread, Signal
 
+from spectrosampler.audio_io import FFmpegError, get_audio_info
 from spectrosampler.detectors.base import Segment
 from spectrosampler.export import export_sample
 from spectrosampler.gui.export_models import (
     DEFAULT_FILENAME_TEMPLATE,
+    EffectiveSampleSettings,
     ExportBatchSettings,
     ExportSampleOverride,
     apply_template,
     build_template_context,
     compute_sample_id,
     derive_sample_title,
+    normalize_formats,
     render_filename_from_template,
+    resolve_sample_settings,
 )
 from spectrosampler.utils import sanitize_filename
 
+logger = logging.getLogger(__name__)
+
+# Each export is an ffmpeg subprocess, so threads overlap them without contending for the GIL.
+_DEFAULT_EXPORT_WORKERS = max(1, (os.cpu_count() or 4) - 1)
+# Minimum spacing between progress signals; the last one of a run is always sent.
+_PROGRESS_INTERVAL_S = 0.1
+
 
 @dataclass(slots=True)
 class ExportSampleResult:
@@ -64,6 +79,12 @@ class _ExportTask:
     override: ExportSampleOverride | None
 
 
+def _path_key(path: Path) -> str:
+    """Return a comparison key for ``path`` that also matches on case-insensitive disks."""
+
+    return str(path).casefold()
+
+
 class ExportWorker(QObject):
     """Worker that performs exports in a background thread."""
 
@@ -83,37 +104,51 @@ class ExportWorker(QObject):
         batch_settings: ExportBatchSettings,
         tasks: Sequence[_ExportTask],
         resume_state: Mapping[str, str] | None = None,
+        max_workers: int | None = None,
     ) -> None:
         super().__init__()
         self._audio_path = audio_path
         self._base_name = base_name
         self._output_dir = output_dir
         self._batch_settings = replace(batch_settings)
+        self._default_formats = normalize_formats(self._batch_settings.formats)
         self._tasks = list(tasks)
         self._resume_state: dict[str, str] = dict(resume_state or {})
+        self._max_workers = (
+            max_workers if max_workers and max_workers > 0 else _DEFAULT_EXPORT_WORKERS
+        )
 
         self._cancel_event = threading.Event()
-        self._pause_event = threading.Event()
-        self._pause_event.clear()
+        # Guards _paused; notified on pause/resume/cancel and whenever a sample finishes,
+        # so the export loop sleeps until something it cares about changes.
+        self._state_cond = threading.Condition()
+        self._paused = False
         self._start_time: float | None = None
         self._processed_count: int = 0
+        self._source_duration: float | None = None
 
     def cancel(self) -> None:
         """Request cancellation."""
 
         self._cancel_event.set()
+        with self._state_cond:
+            self._state_cond.notify_all()
 
     def pause(self) -> None:
         """Pause the export loop."""
 
-        self._pause_event.set()
+        with self._state_cond:
+            self._paused = True
         self.state_changed.emit("paused")
 
     def resume(self) -> None:
         """Resume a paused export loop."""
 
-        if self._pause_event.is_set():
-            self._pause_event.clear()
+        with self._state_cond:
+            was_paused = self._paused
+            self._paused = False
+            self._state_cond.notify_all()
+        if was_paused:
             self.state_changed.emit("running")
 
     def run(self) -> None:
@@ -142,40 +177,116 @@ class ExportWorker(QObject):
         processed = 0
         resume_snapshot = dict(self._resume_state)
         remaining_ids: list[str] = []
+        # Membership checks go through the set; the list keeps the reporting order.
+        seen_remaining: set[str] = set()
+        finished_ids: set[str] = set()
 
         ensure_dir = self._output_dir
         ensure_dir.mkdir(parents=True, exist_ok=True)
 
         self._start_time = time.monotonic()
-        for task in self._tasks:
-            if self._cancel_event.is_set():
-                remaining_ids.append(task.sample_id)
-                break
+        self._source_duration = self._probe_source_duration()
+        pending = iter(self._tasks)
+        exhausted = False
+        # The next task, planned but not yet started, and the output paths it will write.
+        held: tuple[_ExportTask, EffectiveSampleSettings, tuple[Path, ...]] | None = None
+        # Templates may render the same path for several samples; such samples run one at
+        # a time, in batch order, so the last one still wins as in a serial export.
+        busy_paths: set[str] = set()
+        in_flight: dict[Future[ExportSampleResult], tuple[_ExportTask, frozenset[str]]] = {}
+        done_queue: deque[Future[ExportSampleResult]] = deque()
+
+        def on_done(future: Future[ExportSampleResult]) -> None:
+            with self._state_cond:
+                done_queue.append(future)
+                self._state_cond.notify_all()
+
+        def can_start() -> bool:
+            return (
+                not exhausted
+                and len(in_flight) < self._max_workers
+                and (not self._paused or self._cancel_event.is_set())
+                and (held is None or busy_paths.isdisjoint(map(_path_key, held[2])))
+            )
 
-            while self._pause_event.is_set() and not self._cancel_event.is_set():
-                time.sleep(0.1)
-
-            self.sample_started.emit(task.sample_id, task.index)
-            result = self._process_task(task)
-
-            if result.success:
-                completed_results.append(result)
-                resume_snapshot[task.sample_id] = "completed"
-            else:
-                failed_results.append(result)
-                resume_snapshot[task.sample_id] = "failed"
-                if task.sample_id not in remaining_ids:
-                    remaining_ids.append(task.sample_id)
-
-            processed += 1
-            self._processed_count = processed
-            percent = processed / total if total else 1.0
-            self.sample_finished.emit(result)
-            self.progress.emit(percent, processed, total)
-
-        # Append remaining tasks when cancelled mid-loop
-        seen_remaining = set(remaining_ids)
-        for task in self._tasks[processed:]:
+        last_progress_emit = float("-inf")
+        progress_pending = False
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="export"
+        ) as executor:
+            while True:
+                # Start tasks only while there is a free worker, so pausing or cancelling
+                # holds back new samples the same way the serial loop did.
+                while not exhausted and len(in_flight) < self._max_workers:
+                    if self._cancel_event.is_set():
+                        exhausted = True
+                        break
+                    if self._paused:
+                        break
+                    if held is None:
+                        task = next(pending, None)
+                        if task is None:
+                            exhausted = True
+                            break
+                        held = self._plan_task(task)
+                    task, settings, output_paths = held
+                    path_keys = frozenset(map(_path_key, output_paths))
+                    if not busy_paths.isdisjoint(path_keys):
+                        # Wait for the sample already writing one of these files.
+                        break
+                    held = None
+                    busy_paths.update(path_keys)
+                    self.sample_started.emit(task.sample_id, task.index)
+                    future = executor.submit(self._process_task, task, settings, output_paths)
+                    in_flight[future] = (task, path_keys)
+                    future.add_done_callback(on_done)
+
+                if exhausted and not in_flight:
+                    break
+
+                with self._state_cond:
+                    while not done_queue and not can_start():
+                        self._state_cond.wait()
+                    done = list(done_queue)
+                    done_queue.clear()
+
+                # Results are handled here on the worker thread, so signals keep the
+                # same emitting thread and arrive in completion order.
+                for future in done:
+                    task, path_keys = in_flight.pop(future)
+                    busy_paths.difference_update(path_keys)
+                    result = future.result()
+                    finished_ids.add(task.sample_id)
+
+                    if result.success:
+                        completed_results.append(result)
+                        resume_snapshot[task.sample_id] = "completed"
+                    else:
+                        failed_results.append(result)
+                        resume_snapshot[task.sample_id] = "failed"
+                        if task.sample_id not in seen_remaining:
+                            remaining_ids.append(task.sample_id)
+                            seen_remaining.add(task.sample_id)
+
+                    processed += 1
+                    self._processed_count = processed
+                    self.sample_finished.emit(result)
+                    now = time.monotonic()
+                    if now - last_progress_emit >= _PROGRESS_INTERVAL_S or processed == total:
+                        self.progress.emit(processed / total, processed, total)
+                        last_progress_emit = now
+                        progress_pending = False
+                    else:
+                        progress_pending = True
+
+        if progress_pending:
+            # Cancelled before the last sample: still report where the batch stopped.
+            self.progress.emit(processed / total, processed, total)
+
+        # Append tasks that never ran when cancelled mid-batch
+        for task in self._tasks:
+            if task.sample_id in finished_ids:
+                continue
             if task.sample_id in resume_snapshot and resume_snapshot[task.sample_id] == "completed":
                 continue
             if task.sample_id not in seen_remaining:
@@ -195,31 +306,56 @@ class ExportWorker(QObject):
         )
         return summary
 
-    def _process_task(self, task: _ExportTask) -> ExportSampleResult:
-        override = task.override
-        formats = self._resolve_formats(override)
-        result = ExportSampleResult(sample_id=task.sample_id, index=task.index, formats=formats)
+    def _probe_source_duration(self) -> float | None:
+        """Probe the source once per batch instead of once per exported file."""
 
-        for fmt in formats:
+        try:
+            return float(get_audio_info(self._audio_path).get("duration", 0.0))
+        except (FFmpegError, ValueError) as exc:
+            # Leave it to export_sample to probe again and report the failure per sample.
+            logger.debug("Probing %s before export failed: %s", self._audio_path, exc)
+            return None
+
+    def _plan_task(
+        self, task: _ExportTask
+    ) -> tuple[_ExportTask, EffectiveSampleSettings, tuple[Path, ...]]:
+        """Resolve a task's settings and the output path of each of its formats."""
+
+        settings = resolve_sample_settings(
+            self._batch_settings, task.override, self._default_formats
+        )
+        output_paths = tuple(
+            self._build_output_path(task, settings, fmt) for fmt in settings.formats
+        )
+        return task, settings, output_paths
+
+    def _process_task(
+        self, task: _ExportTask, settings: EffectiveSampleSettings, output_paths: tuple[Path, ...]
+    ) -> ExportSampleResult:
+        result = ExportSampleResult(
+            sample_id=task.sample_id, index=task.index, formats=list(settings.formats)
+        )
+
+        for fmt, output_path in zip(settings.formats, output_paths, strict=True):
             if self._cancel_event.is_set():
                 break
 
-            output_path = self._build_output_path(task, fmt)
             try:
                 export_sample(
                     input_path=self._audio_path,
                     output_path=output_path,
                     segment=task.segment,
-                    pre_pad_ms=self._resolve_pre_pad(override),
-                    post_pad_ms=self._resolve_post_pad(override),
+                    pre_pad_ms=settings.pre_pad_ms,
+                    post_pad_ms=settings.post_pad_ms,
                     format=fmt,
-                    sample_rate=self._resolve_sample_rate(override),
-                    bit_depth=self._resolve_bit_depth(override),
-                    channels=self._resolve_channels(override),
-                    normalize=self._resolve_normalize(override),
-                    bandpass_low_hz=self._resolve_bandpass_low(override),
-                    bandpass_high_hz=self._resolve_bandpass_high(override),
-                    metadata=self._build_metadata(task, override, fmt),
+                    sample_rate=settings.sample_rate_hz,
+                    bit_depth=settings.bit_depth,
+                    channels=settings.channels,
+                    normalize=settings.normalize,
+                    bandpass_low_hz=settings.bandpass_low_hz,
+                    bandpass_high_hz=settings.bandpass_high_hz,
+                    metadata=self._build_metadata(task, settings, fmt),
+                    source_duration=self._source_duration,
                 )
                 result.output_paths.append(output_path)
             except Exception as exc:  # pragma: no cover - defensive
@@ -229,25 +365,19 @@ class ExportWorker(QObject):
 
         return result
 
-    def _build_output_path(self, task: _ExportTask, fmt: str) -> Path:
-        filename = self._render_filename(task, fmt)
+    def _build_output_path(
+        self, task: _ExportTask, settings: EffectiveSampleSettings, fmt: str
+    ) -> Path:
+        filename = self._render_filename(task, settings, fmt)
         return self._output_dir / f"{filename}.{fmt}"
 
-    def _render_filename(self, task: _ExportTask, fmt: str) -> str:
+    def _render_filename(
+        self, task: _ExportTask, settings: EffectiveSampleSettings, fmt: str
+    ) -> str:
         override = task.override
         if override and override.filename:
             return sanitize_filename(override.filename)
 
-        normalize = self._resolve_normalize(override)
-        pre_pad = self._resolve_pre_pad(override)
-        post_pad = self._resolve_post_pad(override)
-        sample_rate = self._resolve_sample_rate(override)
-        bit_depth = self._resolve_bit_depth(override)
-        channels = self._resolve_channels(override)
-        title_value = self._resolve_title_value(task, override)
-        artist = self._resolve_artist(override)
-        album = self._resolve_album(override)
-        year = self._resolve_year(override)
         template = self._batch_settings.filename_template or DEFAULT_FILENAME_TEMPLATE
         return render_filename_from_template(
             template=template,
@@ -257,134 +387,49 @@ class ExportWorker(QObject):
             total=len(self._tasks),
             segment=task.segment,
             fmt=fmt,
-            normalized=normalize,
-            pre_pad_ms=pre_pad,
-            post_pad_ms=post_pad,
-            title=title_value,
-            artist=artist,
-            album=album,
-            year=year,
-            sample_rate_hz=sample_rate,
-            bit_depth=bit_depth,
-            channels=channels,
+            normalized=settings.normalize,
+            pre_pad_ms=settings.pre_pad_ms,
+            post_pad_ms=settings.post_pad_ms,
+            title=settings.title,
+            artist=settings.artist,
+            album=settings.album,
+            year=settings.year,
+            sample_rate_hz=settings.sample_rate_hz,
+            bit_depth=settings.bit_depth,
+            channels=settings.channels,
         )
 
-    def _resolve_formats(self, override: ExportSampleOverride | None) -> list[str]:
-        if override and override.formats:
-            return list(dict.fromkeys(override.formats))
-        return list(dict.fromkeys(self._batch_settings.formats or ["wav"]))
-
-    def _resolve_pre_pad(self, override: ExportSampleOverride | None) -> float:
-        if override and override.pre_pad_ms is not None:
-            return float(override.pre_pad_ms)
-        return float(self._batch_settings.pre_pad_ms)
-
-    def _resolve_post_pad(self, override: ExportSampleOverride | None) -> float:
-        if override and override.post_pad_ms is not None:
-            return float(override.post_pad_ms)
-        return float(self._batch_settings.post_pad_ms)
-
-    def _resolve_normalize(self, override: ExportSampleOverride | None) -> bool:
-        if override and override.normalize is not None:
-            return bool(override.normalize)
-        return bool(self._batch_settings.normalize)
-
-    def _resolve_sample_rate(self, override: ExportSampleOverride | None) -> int | None:
-        if override and override.sample_rate_hz:
-            return int(override.sample_rate_hz)
-        return self._batch_settings.sample_rate_hz
-
-    def _resolve_bit_depth(self, override: ExportSampleOverride | None) -> str | None:
-        if override and override.bit_depth:
-            return override.bit_depth
-        return self._batch_settings.bit_depth
-
-    def _resolve_channels(self, override: ExportSampleOverride | None) -> str | None:
-        if override and override.channels:
-            return override.channels
-        return self._batch_settings.channels
-
-    def _resolve_bandpass_low(self, override: ExportSampleOverride | None) -> float | None:
-        if override and override.bandpass_low_hz is not None:
-            # Check for disabled sentinel (-1.0)
-            if override.bandpass_low_hz == -1.0:
-                return None
-            return float(override.bandpass_low_hz)
-        return self._batch_settings.bandpass_low_hz
-
-    def _resolve_bandpass_high(self, override: ExportSampleOverride | None) -> float | None:
-        if override and override.bandpass_high_hz is not None:
-            # Check for disabled sentinel (-1.0)
-            if override.bandpass_high_hz == -1.0:
-                return None
-            return float(override.bandpass_high_hz)
-        return self._batch_settings.bandpass_high_hz
-
-    def _resolve_title_value(self, task: _ExportTask, override: ExportSampleOverride | None) -> str:
-        if override and override.title:
-            return override.title
-        return derive_sample_title(task.index, task.segment)
-
-    def _resolve_artist(self, override: ExportSampleOverride | None) -> str:
-        if override and override.artist:
-            return override.artist
-        return self._batch_settings.artist
-
-    def _resolve_album(self, override: ExportSampleOverride | None) -> str | None:
-        if override and override.album:
-            return override.album
-        return self._batch_settings.album
-
-    def _resolve_year(self, override: ExportSampleOverride | None) -> int | None:
-        if override and override.year:
-            return override.year
-        return self._batch_settings.year
-
     def _build_metadata(
-        self, task: _ExportTask, override: ExportSampleOverride | None, fmt: str
+        self, task: _ExportTask, settings: EffectiveSampleSettings, fmt: str
     ) -> dict[str, Any]:
-        title_value = self._resolve_title_value(task, override)
-        artist = self._resolve_artist(override)
-        album = self._resolve_album(override)
-        year = self._resolve_year(override)
-        normalize = self._resolve_normalize(override)
-        pre_pad = self._resolve_pre_pad(override)
-        post_pad = self._resolve_post_pad(override)
-        sample_rate = self._resolve_sample_rate(override)
-        bit_depth = self._resolve_bit_depth(override)
-        channels = self._resolve_channels(override)
-
-        context = build_template_context(
-            base_name=self._base_name,
-            sample_id=task.sample_id,
-            index=task.index,
-            total=len(self._tasks),
-            segment=task.segment,
-            fmt=fmt,
-            normalize=normalize,
-            pre_pad_ms=pre_pad,
-            post_pad_ms=post_pad,
-            title=title_value,
-            artist=artist,
-            album=album,
-            year=year,
-            sample_rate_hz=sample_rate,
-            bit_depth=bit_depth,
-            channels=channels,
-        )
-
         metadata: dict[str, Any] = {
-            "title": title_value,
-            "artist": artist,
-            "album": album,
-            "year": year,
+            "title": settings.title or derive_sample_title(task.index, task.segment),
+            "artist": settings.artist,
+            "album": settings.album,
+            "year": settings.year,
             "track": task.index + 1,
             "format": fmt.upper(),
         }
-        notes_template = (
-            override.notes if override and override.notes else self._batch_settings.notes
-        )
+        notes_template = settings.notes
         if notes_template:
+            context = build_template_context(
+                base_name=self._base_name,
+                sample_id=task.sample_id,
+                index=task.index,
+                total=len(self._tasks),
+                segment=task.segment,
+                fmt=fmt,
+                normalize=settings.normalize,
+                pre_pad_ms=settings.pre_pad_ms,
+                post_pad_ms=settings.post_pad_ms,
+                title=settings.title,
+                artist=settings.artist,
+                album=settings.album,
+                year=settings.year,
+                sample_rate_hz=settings.sample_rate_hz,
+                bit_depth=settings.bit_depth,
+                channels=settings.channels,
+            )
             rendered_notes = apply_template(notes_template, context).strip()
             if rendered_notes:
                 metadata["comment"] = rendered_notes
@@ -412,6 +457,7 @@ class ExportManager(QObject):
         resume_state: Mapping[str, str] | None = None,
         output_dir: Path,
         base_name: str | None = None,
+        max_workers: int | None = None,
     ) -> None:
         super().__init__()
         self._audio_path = audio_path
@@ -421,6 +467,7 @@ class ExportManager(QObject):
         self._output_dir = output_dir
         self._base_name = base_name or audio_path.stem
         self._resume_state = dict(resume_state or {})
+        self._max_workers = max_workers
 
         self._thread: QThread | None = None
         self._worker: ExportWorker | None = None
@@ -443,6 +490,7 @@ class ExportManager(QObject):
             batch_settings=self._batch_settings,
             tasks=tasks,
             resume_state=self._resume_state,
+            max_workers=self._max_workers,
         )
         return worker.run_blocking()
 
@@ -460,6 +508,7 @@ class ExportManager(QObject):
             batch_settings=self._batch_settings,
             tasks=tasks,
             resume_state=self._resume_state,
+            max_workers=self._max_workers,
         )
 
         self._thread = QThread(self)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
+from string import Formatter, ascii_letters, digits
 from typing import Any
 
 from spectrosampler.detectors.base import Segment
@@ -11,24 +14,44 @@ from spectrosampler.export import build_sample_filename
 from spectrosampler.utils import sanitize_filename
 
 SupportedExportFormat = str
+# Stored in both override cutoffs to mean "bandpass disabled for this sample"; kept as a float
+# so existing project files keep loading.
+BANDPASS_DISABLED_HZ = -1.0
 DEFAULT_FILENAME_TEMPLATE = "{id}_{title}_start-{start}s_duration-{duration}s"
+_VALID_BIT_DEPTHS = frozenset({None, "16", "24", "32f"})
+_VALID_CHANNELS = frozenset({None, "mono", "stereo"})
+# Template tokens whose rendered value depends on pre/post padding.
+PADDING_TEMPLATE_TOKENS = frozenset(
+    {
+        "pre_pad_ms",
+        "post_pad_ms",
+        "pre_pad_ms_float",
+        "post_pad_ms_float",
+        "start",
+        "end",
+        "duration",
+        "start_seconds",
+        "end_seconds",
+        "duration_seconds",
+        "start_ms",
+        "end_ms",
+        "duration_ms",
+    }
+)
 
 
 def _format_list(value: Iterable[str] | None) -> list[str]:
     """Coerce an iterable of strings into a unique, ordered list."""
     if not value:
         return ["wav"]
-    seen: set[str] = set()
-    result: list[str] = []
-    for item in value:
-        if not isinstance(item, str):
-            continue
-        lowered = item.strip().lower()
-        if not lowered or lowered in seen:
-            continue
-        seen.add(lowered)
-        result.append(lowered)
-    return result or ["wav"]
+    lowered = (item.strip().lower() for item in value if isinstance(item, str))
+    # dict.fromkeys de-duplicates while keeping first-seen order.
+    return list(dict.fromkeys(name for name in lowered if name)) or ["wav"]
+
+
+def normalize_formats(value: Iterable[str] | None) -> tuple[str, ...]:
+    """Return ``value`` as the ordered, de-duplicated format tuple exports use."""
+    return tuple(_format_list(value))
 
 
 def compute_sample_id(index: int, segment: Segment) -> str:
@@ -42,11 +65,18 @@ def compute_sample_id(index: int, segment: Segment) -> str:
     return f"{index}-{segment.start:.6f}-{segment.end:.6f}"
 
 
+@lru_cache(maxsize=256)
+def _placeholder(key: str) -> str:
+    """Return ``{key}``, shared across renders so repeated misses do not allocate."""
+
+    return "{" + key + "}"
+
+
 class _SafeDict(dict[str, Any]):
     """Dictionary that returns template placeholders verbatim when missing."""
 
     def __missing__(self, key: str) -> str:
-        return "{" + key + "}"
+        return _placeholder(key)
 
 
 def derive_sample_title(index: int, segment: Segment, fallback: str = "sample") -> str:
@@ -67,6 +97,195 @@ def _format_maybe(value: Any) -> Any:
     return value
 
 
+class _TemplateContext(Mapping[str, Any]):
+    """Read-only token mapping whose values are computed on first lookup.
+
+    A template typically references a handful of the available tokens, so each one is
+    only formatted when a template (or caller) asks for it, then memoised.
+    """
+
+    __slots__ = (
+        "_base_name",
+        "_sample_id",
+        "_index",
+        "_total",
+        "_segment",
+        "_attrs",
+        "_fmt",
+        "_normalize",
+        "_pre_pad_ms",
+        "_post_pad_ms",
+        "_title",
+        "_artist",
+        "_album",
+        "_year",
+        "_sample_rate_hz",
+        "_bit_depth",
+        "_channels",
+        "_start_padded",
+        "_end_padded",
+        "_duration_padded",
+        "_start_original",
+        "_end_original",
+        "_duration_original",
+        "_attr_tokens",
+        "_cache",
+    )
+
+    def __init__(
+        self,
+        *,
+        base_name: str,
+        sample_id: str,
+        index: int,
+        total: int,
+        segment: Segment,
+        fmt: str,
+        normalize: bool,
+        pre_pad_ms: float,
+        post_pad_ms: float,
+        title: str | None,
+        artist: str | None,
+        album: str | None,
+        year: int | None,
+        sample_rate_hz: int | None,
+        bit_depth: str | None,
+        channels: str | None,
+    ) -> None:
+        self._base_name = base_name
+        self._sample_id = sample_id
+        self._index = index
+        self._total = total
+        self._segment = segment
+        self._attrs: Mapping[Any, Any] = getattr(segment, "attrs", {}) or {}
+        self._fmt = fmt
+        self._normalize = normalize
+        self._pre_pad_ms = pre_pad_ms
+        self._post_pad_ms = post_pad_ms
+        self._title = title
+        self._artist = artist
+        self._album = album
+        self._year = year
+        self._sample_rate_hz = sample_rate_hz
+        self._bit_depth = bit_depth
+        self._channels = channels
+
+        # Calculate padded times (after padding is applied)
+        self._start_padded, self._end_padded, self._duration_padded = _padded_times(
+            segment, pre_pad_ms, post_pad_ms
+        )
+
+        # Original segment times (for backward compatibility if needed)
+        self._start_original = float(segment.start)
+        self._end_original = float(segment.end)
+        self._duration_original = max(0.0, self._end_original - self._start_original)
+
+        self._attr_tokens: dict[str, Any] | None = None
+        self._cache: dict[str, Any] = {}
+
+    def _attr_token_map(self) -> dict[str, Any]:
+        # Arbitrary segment attrs (excluding name to avoid conflicts with title token)
+        if self._attr_tokens is None:
+            tokens: dict[str, Any] = {}
+            for key, value in self._attrs.items():
+                if key in {"name"}:
+                    continue
+                tokens.setdefault(f"attr_{key}", value)
+            self._attr_tokens = tokens
+        return self._attr_tokens
+
+    def __getitem__(self, key: str) -> Any:
+        cache = self._cache
+        if key in cache:
+            return cache[key]
+        compute = _TEMPLATE_TOKENS.get(key)
+        if compute is not None:
+            value = compute(self)
+        elif key.startswith("attr_") and key in self._attr_token_map():
+            value = _format_maybe(self._attr_token_map()[key])
+        else:
+            raise KeyError(key)
+        cache[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        if key in _TEMPLATE_TOKENS:
+            return True
+        return isinstance(key, str) and key.startswith("attr_") and key in self._attr_token_map()
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _TEMPLATE_TOKENS
+        yield from self._attr_token_map()
+
+    def __len__(self) -> int:
+        return len(_TEMPLATE_TOKENS) + len(self._attr_token_map())
+
+
+_TEMPLATE_TOKENS: dict[str, Callable[[_TemplateContext], Any]] = {
+    "basename": lambda c: c._base_name,
+    "sample_id": lambda c: c._sample_id,
+    "id": lambda c: f"{c._index:04d}",  # 0-based: 0000-9999 (supports up to 10000 samples)
+    "index": lambda c: c._index + 1,  # 1-based for backward compatibility
+    "zero_index": lambda c: c._index,
+    "total": lambda c: c._total,
+    "title": lambda c: c._title or derive_sample_title(c._index, c._segment),
+    "artist": lambda c: c._artist or "",
+    "album": lambda c: c._album or "",
+    "year": lambda c: str(c._year) if c._year is not None else "",
+    "format": lambda c: c._fmt.lower(),
+    "format_upper": lambda c: c._fmt.upper(),
+    "normalize": lambda c: c._normalize,
+    "normalize_suffix": lambda c: "norm" if c._normalize else "",
+    "pre_pad_ms": lambda c: f"{c._pre_pad_ms:.1f}",
+    "post_pad_ms": lambda c: f"{c._post_pad_ms:.1f}",
+    "pre_pad_ms_float": lambda c: float(c._pre_pad_ms),
+    "post_pad_ms_float": lambda c: float(c._post_pad_ms),
+    # Padded times (after padding is applied) - these are the main tokens
+    "start": lambda c: f"{c._start_padded:.3f}",
+    "end": lambda c: f"{c._end_padded:.3f}",
+    "duration": lambda c: f"{c._duration_padded:.3f}",
+    "start_seconds": lambda c: c._start_padded,
+    "end_seconds": lambda c: c._end_padded,
+    "duration_seconds": lambda c: c._duration_padded,
+    "start_ms": lambda c: int(round(c._start_padded * 1000)),
+    "end_ms": lambda c: int(round(c._end_padded * 1000)),
+    "duration_ms": lambda c: int(round(c._duration_padded * 1000)),
+    # Original segment times (for reference)
+    "start_original": lambda c: f"{c._start_original:.3f}",
+    "end_original": lambda c: f"{c._end_original:.3f}",
+    "duration_original": lambda c: f"{c._duration_original:.3f}",
+    "start_original_seconds": lambda c: c._start_original,
+    "end_original_seconds": lambda c: c._end_original,
+    "duration_original_seconds": lambda c: c._duration_original,
+    "detector": lambda c: c._segment.detector or "",
+    "score": lambda c: _score_token(c._segment),
+    "enabled": lambda c: _enabled_token(c._attrs),
+    "sample_rate_hz": lambda c: c._sample_rate_hz or "",
+    "bit_depth": lambda c: c._bit_depth or "",
+    "channels": lambda c: c._channels or "",
+}
+
+
+def _padded_times(
+    segment: Segment, pre_pad_ms: float, post_pad_ms: float
+) -> tuple[float, float, float]:
+    """Return ``(start, end, duration)`` seconds after padding, clamped at zero."""
+
+    start = max(0.0, float(segment.start) - float(pre_pad_ms) / 1000.0)
+    end = float(segment.end) + float(post_pad_ms) / 1000.0
+    return start, end, max(0.0, end - start)
+
+
+def _score_token(segment: Segment) -> Any:
+    score = getattr(segment, "score", None)
+    return score if score is not None else ""
+
+
+def _enabled_token(attrs: Mapping[Any, Any]) -> bool:
+    enabled = attrs.get("enabled")
+    return True if enabled is None else bool(enabled)
+
+
 def build_template_context(
     *,
     base_name: str,
@@ -85,84 +304,160 @@ def build_template_context(
     sample_rate_hz: int | None = None,
     bit_depth: str | None = None,
     channels: str | None = None,
-) -> dict[str, Any]:
-    """Construct the token context used for templating filenames and notes."""
+) -> Mapping[str, Any]:
+    """Construct the token context used for templating filenames and notes.
+
+    Token values are computed lazily, so only the tokens a template references are
+    formatted.
+    """
+
+    return _TemplateContext(
+        base_name=base_name,
+        sample_id=sample_id,
+        index=index,
+        total=total,
+        segment=segment,
+        fmt=fmt,
+        normalize=normalize,
+        pre_pad_ms=pre_pad_ms,
+        post_pad_ms=post_pad_ms,
+        title=title,
+        artist=artist,
+        album=album,
+        year=year,
+        sample_rate_hz=sample_rate_hz,
+        bit_depth=bit_depth,
+        channels=channels,
+    )
+
+
+@lru_cache(maxsize=64)
+def template_fields(template: str) -> frozenset[str]:
+    """Return the top-level token names referenced by a template.
+
+    Malformed templates yield an empty set; rendering them falls back to legacy naming,
+    which does not depend on any token.
+    """
+
+    names: set[str] = set()
+    try:
+        for _literal, field_name, _spec, _conversion in Formatter().parse(template):
+            if field_name:
+                names.add(field_name.split(".", 1)[0].split("[", 1)[0])
+    except ValueError:
+        return frozenset()
+    return frozenset(names)
+
+
+_CONVERTERS: dict[str, Callable[[Any], str]] = {"r": repr, "s": str, "a": ascii}
+_TemplatePart = tuple[str, str | None, Callable[[_TemplateContext], Any] | None, str | None, str]
+# Tokens that always render as ASCII digits, ``-``, ``_``, single inner dots or fixed words,
+# so they can never introduce characters that ``sanitize_filename`` would rewrite.
+_PRESANITIZED_TOKENS = frozenset(
+    {
+        "id",
+        "index",
+        "zero_index",
+        "total",
+        "normalize",
+        "normalize_suffix",
+        "pre_pad_ms",
+        "post_pad_ms",
+        "start",
+        "end",
+        "duration",
+        "start_ms",
+        "end_ms",
+        "duration_ms",
+        "start_original",
+        "end_original",
+        "duration_original",
+    }
+)
+_PRESANITIZED_LITERAL_CHARS = frozenset(ascii_letters + digits + "_-")
+# Mirrors the ``sanitize_filename`` default used for rendered names.
+_MAX_FILENAME_LENGTH = 200
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledTemplate:
+    """A template pre-split into ``(literal, key, getter, conversion, format_spec)`` parts.
+
+    Renders exactly like ``template.format_map(_SafeDict(context))``: unknown keys come
+    back as ``{key}`` before conversion and the format spec are applied.
+
+    ``needs_sanitize`` is False when every literal and token can only produce characters
+    that ``sanitize_filename`` leaves untouched.
+    """
+
+    parts: tuple[_TemplatePart, ...]
+    needs_sanitize: bool = True
+
+    def render(self, context: Mapping[str, Any]) -> str:
+        # Built-in tokens were resolved to their getters at compile time, so a lazy
+        # context is read without going through the Mapping protocol or its memo.
+        direct = type(context) is _TemplateContext
+        pieces: list[str] = []
+        append = pieces.append
+        for literal, key, getter, conversion, spec in self.parts:
+            if literal:
+                append(literal)
+            if key is None:
+                continue
+            if direct and getter is not None:
+                value = getter(context)
+            else:
+                try:
+                    value = context[key]
+                except KeyError:
+                    value = _placeholder(key)
+            if conversion is not None:
+                value = _CONVERTERS[conversion](value)
+            if not spec and type(value) is str:
+                append(value)
+            else:
+                append(format(value, spec))
+        return "".join(pieces)
 
-    attrs = getattr(segment, "attrs", {}) or {}
-    # Calculate padded times (after padding is applied)
-    pre_pad_sec = float(pre_pad_ms) / 1000.0
-    post_pad_sec = float(post_pad_ms) / 1000.0
-    start_padded = max(0.0, float(segment.start) - pre_pad_sec)
-    end_padded = float(segment.end) + post_pad_sec
-    duration_padded = max(0.0, end_padded - start_padded)
-
-    # Original segment times (for backward compatibility if needed)
-    start_original = float(segment.start)
-    end_original = float(segment.end)
-    duration_original = max(0.0, end_original - start_original)
-
-    resolved_title = title or derive_sample_title(index, segment)
-    enabled = attrs.get("enabled")
-    score = getattr(segment, "score", None)
 
-    context: dict[str, Any] = {
-        "basename": base_name,
-        "sample_id": sample_id,
-        "id": f"{index:04d}",  # 0-based: 0000-9999 (supports up to 10000 samples)
-        "index": index + 1,  # 1-based for backward compatibility
-        "zero_index": index,
-        "total": total,
-        "title": resolved_title,
-        "artist": artist or "",
-        "album": album or "",
-        "year": str(year) if year is not None else "",
-        "format": fmt.lower(),
-        "format_upper": fmt.upper(),
-        "normalize": normalize,
-        "normalize_suffix": "norm" if normalize else "",
-        "pre_pad_ms": f"{pre_pad_ms:.1f}",
-        "post_pad_ms": f"{post_pad_ms:.1f}",
-        "pre_pad_ms_float": float(pre_pad_ms),
-        "post_pad_ms_float": float(post_pad_ms),
-        # Padded times (after padding is applied) - these are the main tokens
-        "start": f"{start_padded:.3f}",
-        "end": f"{end_padded:.3f}",
-        "duration": f"{duration_padded:.3f}",
-        "start_seconds": start_padded,
-        "end_seconds": end_padded,
-        "duration_seconds": duration_padded,
-        "start_ms": int(round(start_padded * 1000)),
-        "end_ms": int(round(end_padded * 1000)),
-        "duration_ms": int(round(duration_padded * 1000)),
-        # Original segment times (for reference)
-        "start_original": f"{start_original:.3f}",
-        "end_original": f"{end_original:.3f}",
-        "duration_original": f"{duration_original:.3f}",
-        "start_original_seconds": start_original,
-        "end_original_seconds": end_original,
-        "duration_original_seconds": duration_original,
-        "detector": segment.detector or "",
-        "score": score if score is not None else "",
-        "enabled": True if enabled is None else bool(enabled),
-        "sample_rate_hz": sample_rate_hz or "",
-        "bit_depth": bit_depth or "",
-        "channels": channels or "",
-    }
-    # Merge arbitrary attrs (excluding name to avoid conflicts with title token)
-    for key, value in attrs.items():
-        if key in {"name"}:
-            continue
-        token_key = f"attr_{key}"
-        if token_key not in context:
-            context[token_key] = _format_maybe(value)
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> _CompiledTemplate | None:
+    """Parse ``template`` once; ``None`` means it needs the full ``str.format_map`` path.
 
-    return context
+    Only plain named fields are compiled. Attribute/index access, positional fields,
+    nested replacement fields in a format spec and malformed templates are left to
+    ``format_map`` so they behave (and fail) exactly as before.
+    """
+
+    parts: list[_TemplatePart] = []
+    try:
+        for literal, field_name, spec, conversion in Formatter().parse(template):
+            if field_name is None:
+                parts.append((literal, None, None, None, ""))
+                continue
+            if not field_name.isidentifier() or "{" in (spec or ""):
+                return None
+            if conversion is not None and conversion not in _CONVERTERS:
+                return None
+            getter = _TEMPLATE_TOKENS.get(field_name)
+            parts.append((literal, field_name, getter, conversion, spec or ""))
+    except ValueError:
+        return None
+    needs_sanitize = any(
+        not _PRESANITIZED_LITERAL_CHARS.issuperset(literal)
+        or (key is not None and (key not in _PRESANITIZED_TOKENS or conversion or spec))
+        for literal, key, _getter, conversion, spec in parts
+    )
+    return _CompiledTemplate(tuple(parts), needs_sanitize)
 
 
 def apply_template(template: str, context: Mapping[str, Any]) -> str:
     """Safely render a template against the provided context."""
 
-    return template.format_map(_SafeDict(context))
+    compiled = _compile_template(template)
+    if compiled is None:
+        return template.format_map(_SafeDict(context))
+    return compiled.render(context)
 
 
 def render_filename_from_template(
@@ -188,6 +483,14 @@ def render_filename_from_template(
     """Render a filename from the export template, falling back to legacy naming."""
 
     try:
+        if template == DEFAULT_FILENAME_TEMPLATE:
+            # The stock template is what most batches use; format it directly rather than
+            # building a token context for four values.
+            start, _end, duration = _padded_times(segment, pre_pad_ms, post_pad_ms)
+            sample_title = title or derive_sample_title(index, segment)
+            return sanitize_filename(
+                f"{index:04d}_{sample_title}_start-{start:.3f}s_duration-{duration:.3f}s".strip()
+            )
         context = build_template_context(
             base_name=base_name,
             sample_id=sample_id,
@@ -211,6 +514,17 @@ def render_filename_from_template(
     except Exception:
         rendered = ""
 
+    compiled = _compile_template(template)
+    if (
+        rendered
+        and compiled is not None
+        and not compiled.needs_sanitize
+        and len(rendered) <= _MAX_FILENAME_LENGTH
+        # Short leading stems could spell a reserved device name such as ``COM1``.
+        and len(rendered.partition(".")[0]) > 4
+    ):
+        return rendered
+
     if not rendered:
         rendered = build_sample_filename(
             base_name,
@@ -254,10 +568,10 @@ class ExportBatchSettings:
         elif not isinstance(sample_rate, int):
             sample_rate = None
         bit_depth = data.get("bit_depth")
-        if bit_depth not in {None, "16", "24", "32f"}:
+        if bit_depth not in _VALID_BIT_DEPTHS:
             bit_depth = None
         channels = data.get("channels")
-        if channels not in {None, "mono", "stereo"}:
+        if channels not in _VALID_CHANNELS:
             channels = None
         pre_pad = float(data.get("pre_pad_ms", 0.0) or 0.0)
         post_pad = float(data.get("post_pad_ms", 0.0) or 0.0)
@@ -295,6 +609,7 @@ class ExportBatchSettings:
                 year_value = int(year)
         except (TypeError, ValueError):
             year_value = None
+        notes = data.get("notes")
 
         return cls(
             formats=formats,
@@ -311,7 +626,7 @@ class ExportBatchSettings:
             artist=artist,
             album=album,
             year=year_value,
-            notes=str(data.get("notes")) if data.get("notes") else None,
+            notes=str(notes) if notes else None,
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -335,6 +650,26 @@ class ExportBatchSettings:
         }
 
 
+class BandpassMode(IntEnum):
+    """How a per-sample override treats the batch bandpass filter.
+
+    Values match the order of the per-sample bandpass combo box.
+    """
+
+    GLOBAL = 0
+    ENABLED = 1
+    DISABLED = 2
+
+
+def _resolve_cutoff(override_hz: float | None, batch_hz: float | None) -> float | None:
+    """Layer one override cutoff over the batch cutoff, honouring the disabled marker."""
+    if override_hz is None:
+        return batch_hz
+    if override_hz == BANDPASS_DISABLED_HZ:
+        return None
+    return float(override_hz)
+
+
 @dataclass(slots=True)
 class ExportSampleOverride:
     """Per-sample export overrides that supplement global batch settings."""
@@ -381,6 +716,10 @@ class ExportSampleOverride:
             except (TypeError, ValueError):
                 return None
 
+        def _opt_str(key: str) -> str | None:
+            value = data.get(key)
+            return str(value) if value else None
+
         formats = data.get("formats")
         if formats is not None:
             formats = _format_list(formats)
@@ -396,12 +735,12 @@ class ExportSampleOverride:
             normalize=bool(data["normalize"]) if "normalize" in data else None,
             bandpass_low_hz=_opt_float(data.get("bandpass_low_hz")),
             bandpass_high_hz=_opt_float(data.get("bandpass_high_hz")),
-            filename=str(data.get("filename")) if data.get("filename") else None,
-            title=str(data.get("title")) if data.get("title") else None,
-            artist=str(data.get("artist")) if data.get("artist") else None,
-            album=str(data.get("album")) if data.get("album") else None,
+            filename=_opt_str("filename"),
+            title=_opt_str("title"),
+            artist=_opt_str("artist"),
+            album=_opt_str("album"),
             year=_opt_int(data.get("year")),
-            notes=str(data.get("notes")) if data.get("notes") else None,
+            notes=_opt_str("notes"),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -439,29 +778,128 @@ class ExportSampleOverride:
             payload["notes"] = self.notes
         return payload
 
+    @property
+    def bandpass_mode(self) -> BandpassMode:
+        """Classify the stored bandpass cutoffs."""
+        low = self.bandpass_low_hz
+        high = self.bandpass_high_hz
+        if low == BANDPASS_DISABLED_HZ and high == BANDPASS_DISABLED_HZ:
+            return BandpassMode.DISABLED
+        if (
+            low is not None
+            and high is not None
+            and low != BANDPASS_DISABLED_HZ
+            and high != BANDPASS_DISABLED_HZ
+        ):
+            return BandpassMode.ENABLED
+        return BandpassMode.GLOBAL
+
+    def resolve_bandpass(
+        self, batch_low_hz: float | None, batch_high_hz: float | None
+    ) -> tuple[float | None, float | None]:
+        """Return the (low, high) cutoffs to apply, with ``None`` meaning no edge."""
+        return (
+            _resolve_cutoff(self.bandpass_low_hz, batch_low_hz),
+            _resolve_cutoff(self.bandpass_high_hz, batch_high_hz),
+        )
+
     def is_empty(self) -> bool:
         """Return True when no override fields are set."""
 
-        return all(
-            getattr(self, field) in (None, [], "")
-            for field in (
-                "formats",
-                "sample_rate_hz",
-                "bit_depth",
-                "channels",
-                "pre_pad_ms",
-                "post_pad_ms",
-                "normalize",
-                "bandpass_low_hz",
-                "bandpass_high_hz",
-                "filename",
-                "title",
-                "artist",
-                "album",
-                "year",
-                "notes",
-            )
+        return (
+            not self.formats
+            and self.sample_rate_hz is None
+            and not self.bit_depth
+            and not self.channels
+            and self.pre_pad_ms is None
+            and self.post_pad_ms is None
+            and self.normalize is None
+            and self.bandpass_low_hz is None
+            and self.bandpass_high_hz is None
+            and not self.filename
+            and not self.title
+            and not self.artist
+            and not self.album
+            and self.year is None
+            and not self.notes
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class EffectiveSampleSettings:
+    """Batch settings with one sample's overrides layered on top."""
+
+    formats: tuple[str, ...]
+    pre_pad_ms: float
+    post_pad_ms: float
+    normalize: bool
+    sample_rate_hz: int | None
+    bit_depth: str | None
+    channels: str | None
+    bandpass_low_hz: float | None
+    bandpass_high_hz: float | None
+    # Override title only; callers derive the default title from the segment.
+    title: str | None
+    artist: str
+    album: str | None
+    year: int | None
+    notes: str | None
+
+
+def resolve_sample_settings(
+    batch: ExportBatchSettings,
+    override: ExportSampleOverride | None,
+    default_formats: tuple[str, ...] | None = None,
+) -> EffectiveSampleSettings:
+    """Return the settings one sample exports with, shared by the dialog and the exporter.
+
+    Callers resolving many samples against one batch can pass ``default_formats`` (the
+    batch formats already run through :func:`normalize_formats`) so only override
+    formats are normalised per sample.
+    """
+
+    if default_formats is None:
+        default_formats = normalize_formats(batch.formats)
+    if override is None:
+        return EffectiveSampleSettings(
+            formats=default_formats,
+            pre_pad_ms=float(batch.pre_pad_ms or 0.0),
+            post_pad_ms=float(batch.post_pad_ms or 0.0),
+            normalize=bool(batch.normalize),
+            sample_rate_hz=batch.sample_rate_hz,
+            bit_depth=batch.bit_depth,
+            channels=batch.channels,
+            bandpass_low_hz=batch.bandpass_low_hz,
+            bandpass_high_hz=batch.bandpass_high_hz,
+            title=None,
+            artist=batch.artist,
+            album=batch.album,
+            year=batch.year,
+            notes=batch.notes,
         )
+    bandpass_low_hz, bandpass_high_hz = override.resolve_bandpass(
+        batch.bandpass_low_hz, batch.bandpass_high_hz
+    )
+    pre_pad_ms = override.pre_pad_ms if override.pre_pad_ms is not None else batch.pre_pad_ms
+    post_pad_ms = override.post_pad_ms if override.post_pad_ms is not None else batch.post_pad_ms
+    return EffectiveSampleSettings(
+        formats=normalize_formats(override.formats) if override.formats else default_formats,
+        pre_pad_ms=float(pre_pad_ms or 0.0),
+        post_pad_ms=float(post_pad_ms or 0.0),
+        normalize=bool(override.normalize if override.normalize is not None else batch.normalize),
+        sample_rate_hz=(
+            int(override.sample_rate_hz) if override.sample_rate_hz else batch.sample_rate_hz
+        ),
+        bit_depth=override.bit_depth or batch.bit_depth,
+        channels=override.channels or batch.channels,
+        bandpass_low_hz=bandpass_low_hz,
+        bandpass_high_hz=bandpass_high_hz,
+        title=override.title or None,
+        artist=override.artist or batch.artist,
+        album=override.album or batch.album,
+        year=override.year or batch.year,
+        notes=override.notes or batch.notes,
+    )
 
 
 def serialise_overrides(overrides: Iterable[ExportSampleOverride]) -> list[dict[str, Any]]:
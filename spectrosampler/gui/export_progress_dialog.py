@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -15,6 +16,9 @@ from PySide6.QtWidgets import (
 
 from spectrosampler.gui.export_manager import ExportManager, ExportSampleResult, ExportSummary
 
+# Log lines arriving inside this window are appended to the text area in one batch.
+LOG_FLUSH_INTERVAL_MS = 50
+
 
 class ExportProgressDialog(QDialog):
     """Modal dialog that tracks export progress and exposes pause/resume controls."""
@@ -33,10 +37,20 @@ class ExportProgressDialog(QDialog):
         self._progress_bar.setValue(0)
 
         self._status_label = QLabel("Preparing export…")
+        # Last values shown, so repeated progress signals skip redundant widget updates.
+        self._last_percent = 0
+        self._last_processed = -1
 
         self._log_area = QPlainTextEdit()
         self._log_area.setReadOnly(True)
         self._log_area.setMaximumBlockCount(1000)
+        # Per-sample log lines are buffered and appended together so a fast batch updates
+        # the text document a few times per second instead of once per signal.
+        self._log_buffer: list[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
 
         button_layout = QHBoxLayout()
         self._pause_button = QPushButton("Pause")
@@ -79,8 +93,13 @@ class ExportProgressDialog(QDialog):
         manager.error.connect(self._on_error)
 
     def _on_progress(self, percent: float, processed: int, total: int) -> None:
-        self._progress_bar.setValue(int(percent * 100))
-        self._status_label.setText(f"Exported {processed} of {total} sample(s)")
+        value = int(percent * 100)
+        if value != self._last_percent:
+            self._last_percent = value
+            self._progress_bar.setValue(value)
+        if processed != self._last_processed:
+            self._last_processed = processed
+            self._status_label.setText(f"Exported {processed} of {total} sample(s)")
 
     def _on_sample_started(self, sample_id: str, index: int) -> None:
         self._append_log(f"Starting sample {index + 1} ({sample_id})")
@@ -112,6 +131,7 @@ class ExportProgressDialog(QDialog):
             self._append_log("Export cancelled before completion.")
         if summary.failed:
             self._append_log(f"{len(summary.failed)} sample(s) failed.")
+        self._flush_log()
         self._pause_button.setEnabled(False)
         self._resume_button.setEnabled(False)
         self._cancel_button.setEnabled(False)
@@ -122,6 +142,7 @@ class ExportProgressDialog(QDialog):
 
     def _on_error(self, message: str) -> None:
         self._append_log(f"Export failed: {message}")
+        self._flush_log()
         self._pause_button.setEnabled(False)
         self._resume_button.setEnabled(False)
         self._cancel_button.setEnabled(False)
@@ -151,7 +172,15 @@ class ExportProgressDialog(QDialog):
     # ------------------------------------------------------------------ #
 
     def _append_log(self, message: str) -> None:
-        self._log_area.appendPlainText(message)
+        self._log_buffer.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        self._log_flush_timer.stop()
+        if self._log_buffer:
+            self._log_area.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     @property
     def summary(self) -> ExportSummary | None:
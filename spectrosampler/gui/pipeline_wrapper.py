@@ -272,5 +272,6 @@ class PipelineWrapper:
             overrides=overrides,
             output_dir=output_dir,
             base_name=self.current_audio_path.stem,
+            max_workers=getattr(self.settings, "max_workers", None),
         )
         return manager
@@ -1,5 +1,6 @@
 """Shared UI utility functions for consistent styling across the application."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import Qt
@@ -197,3 +198,22 @@ def apply_checkbox_styling_to_all_checkboxes(parent_widget) -> None:
     checkbox_style = apply_checkbox_styling()
     for widget in parent_widget.findChildren(QCheckBox):
         widget.setStyleSheet(checkbox_style)
+
+
+@lru_cache(maxsize=1)
+def _dialog_control_stylesheet() -> str:
+    """Return the combined combo + checkbox stylesheet, built once per process."""
+    return apply_combo_styling() + apply_checkbox_styling()
+
+
+def apply_dialog_control_styling(parent_widget) -> None:
+    """Apply combo and checkbox styling to a widget tree with a single stylesheet.
+
+    The rules use type selectors, so setting them once on the parent styles every
+    QComboBox and QCheckBox beneath it (including ones added later) without walking
+    the tree and re-parsing a stylesheet per child.
+
+    Args:
+        parent_widget: Top-level widget (typically a dialog) to style.
+    """
+    parent_widget.setStyleSheet(parent_widget.styleSheet() + _dialog_control_stylesheet())
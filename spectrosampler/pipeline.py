@@ -690,6 +690,7 @@ def process_file(
             bandpass_low_hz=settings.export_bandpass_low_hz,
             bandpass_high_hz=settings.export_bandpass_high_hz,
             metadata=metadata,
+            source_duration=float(audio_info.get("duration", 0.0)),
         )
 
     # Spectrograms
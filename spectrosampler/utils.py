@@ -4,6 +4,7 @@ import hashlib
 import logging
 import time
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 
@@ -164,8 +165,13 @@ def _ensure_safe_stem(stem: str, limit: int) -> str:
     return candidate
 
 
+@lru_cache(maxsize=512)
 def sanitize_filename(name: str, max_length: int = 200) -> str:
-    """Sanitize a filename string for cross-platform filesystem compatibility."""
+    """Sanitize a filename string for cross-platform filesystem compatibility.
+
+    Results are memoized: the function is pure, and the export dialog re-sanitizes the
+    same titles and rendered names on every keystroke and preview refresh.
+    """
     if max_length < 1:
         raise ValueError("max_length must be >= 1")
 
@@ -161,6 +161,19 @@ def test_sanitize_filename():
     assert sanitized_unicode == "Café"
 
 
+def test_sanitize_filename_is_memoized():
+    """Repeated names should be served from the cache; invalid lengths still raise."""
+    sanitize_filename.cache_clear()
+    first = sanitize_filename("Lead Vox?")
+    assert sanitize_filename("Lead Vox?") is first
+    assert sanitize_filename.cache_info().hits == 1
+
+    with pytest.raises(ValueError):
+        sanitize_filename("name", max_length=0)
+    with pytest.raises(ValueError):
+        sanitize_filename("name", max_length=0)
+
+
 def test_cli_integration(test_audio_file: Path, test_output_dir: Path):
     """Integration test placeholder to ensure test audio generation and output structure exists."""
     assert test_audio_file.exists()
@@ -0,0 +1,212 @@
+"""Tests for the detection settings dialog."""
+
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from spectrosampler.gui.detection_dialog import DetectionDialog
+from spectrosampler.pipeline_settings import ProcessingSettings
+
+
+def _ensure_qapp() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_apply_settings_syncs_controls_without_firing_handlers(tmp_path, monkeypatch):
+    """apply_settings should update every control while leaving signals silenced."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = DetectionDialog()
+
+    calls = {"value": 0}
+
+    def fake_settings_changed() -> None:
+        calls["value"] += 1
+
+    monkeypatch.setattr(dialog, "_on_settings_changed", fake_settings_changed)
+
+    settings = ProcessingSettings(mode="voice", merge_gap_ms=420.0, nr=6.0, max_samples=77)
+    dialog.apply_settings(settings, emit_signal=False)
+
+    assert calls["value"] == 0
+    assert dialog._mode_combo.currentText() == "voice"
+    assert dialog._merge_gap_slider.slider.value() == 420
+    assert dialog._merge_gap_slider.spinbox.value() == 420
+    assert dialog._nr_slider.spinbox.value() == 6
+    assert dialog._max_samples_slider.slider.value() == 77
+    assert not dialog._merge_gap_slider.slider.signalsBlocked()
+    assert not dialog._max_samples_slider.spinbox.signalsBlocked()
+
+    dialog.deleteLater()
+    app.processEvents()
+
+
+def test_field_sliders_update_mapped_settings(tmp_path, monkeypatch):
+    """Each float slider should write its value to the matching settings field."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = DetectionDialog()
+
+    dialog._merge_gap_slider.slider.setValue(321)
+    dialog._hp_slider.spinbox.setValue(150)
+
+    settings = dialog.get_settings()
+    assert settings.merge_gap_ms == 321.0
+    assert settings.hp == 150.0
+
+    dialog.deleteLater()
+    app.processEvents()
+
+
+def test_slider_spin_pair_forwards_once_per_edit(tmp_path, monkeypatch):
+    """Slider and spinbox should stay in sync with one slider emission per edit."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = DetectionDialog()
+    pair = dialog._min_gap_slider
+
+    slider_emits: list[int] = []
+    spin_emits: list[int] = []
+    pair.slider.valueChanged.connect(slider_emits.append)
+    pair.spinbox.valueChanged.connect(spin_emits.append)
+
+    pair.slider.setValue(1234)
+    assert pair.spinbox.value() == 1234
+    assert slider_emits == [1234]
+    assert spin_emits == []
+
+    pair.spinbox.setValue(2345)
+    assert pair.slider.value() == 2345
+    assert slider_emits == [1234, 2345]
+    assert dialog.get_settings().min_gap_ms == 2345.0
+
+    dialog.deleteLater()
+    app.processEvents()
+
+
+def test_validation_is_debounced_and_memoized(tmp_path, monkeypatch):
+    """Rapid edits should validate once, and unchanged settings should not re-validate."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = DetectionDialog()
+    settings = dialog.get_settings()
+
+    calls = {"value": 0}
+    original_validate = settings.validate
+
+    def counting_validate():
+        calls["value"] += 1
+        return original_validate()
+
+    monkeypatch.setattr(settings, "validate", counting_validate)
+
+    for value in (3000, 4000, 5000):
+        dialog._min_dur_slider.slider.setValue(value)
+    dialog._max_dur_slider.slider.setValue(1000)
+    assert calls["value"] == 0
+    assert dialog._validate_timer.isActive()
+
+    dialog._validate_timer.timeout.emit()
+    assert calls["value"] == 1
+    assert not dialog._detect_button.isEnabled()
+
+    dialog._refresh_validation_state()
+    assert calls["value"] == 1
+
+    dialog.deleteLater()
+    app.processEvents()
+
+
+def test_combo_styling_is_applied_after_construction(tmp_path, monkeypatch):
+    """Widget styling should be deferred to the event loop rather than run in __init__."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = DetectionDialog()
+
+    assert "QComboBox" not in dialog.styleSheet()
+    app.processEvents()
+    assert "QComboBox::drop-down" in dialog.styleSheet()
+    assert "QCheckBox::indicator" in dialog.styleSheet()
+
+    dialog.deleteLater()
+    app.processEvents()
+
+
+def test_max_samples_skips_redundant_persistence(tmp_path, monkeypatch):
+    """Re-applying the current max-sample value should not rewrite QSettings."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = DetectionDialog()
+
+    writes: list[int] = []
+    monkeypatch.setattr(
+        dialog._settings_manager, "set_detection_max_samples", lambda value: writes.append(value)
+    )
+
+    dialog._set_max_samples_ui_value(500, persist=True)
+    dialog._set_max_samples_ui_value(500, persist=True)
+    dialog._set_max_samples_ui_value(20_000, persist=True)
+
+    assert writes == [500, 10_000]
+    assert dialog._max_samples_slider.spinbox.value() == 10_000
+
+    dialog.deleteLater()
+    app.processEvents()
+
+
+def test_max_samples_persists_on_release_and_editing_finished(tmp_path, monkeypatch):
+    """Slider drags and typed spinbox values should each write QSettings once, when done."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = DetectionDialog()
+    slider = dialog._max_samples_slider.slider
+
+    writes: list[int] = []
+    monkeypatch.setattr(
+        dialog._settings_manager, "set_detection_max_samples", lambda value: writes.append(value)
+    )
+
+    slider.setSliderDown(True)
+    for value in (300, 400, 500):
+        slider.setValue(value)
+    assert writes == []
+    assert dialog.get_settings().max_samples == 500
+
+    slider.setSliderDown(False)
+    assert writes == [500]
+
+    # Typing "5000" steps through 5, 50 and 500 before the edit is finished.
+    spinbox = dialog._max_samples_slider.spinbox
+    for value in (5, 50, 500, 5000):
+        spinbox.setValue(value)
+    assert writes == [500]
+    assert dialog.get_settings().max_samples == 5000
+
+    spinbox.editingFinished.emit()
+    assert writes == [500, 5000]
+
+    dialog.deleteLater()
+    app.processEvents()
+
+
+def test_behavior_combo_updates_overlap_preference(tmp_path, monkeypatch):
+    """Choosing a behavior label should store the matching behavior key."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = DetectionDialog()
+
+    dialog._overlap_behavior_combo.setCurrentText("Keep All")
+    assert dialog.get_settings().overlap_default_behavior == "keep_all"
+
+    dialog._on_behavior_changed("Unknown")
+    assert dialog.get_settings().overlap_default_behavior == "discard_duplicates"
+
+    dialog.deleteLater()
+    app.processEvents()
@@ -53,3 +53,17 @@ def test_bandpass_filter_preserves_shape_and_float_dtype() -> None:
 def test_bandpass_filter_rejects_invalid_cutoffs() -> None:
     with pytest.raises(ValueError):
         dsp.bandpass_filter(np.ones(1024), 8000, 2000.0, 1000.0)
+
+
+def test_bandpass_filter_reuses_cached_filter_design() -> None:
+    sample_rate = 16000
+    audio = np.random.randn(4096)
+    dsp._design_butter_sos.cache_clear()
+
+    first = dsp.bandpass_filter(audio, sample_rate, 300.0, 3000.0)
+    second = dsp.bandpass_filter(audio, sample_rate, 300.0, 3000.0)
+
+    info = dsp._design_butter_sos.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    np.testing.assert_allclose(first, second)
@@ -0,0 +1,198 @@
+"""Tests for the export dialog's preview pipeline and settings commits."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pytest
+import soundfile as sf
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from spectrosampler.detectors.base import Segment
+from spectrosampler.gui import export_dialog
+from spectrosampler.gui.export_dialog import ExportDialog, _Dirty
+from spectrosampler.gui.export_models import BandpassMode
+
+
+def _ensure_qapp() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _make_dialog(tmp_path: Path) -> ExportDialog:
+    sample_rate = 16000
+    t = np.arange(sample_rate * 4) / sample_rate
+    audio_path = tmp_path / "source.wav"
+    sf.write(audio_path, (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32), sample_rate)
+    segments = [Segment(start=0.5 + i, end=1.0 + i, detector="energy", score=1.0) for i in range(3)]
+    return ExportDialog(segments=segments, audio_path=audio_path)
+
+
+def _close(dialog: ExportDialog, app: QApplication) -> None:
+    dialog._stop_preview_jobs()
+    dialog.deleteLater()
+    app.processEvents()
+
+
+def _image() -> QImage:
+    image = QImage(4, 4, QImage.Format.Format_RGB32)
+    image.fill(0)
+    return image
+
+
+def test_stale_preview_results_are_cached_but_not_shown(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A render for an older generation should be cached for its inputs, never displayed."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = _make_dialog(tmp_path)
+    shown: list[object] = []
+    placeholders: list[bool] = []
+    monkeypatch.setattr(dialog, "_show_preview_pixmaps", lambda *pixmaps: shown.append(pixmaps))
+    monkeypatch.setattr(dialog, "_show_preview_placeholders", lambda: placeholders.append(True))
+
+    stale = dialog._preview_generation
+    dialog._preview_generation += 1
+    dialog._on_preview_rendered(stale, ("stale",), (_image(), _image()))
+    dialog._on_preview_rendered(stale, ("failed",), None)
+
+    assert shown == []
+    assert placeholders == []
+    assert ("stale",) in dialog._preview_cache
+
+    dialog._on_preview_rendered(dialog._preview_generation, ("current",), (_image(), _image()))
+    assert len(shown) == 1
+
+    # A job superseded while queued skips the audio read entirely.
+    monkeypatch.setattr(dialog, "_read_audio_window", lambda *_args: pytest.fail("read"))
+    segment = dialog._current_segment()
+    effective = dialog._effective_settings(dialog._current_sample_id())
+    assert dialog._render_preview_images(stale, segment, effective) is None
+
+    _close(dialog, app)
+
+
+def test_revisiting_a_preview_is_served_from_the_lru_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unchanged inputs should reuse cached pixmaps, and the oldest entry is evicted first."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = _make_dialog(tmp_path)
+
+    dialog._refresh_sample_preview()
+    dialog._preview_pool.waitForDone()
+    app.processEvents()
+    assert len(dialog._preview_cache) == 1
+    first_key = next(iter(dialog._preview_cache))
+    assert not dialog._waveform_label.pixmap().isNull()
+
+    renders: list[int] = []
+    monkeypatch.setattr(
+        dialog, "_render_preview_images", lambda generation, *_args: renders.append(generation)
+    )
+    dialog._refresh_sample_preview()
+    dialog._preview_pool.waitForDone()
+    app.processEvents()
+    assert renders == []
+
+    monkeypatch.setattr(export_dialog, "PREVIEW_CACHE_SIZE", 2)
+    generation = dialog._preview_generation
+    dialog._on_preview_rendered(generation, ("second",), (_image(), _image()))
+    dialog._refresh_sample_preview()  # Cache hit moves the first entry to the back.
+    dialog._on_preview_rendered(dialog._preview_generation, ("third",), (_image(), _image()))
+    assert list(dialog._preview_cache) == [first_key, ("third",)]
+
+    _close(dialog, app)
+
+
+def test_dirty_flags_drain_once_per_burst(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated invalidations should coalesce into one filename and one preview refresh."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = _make_dialog(tmp_path)
+    app.processEvents()
+    calls: list[str] = []
+    monkeypatch.setattr(dialog, "_refresh_current_filename_preview", lambda: calls.append("name"))
+    monkeypatch.setattr(dialog, "_schedule_preview_refresh", lambda: calls.append("preview"))
+
+    dialog._mark_dirty(_Dirty.FILENAME)
+    dialog._mark_dirty(_Dirty.PREVIEW)
+    dialog._mark_dirty(_Dirty.FILENAME | _Dirty.PREVIEW)
+    assert calls == []
+    assert dialog._dirty_timer.isActive()
+
+    dialog._drain_dirty()
+    assert calls == ["name", "preview"]
+    assert dialog._dirty == _Dirty(0)
+    assert not dialog._dirty_timer.isActive()
+
+    dialog._drain_dirty()
+    assert calls == ["name", "preview"]
+
+    _close(dialog, app)
+
+
+def test_bandpass_fields_commit_typed_and_cleared_values(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Finished edits commit the cutoff, and clearing a field disables that edge."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = _make_dialog(tmp_path)
+
+    dialog._bandpass_enable_checkbox.setChecked(True)
+    dialog._bandpass_low_edit.setText("150")
+    dialog._bandpass_high_edit.setText("9000")
+    dialog._bandpass_low_edit.editingFinished.emit()
+    settings = dialog.batch_settings()
+    assert (settings.bandpass_low_hz, settings.bandpass_high_hz) == (150.0, 9000.0)
+    dialog._bandpass_low_edit.setText("")
+    assert dialog.batch_settings().bandpass_low_hz is None
+    assert dialog.batch_settings().bandpass_high_hz == 9000.0
+
+    sample_id = dialog._current_sample_id()
+    dialog._override_bandpass_combo.setCurrentIndex(BandpassMode.ENABLED)
+    dialog._override_bandpass_low.setText("300")
+    dialog._override_bandpass_low.editingFinished.emit()
+    assert dialog._overrides_by_id[sample_id].bandpass_low_hz == 300.0
+    dialog._override_bandpass_low.setText("")
+    assert dialog._overrides_by_id[sample_id].bandpass_low_hz is None
+
+    _close(dialog, app)
+
+
+def test_effective_settings_are_cached_until_an_edit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Resolved settings are reused per sample and dropped when batch or override values change."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    app = _ensure_qapp()
+    dialog = _make_dialog(tmp_path)
+    sample_id = dialog._current_sample_id()
+    other_id = dialog._sample_ids[1]
+
+    first = dialog._effective_settings(sample_id)
+    assert dialog._effective_settings(sample_id) is first
+
+    dialog._pre_pad_spin.setValue(first.pre_pad_ms + 25.0)
+    padded = dialog._effective_settings(sample_id)
+    assert padded.pre_pad_ms == first.pre_pad_ms + 25.0
+
+    other = dialog._effective_settings(other_id)
+    dialog._set_override_field(sample_id, "normalize", not padded.normalize)
+    assert dialog._effective_settings(sample_id).normalize is not padded.normalize
+    assert dialog._effective_settings(other_id) is other
+
+    dialog._format_checkboxes["flac"].setChecked(True)
+    assert "flac" in dialog._effective_settings(other_id).formats
+
+    _close(dialog, app)
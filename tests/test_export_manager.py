@@ -0,0 +1,205 @@
+"""Tests for the export worker scheduling."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from spectrosampler.detectors.base import Segment
+from spectrosampler.gui import export_manager
+from spectrosampler.gui.export_manager import ExportManager
+from spectrosampler.gui.export_models import ExportBatchSettings
+
+
+def _segments(count: int) -> list[Segment]:
+    return [
+        Segment(start=float(i), end=float(i) + 0.5, detector="energy", score=1.0)
+        for i in range(count)
+    ]
+
+
+def _manager(tmp_path: Path, count: int, max_workers: int) -> ExportManager:
+    return ExportManager(
+        audio_path=tmp_path / "source.wav",
+        segments=_segments(count),
+        batch_settings=ExportBatchSettings(formats=["wav"]),
+        output_dir=tmp_path / "out",
+        max_workers=max_workers,
+    )
+
+
+def _worker(tmp_path: Path, count: int, max_workers: int) -> export_manager.ExportWorker:
+    return export_manager.ExportWorker(
+        audio_path=tmp_path / "source.wav",
+        base_name="source",
+        output_dir=tmp_path / "out",
+        batch_settings=ExportBatchSettings(formats=["wav"]),
+        tasks=_manager(tmp_path, count, max_workers)._prepare_tasks(None),
+        max_workers=max_workers,
+    )
+
+
+def test_blocking_export_runs_samples_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Independent samples should overlap on the worker pool and all be reported."""
+
+    barrier = threading.Barrier(3, timeout=5)
+    written: list[Path] = []
+
+    def fake_export_sample(*, output_path: Path, **_kwargs: object) -> None:
+        # Fails with BrokenBarrierError unless three exports are in flight together.
+        barrier.wait()
+        written.append(output_path)
+
+    monkeypatch.setattr(export_manager, "export_sample", fake_export_sample)
+
+    summary = _manager(tmp_path, count=6, max_workers=3).execute_blocking()
+
+    assert summary.successful_count == 6
+    assert not summary.failed
+    assert not summary.remaining_sample_ids
+    assert len(set(written)) == 6
+    assert set(summary.resume_state.values()) == {"completed"}
+
+
+def test_cancel_stops_new_samples_and_reports_the_rest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cancelling mid-batch should let running samples finish and leave the rest pending."""
+
+    manager = _manager(tmp_path, count=5, max_workers=2)
+    workers: list[export_manager.ExportWorker] = []
+    original_worker = export_manager.ExportWorker
+
+    def capture_worker(**kwargs: object) -> export_manager.ExportWorker:
+        worker = original_worker(**kwargs)
+        workers.append(worker)
+        return worker
+
+    # Cancel once both workers are busy, before either sample can finish.
+    barrier = threading.Barrier(2, action=lambda: workers[0].cancel(), timeout=5)
+
+    def fake_export_sample(**_kwargs: object) -> None:
+        barrier.wait()
+
+    monkeypatch.setattr(export_manager, "ExportWorker", capture_worker)
+    monkeypatch.setattr(export_manager, "export_sample", fake_export_sample)
+
+    summary = manager.execute_blocking()
+
+    assert summary.cancelled
+    assert summary.successful_count == 2
+    assert len(summary.remaining_sample_ids) == 3
+    assert all(summary.resume_state[sid] == "pending" for sid in summary.remaining_sample_ids)
+
+
+def test_progress_is_throttled_but_always_reaches_the_end(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Fast batches should coalesce progress signals while still reporting completion."""
+
+    monkeypatch.setattr(export_manager, "export_sample", lambda **_kwargs: None)
+    worker = _worker(tmp_path, count=40, max_workers=2)
+    finished: list[object] = []
+    progress: list[tuple[float, int, int]] = []
+    worker.sample_finished.connect(finished.append)
+    worker.progress.connect(lambda *args: progress.append(args))
+
+    worker.run_blocking()
+
+    assert len(finished) == 40
+    assert 1 <= len(progress) < 40
+    assert progress[-1] == (1.0, 40, 40)
+
+
+def test_paused_worker_waits_until_resumed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A paused worker should start nothing until resume() wakes it."""
+
+    started = threading.Event()
+
+    def fake_export_sample(**_kwargs: object) -> None:
+        started.set()
+
+    monkeypatch.setattr(export_manager, "export_sample", fake_export_sample)
+    worker = _worker(tmp_path, count=3, max_workers=2)
+    worker.pause()
+    summaries: list[export_manager.ExportSummary] = []
+    runner = threading.Thread(target=lambda: summaries.append(worker.run_blocking()))
+    runner.start()
+
+    assert not started.wait(0.2)
+    worker.resume()
+    runner.join(timeout=5)
+
+    assert not runner.is_alive()
+    assert summaries[0].successful_count == 3
+
+
+def test_source_is_probed_once_per_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every exported file should reuse one ffprobe result instead of probing again."""
+
+    probes: list[Path] = []
+    durations: list[object] = []
+
+    def fake_get_audio_info(path: Path) -> dict[str, float]:
+        probes.append(path)
+        return {"duration": 42.0}
+
+    def fake_export_sample(*, source_duration: object = None, **_kwargs: object) -> None:
+        durations.append(source_duration)
+
+    monkeypatch.setattr(export_manager, "get_audio_info", fake_get_audio_info)
+    monkeypatch.setattr(export_manager, "export_sample", fake_export_sample)
+    manager = ExportManager(
+        audio_path=tmp_path / "source.wav",
+        segments=_segments(3),
+        batch_settings=ExportBatchSettings(formats=["wav", "flac"]),
+        output_dir=tmp_path / "out",
+        max_workers=2,
+    )
+
+    manager.execute_blocking()
+
+    assert probes == [tmp_path / "source.wav"]
+    assert durations == [42.0] * 6
+
+
+def test_samples_rendering_the_same_path_never_write_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A colliding template should serialize those samples so the last one still wins."""
+
+    lock = threading.Lock()
+    active: set[Path] = set()
+    overlaps: list[Path] = []
+    writes: list[tuple[Path, float]] = []
+
+    def fake_export_sample(*, output_path: Path, segment: Segment, **_kwargs: object) -> None:
+        with lock:
+            if output_path in active:
+                overlaps.append(output_path)
+            active.add(output_path)
+        time.sleep(0.02)
+        with lock:
+            active.discard(output_path)
+            writes.append((output_path, segment.start))
+
+    monkeypatch.setattr(export_manager, "export_sample", fake_export_sample)
+    manager = ExportManager(
+        audio_path=tmp_path / "source.wav",
+        segments=_segments(4),
+        batch_settings=ExportBatchSettings(formats=["wav"], filename_template="{basename}"),
+        output_dir=tmp_path / "out",
+        max_workers=4,
+    )
+
+    summary = manager.execute_blocking()
+
+    assert summary.successful_count == 4
+    assert not overlaps
+    assert [path.name for path, _start in writes] == ["source.wav"] * 4
+    assert [start for _path, start in writes] == [0.0, 1.0, 2.0, 3.0]
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import pytest
+
 from spectrosampler.detectors.base import Segment
 from spectrosampler.gui.export_models import (
+    BANDPASS_DISABLED_HZ,
     DEFAULT_FILENAME_TEMPLATE,
+    PADDING_TEMPLATE_TOKENS,
+    BandpassMode,
+    ExportBatchSettings,
+    ExportSampleOverride,
+    _compile_template,
+    _SafeDict,
     apply_template,
     build_template_context,
     derive_sample_title,
     render_filename_from_template,
+    resolve_sample_settings,
+    template_fields,
 )
+from spectrosampler.utils import sanitize_filename
 
 
 def test_render_filename_supports_new_tokens() -> None:
@@ -77,6 +89,11 @@ def test_template_context_exposes_metadata_and_sample_fields() -> None:
     assert context["detector"] == "flux"
     # Attribute tokens should be namespaced with attr_ prefix.
     assert context["attr_take"] == 7
+    assert "attr_enabled" in context and "attr_name" not in context
+    # Tokens are computed lazily, but the context still behaves like a complete mapping.
+    materialized = dict(context)
+    assert len(materialized) == len(context)
+    assert materialized["start_ms"] == 900 and materialized["attr_take"] == 7
 
     rendered_notes = apply_template(
         "Title={title}; Artist={artist}; Start={start}; Detector={detector}; Enabled={enabled}",
@@ -110,3 +127,152 @@ def test_template_context_exposes_metadata_and_sample_fields() -> None:
     # With 0-based indexing, id="0000", and padded times: start=0.900, duration=0.650
     # Default template is "{id}_{title}_start-{start}s_duration-{duration}s"
     assert default_name.startswith("0000_sample_start-0.900s_duration-0.650s")
+
+
+def test_template_fields_reports_referenced_tokens() -> None:
+    """template_fields should list top-level token names, ignoring specs and malformed input."""
+
+    assert template_fields(DEFAULT_FILENAME_TEMPLATE) == {"id", "title", "start", "duration"}
+    assert template_fields("{title:>10}_{attr_take!s}") == {"title", "attr_take"}
+    assert template_fields("{title}_{unclosed") == frozenset()
+
+    assert template_fields(DEFAULT_FILENAME_TEMPLATE) & PADDING_TEMPLATE_TOKENS
+    assert not template_fields("{id}_{title}_{format}") & PADDING_TEMPLATE_TOKENS
+
+
+def test_apply_template_matches_format_map() -> None:
+    """Compiled templates should render exactly like ``str.format_map`` with safe lookups."""
+
+    context = {"title": "Kick", "index": 7, "score": 0.5, "normalize": True}
+    cases = [
+        "{title}_{index:03d}_{score:.2f}",
+        "{{literal}}_{title!r}_{normalize:>6}",
+        "{missing}_{missing:>10}",
+        "{title[0]}",
+    ]
+    for template in cases:
+        assert apply_template(template, context) == template.format_map(_SafeDict(context))
+
+    for template in ("{", "{0}", "{index:s}"):
+        with pytest.raises(ValueError):
+            apply_template(template, context)
+
+
+def test_presanitized_templates_skip_sanitize_without_changing_names() -> None:
+    """Numeric-only templates may bypass ``sanitize_filename`` but must render identically."""
+
+    assert not _compile_template("sample_{id}_{start_ms}-{duration}").needs_sanitize
+    for template in ("{title}_{id}", "{id}.{start}", "{id:>8}", "{id!r}", "{{id}}"):
+        assert _compile_template(template).needs_sanitize
+
+    segment = Segment(start=1.25, end=2.5, detector="energy", score=1.0)
+    for template in ("sample_{id}_{start_ms}-{duration}", "COM{index}", "x" * 240 + "{id}"):
+        rendered = render_filename_from_template(
+            template=template,
+            base_name="take",
+            sample_id="a",
+            index=0,
+            total=1,
+            segment=segment,
+            fmt="wav",
+            normalized=False,
+        )
+        assert rendered == sanitize_filename(rendered)
+        assert rendered.split(".", 1)[0].upper() != "COM1"
+        assert len(rendered) <= 200
+
+
+def test_default_template_fast_path_matches_generic_rendering() -> None:
+    """The stock template shortcut should produce the same names as the template engine."""
+
+    generic = DEFAULT_FILENAME_TEMPLATE.replace("{id}", "{id!s}")
+    segment = Segment(start=0.004, end=2.5, detector="energy", score=1.0, attrs={"name": "Bird?"})
+    for title in (None, "Lead Vox: take 2", "CON"):
+        kwargs = {
+            "base_name": "take",
+            "sample_id": "a",
+            "index": 7,
+            "total": 9,
+            "segment": segment,
+            "fmt": "wav",
+            "normalized": False,
+            "pre_pad_ms": 12.5,
+            "post_pad_ms": 3.0,
+            "title": title,
+        }
+        assert render_filename_from_template(
+            template=DEFAULT_FILENAME_TEMPLATE, **kwargs
+        ) == render_filename_from_template(template=generic, **kwargs)
+
+
+def test_override_is_empty_treats_only_unset_values_as_empty() -> None:
+    """Blank strings and lists are unset; falsy numbers and ``False`` are real overrides."""
+
+    assert ExportSampleOverride(sample_id="a").is_empty()
+    assert ExportSampleOverride(sample_id="a", formats=[], title="", bit_depth="").is_empty()
+    assert not ExportSampleOverride(sample_id="a", normalize=False).is_empty()
+    assert not ExportSampleOverride(sample_id="a", pre_pad_ms=0.0).is_empty()
+    assert not ExportSampleOverride(sample_id="a", notes="keep").is_empty()
+
+
+def test_resolve_sample_settings_layers_override_over_batch() -> None:
+    """Set override fields win, unset ones fall back to the batch value."""
+
+    batch = ExportBatchSettings(
+        formats=["wav", "mp3"],
+        pre_pad_ms=10.0,
+        bandpass_low_hz=100.0,
+        artist="Batch",
+        year=2020,
+        notes="batch notes",
+    )
+    assert resolve_sample_settings(batch, None).formats == ("wav", "mp3")
+    assert resolve_sample_settings(batch, None).title is None
+    defaults = ("wav", "mp3")
+    assert resolve_sample_settings(batch, None, defaults).formats is defaults
+
+    override = ExportSampleOverride(
+        sample_id="a",
+        formats=["FLAC", "flac"],
+        post_pad_ms=0.0,
+        normalize=False,
+        bandpass_low_hz=BANDPASS_DISABLED_HZ,
+        bandpass_high_hz=BANDPASS_DISABLED_HZ,
+        title="Kick",
+        artist="",
+    )
+    effective = resolve_sample_settings(batch, override)
+
+    assert effective.formats == ("flac",)
+    assert (effective.pre_pad_ms, effective.post_pad_ms) == (10.0, 0.0)
+    assert effective.normalize is False
+    assert (effective.bandpass_low_hz, effective.bandpass_high_hz) == (None, None)
+    assert (effective.title, effective.artist, effective.year) == ("Kick", "Batch", 2020)
+    assert effective.notes == "batch notes"
+
+
+def test_override_bandpass_mode_and_resolution() -> None:
+    """The disabled marker should classify as DISABLED and resolve to no filter edges."""
+
+    assert ExportSampleOverride(sample_id="a").bandpass_mode is BandpassMode.GLOBAL
+    assert (
+        ExportSampleOverride(sample_id="a", bandpass_low_hz=80.0).bandpass_mode
+        is BandpassMode.GLOBAL
+    )
+
+    enabled = ExportSampleOverride(sample_id="a", bandpass_low_hz=80.0, bandpass_high_hz=9000.0)
+    assert enabled.bandpass_mode is BandpassMode.ENABLED
+    assert enabled.resolve_bandpass(20.0, 20000.0) == (80.0, 9000.0)
+
+    disabled = ExportSampleOverride(
+        sample_id="a",
+        bandpass_low_hz=BANDPASS_DISABLED_HZ,
+        bandpass_high_hz=BANDPASS_DISABLED_HZ,
+    )
+    assert disabled.bandpass_mode is BandpassMode.DISABLED
+    assert disabled.resolve_bandpass(20.0, 20000.0) == (None, None)
+    # The marker survives a project round trip unchanged.
+    assert ExportSampleOverride.from_dict(disabled.to_dict()).bandpass_mode is BandpassMode.DISABLED
+
+    partial = ExportSampleOverride(sample_id="a", bandpass_high_hz=5000.0)
+    assert partial.resolve_bandpass(20.0, None) == (20.0, 5000.0)
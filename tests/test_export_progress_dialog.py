@@ -0,0 +1,59 @@
+"""Tests for the export progress dialog."""
+
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from spectrosampler.gui.export_manager import ExportSampleResult, ExportSummary
+from spectrosampler.gui.export_progress_dialog import ExportProgressDialog
+
+
+def _ensure_qapp() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_log_lines_are_batched_and_flushed_on_completion() -> None:
+    """Per-sample log lines should reach the text area together, and all by completion."""
+    app = _ensure_qapp()
+    dialog = ExportProgressDialog()
+
+    for index in range(5):
+        dialog._on_sample_finished(
+            ExportSampleResult(sample_id=f"s{index}", index=index, success=True, formats=["wav"])
+        )
+    assert dialog._log_area.toPlainText() == ""
+
+    dialog._on_completed(ExportSummary(total_samples=5))
+
+    lines = dialog._log_area.toPlainText().splitlines()
+    assert len(lines) == 6
+    assert lines[0].startswith("✔ Sample 1 (s0)")
+    assert lines[-1] == "Export finished."
+
+    dialog.deleteLater()
+    app.processEvents()
+
+
+def test_progress_updates_widgets_only_when_values_change(monkeypatch) -> None:
+    """Repeated progress signals with the same values should not touch the widgets again."""
+    app = _ensure_qapp()
+    dialog = ExportProgressDialog()
+    texts: list[str] = []
+    monkeypatch.setattr(dialog._status_label, "setText", texts.append)
+
+    dialog._on_progress(0.5, 5, 10)
+    dialog._on_progress(0.5, 5, 10)
+    dialog._on_progress(0.6, 6, 10)
+
+    assert dialog._progress_bar.value() == 60
+    assert texts == ["Exported 5 of 10 sample(s)", "Exported 6 of 10 sample(s)"]
+
+    dialog.deleteLater()
+    app.processEvents()
@@ -0,0 +1,42 @@
+"""Tests for shared UI styling helpers."""
+
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QCheckBox, QComboBox, QVBoxLayout, QWidget
+
+from spectrosampler.gui.ui_utils import apply_dialog_control_styling
+
+
+def _ensure_qapp() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_dialog_control_styling_sets_one_parent_stylesheet():
+    """Combo and checkbox rules should live on the parent, not on each child."""
+    app = _ensure_qapp()
+    parent = QWidget()
+    parent.setStyleSheet("QLabel { color: red; }")
+    layout = QVBoxLayout(parent)
+    combo = QComboBox()
+    checkbox = QCheckBox("Normalize")
+    layout.addWidget(combo)
+    layout.addWidget(checkbox)
+
+    apply_dialog_control_styling(parent)
+
+    sheet = parent.styleSheet()
+    assert sheet.startswith("QLabel { color: red; }")
+    assert "QComboBox::drop-down" in sheet
+    assert "QCheckBox::indicator" in sheet
+    assert combo.styleSheet() == ""
+    assert checkbox.styleSheet() == ""
+
+    parent.deleteLater()
+    app.processEvents()